@@ -0,0 +1,98 @@
+"""Shared HTTP connection pool for the OpenAI-compatible LLM clients.
+
+Every agent builds its own ChatOpenAI instance; handing them one httpx client
+means all agents (OpenAI and DeepSeek alike) reuse the same keep-alive
+connections instead of each negotiating TLS on its first request. HTTP/2 is
+used when the optional ``h2`` package is installed, multiplexing concurrent
+requests over a single connection per host.
+
+Pooled connections are bound to the event loop that opened them, while LLM
+instances are created (and cached) outside any loop. The client therefore
+stays the same object for the life of the process and its transport keeps one
+pool per running loop, like the aiohttp session in
+``market_intelligence/_http.py``.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+
+try:
+    import h2  # noqa: F401
+
+    _HAS_H2 = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_H2 = False
+
+
+LLM_MAX_CONNECTIONS = 100  # Concurrent connections across all LLM hosts
+LLM_MAX_KEEPALIVE = 50  # Idle connections kept open for reuse
+
+
+class _LoopBoundTransport(httpx.AsyncBaseTransport):
+    """Transport that opens a new connection pool whenever the running loop changes."""
+
+    def __init__(self):
+        """Initialize without a pool; the first request opens one."""
+        self._pool: Optional[httpx.AsyncHTTPTransport] = None
+        self._pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_pool(self) -> httpx.AsyncHTTPTransport:
+        """Return the pool for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._pool is None or self._pool_loop is not loop:
+            # A previous loop's connections cannot be used (or closed) from this one
+            self._pool = httpx.AsyncHTTPTransport(
+                http2=_HAS_H2,
+                limits=httpx.Limits(
+                    max_connections=LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_MAX_KEEPALIVE,
+                ),
+            )
+            self._pool_loop = loop
+        return self._pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request through the running loop's pool."""
+        return await self._get_pool().handle_async_request(request)
+
+    async def aclose(self):
+        """Close the current pool; the next request opens a new one."""
+        pool, pool_loop = self._pool, self._pool_loop
+        self._pool = self._pool_loop = None
+        # Connections opened on another (possibly closed) loop are just dropped
+        if pool is not None and pool_loop is asyncio.get_running_loop():
+            await pool.aclose()
+
+
+_transport = _LoopBoundTransport()
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client, creating it on first use.
+
+    Safe to call outside a running event loop. Request timeouts are left to
+    the OpenAI SDK, which sets them per request.
+
+    Returns:
+        Shared httpx AsyncClient
+    """
+    global _client
+
+    if _client is None:
+        _client = httpx.AsyncClient(transport=_transport)
+    return _client
+
+
+async def close_llm_http_client():
+    """
+    Close the pooled connections of the running event loop.
+
+    The client itself stays open, since cached LLM instances hold it; the
+    next request opens a fresh pool.
+    """
+    await _transport.aclose()
@@ -5,16 +5,38 @@ This module defines the abstract base class that all agents inherit from.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Any, Optional, Union
+from typing import Any, Optional, TypeVar, Union
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
+from pydantic import BaseModel
 
 from ..config import settings
 from ..data.schemas import AgentReport, AgentRole
+from ..utils import (
+    IncrementalJsonParser,
+    JSONDecodeError,
+    TTLCache,
+    get_logger,
+    hash_key,
+)
+from ._http import get_llm_http_client
+
+
+logger = get_logger(__name__)
+
+
+# Identical-prompt memoization (settings.llm_response_cache)
+LLM_RESPONSE_CACHE_SIZE = 2048  # Responses kept across all agents
+LLM_RESPONSE_CACHE_TTL = 300.0  # Seconds a cached response is reused
+
+_RESPONSE_CACHE = TTLCache(maxsize=LLM_RESPONSE_CACHE_SIZE, ttl=LLM_RESPONSE_CACHE_TTL)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 def create_llm(
@@ -38,6 +60,7 @@ def create_llm(
 
     Note:
         For DeepSeek provider, uses OpenAI SDK with custom base_url.
+        OpenAI-compatible clients share one async connection pool (see _http).
         SECURITY: Do NOT install 'deepseek' or 'deepseeek' packages from PyPI.
     """
     llm_provider = provider or settings.llm_provider
@@ -51,6 +74,7 @@ def create_llm(
             model=model_name,
             temperature=temperature,
             openai_api_key=settings.openai_api_key,
+            http_async_client=get_llm_http_client(),
         )
     elif llm_provider == "anthropic":
         # Use provided model or default to standard model
@@ -79,11 +103,48 @@ def create_llm(
             temperature=temperature,
             openai_api_key=settings.deepseek_api_key,
             openai_api_base=settings.deepseek_base_url,
+            http_async_client=get_llm_http_client(),
         )
     else:
         raise ValueError(f"Unsupported LLM provider: {llm_provider}")
 
 
+async def read_json_stream(
+    stream: AsyncIterator[str],
+) -> tuple[str, Optional[dict[str, Any]]]:
+    """
+    Consume a text stream, decoding its JSON object as the chunks arrive.
+
+    The stream is closed as soon as the object's closing brace arrives, so
+    any closing fence or trailing prose is never generated.
+
+    Args:
+        stream: Async generator of response text chunks
+
+    Returns:
+        Tuple of (text received, decoded JSON object or None if the stream
+        did not contain a complete, valid object)
+    """
+    parser = IncrementalJsonParser()
+    chunks = []
+    try:
+        async for chunk in stream:
+            chunks.append(chunk)
+            if parser is None:
+                continue
+            try:
+                parser.feed(chunk)
+            except JSONDecodeError:
+                parser = None  # Leave it to the buffered parse of the full text
+                continue
+            if parser.complete:
+                break
+    finally:
+        await stream.aclose()
+
+    return "".join(chunks), parser.result() if parser is not None else None
+
+
 class BaseAgent(ABC):
     """
     Abstract base class for all agents in the system.
@@ -122,10 +183,14 @@ class BaseAgent(ABC):
             provider=self.provider,
         )
 
-        # Create prompt template
+        # Schema-bound views of self.llm, built on first use per reply model
+        self._structured_llms: dict[type[BaseModel], Any] = {}
+
+        # Create prompt template; the system prompt is passed as a message so
+        # JSON examples in it are not parsed as template variables
         self.prompt_template = ChatPromptTemplate.from_messages(
             [
-                ("system", system_prompt),
+                SystemMessage(content=system_prompt),
                 ("human", "{input}"),
             ]
         )
@@ -155,13 +220,156 @@ class BaseAgent(ABC):
         Returns:
             str: Generated response
         """
+        # Only a real True opts in (settings are often mocked in tests)
+        cache_key = None
+        if settings.llm_response_cache is True:
+            cache_key = hash_key(*self._llm_key(), self.system_prompt, input_text)
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
         messages = [
-            SystemMessage(content=self.system_prompt),
+            self._system_message(),
             HumanMessage(content=input_text),
         ]
 
         response = await self.llm.ainvoke(messages)
-        return response.content
+        content = response.content
+
+        if cache_key is not None:
+            _RESPONSE_CACHE[cache_key] = content
+        return content
+
+    async def _generate_structured(self, input_text: str, schema: type[ModelT]) -> ModelT:
+        """
+        Generate a response constrained to a Pydantic schema.
+
+        The provider enforces the schema while decoding (JSON schema output for
+        OpenAI, tool calling for Anthropic and DeepSeek), so the reply needs no
+        markdown or JSON extraction. With settings.llm_response_cache enabled,
+        an identical prompt for the same schema reuses the earlier reply.
+
+        Args:
+            input_text: The input prompt text
+            schema: Pydantic model describing the reply
+
+        Returns:
+            The reply parsed into schema
+
+        Raises:
+            ValueError: If the reply does not match the schema
+        """
+        cache_key = None
+        if settings.llm_response_cache is True:
+            cache_key = hash_key(
+                *self._llm_key(), self.system_prompt, schema.__qualname__, input_text
+            )
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                # Callers may adjust the reply; the cached one stays untouched
+                return cached.model_copy(deep=True)
+
+        structured = self._structured_llms.get(schema)
+        if structured is None:
+            method = "json_schema" if self.provider == "openai" else "function_calling"
+            structured = self.llm.with_structured_output(schema, method=method)
+            self._structured_llms[schema] = structured
+
+        messages = [
+            self._system_message(),
+            HumanMessage(content=input_text),
+        ]
+        reply = await structured.ainvoke(messages)
+
+        if cache_key is not None:
+            _RESPONSE_CACHE[cache_key] = reply.model_copy(deep=True)
+        return reply
+
+    async def _stream_response(self, input_text: str) -> AsyncIterator[str]:
+        """
+        Stream a response from the LLM as it is generated.
+
+        Args:
+            input_text: The input prompt text
+
+        Yields:
+            str: Successive pieces of the response text
+        """
+        messages = [
+            self._system_message(),
+            HumanMessage(content=input_text),
+        ]
+
+        async for chunk in self.llm.astream(messages):
+            if chunk.content:
+                yield chunk.content
+
+    async def _stream_json(self, input_text: str) -> tuple[str, Optional[dict[str, Any]]]:
+        """
+        Stream the LLM response, decoding its JSON fields as they arrive.
+
+        The stream is closed as soon as the object's closing brace arrives, so
+        any closing fence or trailing prose is never generated.
+
+        Args:
+            input_text: The input prompt text
+
+        Returns:
+            Tuple of (response text, decoded JSON object or None if the
+            stream did not contain a complete, valid object)
+        """
+        return await read_json_stream(self._stream_response(input_text))
+
+    async def _generate_json(
+        self, input_text: str, stream: bool = False
+    ) -> tuple[str, Optional[dict[str, Any]]]:
+        """
+        Generate a JSON reply, optionally decoding it while it streams.
+
+        Args:
+            input_text: The input prompt text
+            stream: Stream and decode incrementally; falls back to a buffered
+                call if streaming fails
+
+        Returns:
+            Tuple of (response text, decoded JSON object or None if the
+            caller still has to parse the text)
+        """
+        if stream:
+            try:
+                return await self._stream_json(input_text)
+            except Exception as e:
+                logger.warning("Streaming failed, using buffered response", error=str(e))
+        return await self._generate_response(input_text), None
+
+    def _system_message(self) -> SystemMessage:
+        """
+        Build the system message, marking it for provider-side prompt caching.
+
+        OpenAI and DeepSeek reuse a repeated prompt prefix automatically;
+        Anthropic only caches content blocks flagged with cache_control.
+        Agents keep their static instructions in the system prompt so that
+        prefix is identical on every call.
+
+        Returns:
+            SystemMessage carrying the agent's system prompt
+        """
+        if self.provider == "anthropic":
+            return SystemMessage(
+                content=[
+                    {
+                        "type": "text",
+                        "text": self.system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            )
+        return SystemMessage(content=self.system_prompt)
+
+    def _llm_key(self) -> tuple[str, str, float]:
+        """Provider, model and temperature identifying this agent's LLM."""
+        model_name = getattr(self.llm, "model_name", None) or getattr(self.llm, "model", "")
+        return (self.provider, model_name, self.temperature)
 
     def get_metadata(self) -> dict[str, Any]:
         """
@@ -197,12 +405,15 @@ class CriticalAgent(BaseAgent):
         system_prompt: str,
         temperature: float = 0.7,
         provider: Optional[str] = None,
+        model_name: Optional[str] = None,
     ):
-        """Initialize critical agent with premium model."""
+        """Initialize critical agent with premium model unless model_name overrides it."""
         llm_provider = provider or settings.llm_provider
 
         # Select premium model based on provider
-        if llm_provider == "openai":
+        if model_name is not None:
+            premium_model = model_name
+        elif llm_provider == "openai":
             premium_model = settings.premium_model
         else:  # anthropic
             premium_model = settings.anthropic_premium_model
@@ -1,5 +1,6 @@
 """Execution Team - Equity Trader."""
 
+import asyncio
 import json
 from typing import Any
 
@@ -35,7 +36,7 @@ class EquityTrader(BaseAgent):
             system_prompt=EQUITY_TRADER_PROMPT,
             temperature=0.5,
         )
-        self.market_data_provider = MarketDataProvider()
+        self.market_data_provider = MarketDataProvider.shared()
 
     async def analyze(self, context: dict[str, Any]) -> AgentReport:
         """
@@ -84,9 +85,10 @@ class EquityTrader(BaseAgent):
         )
 
         try:
-            # Get current market data
-            current_price = data_provider.get_current_price(symbol)
-            quote = data_provider.get_quote(symbol)
+            # Get current market data off the event loop (yfinance blocks); one
+            # quote request carries the price as well as the bid/ask
+            quote = await asyncio.to_thread(data_provider.get_quote, symbol)
+            current_price = quote["price"]
 
             # Calculate position size in shares
             # Assuming a $100,000 portfolio for now
@@ -112,8 +114,8 @@ class EquityTrader(BaseAgent):
                 side = OrderSide.BUY  # Default to buy
 
             # Get bid/ask spread for slippage estimation
-            bid = quote.get("bid", current_price) if quote else current_price
-            ask = quote.get("ask", current_price) if quote else current_price
+            bid = quote["bid"] or current_price
+            ask = quote["ask"] or current_price
             spread = abs(ask - bid) if bid and ask else 0
             slippage_estimate = (spread / current_price * 100) if current_price else 0.1
 
@@ -133,7 +135,7 @@ MARKET DATA:
 - Bid: ${bid or "N/A"}
 - Ask: ${ask or "N/A"}
 - Spread: ${spread:.4f} ({slippage_estimate:.3f}%)
-- Volume: {quote.get("volume", "N/A") if quote else "N/A"}
+- Volume: {quote["volume"] or "N/A"}
 
 EXECUTION REQUIREMENTS:
 - Minimize slippage and market impact
@@ -1,5 +1,6 @@
 """Execution Team - FnO Trader."""
 
+import asyncio
 import json
 from typing import Any
 
@@ -34,7 +35,7 @@ class FnOTrader(BaseAgent):
             system_prompt=FNO_TRADER_PROMPT,
             temperature=0.5,
         )
-        self.market_data_provider = MarketDataProvider()
+        self.market_data_provider = MarketDataProvider.shared()
 
     def _create_option_legs(
         self,
@@ -331,8 +332,8 @@ class FnOTrader(BaseAgent):
         )
 
         try:
-            # Get current market data
-            current_price = data_provider.get_current_price(symbol)
+            # Get current market data off the event loop (yfinance blocks)
+            current_price = await asyncio.to_thread(data_provider.get_current_price, symbol)
 
             if not current_price:
                 raise ValueError("Unable to fetch current price")
@@ -0,0 +1,122 @@
+"""Candlestick chart rendering for the visual analyst.
+
+Charts exist only to be read by Janus-Pro, so they are drawn straight onto a
+Pillow palette image from pixel coordinates computed with NumPy, without
+matplotlib's figure and artist machinery. A 60-bar chart renders in a few
+milliseconds.
+"""
+
+from io import BytesIO
+
+import numpy as np
+
+
+# 576x384 px: Janus-Pro's SigLIP-L encoder resizes inputs to 384x384, so
+# larger renders only add encode time and request body
+CHART_SIZE = (576, 384)  # Pixels
+CHART_FORMAT = "WEBP"  # Lossless; decoded by Pillow in the Janus-Pro service
+CHART_MOVING_AVERAGES = (10, 20, 50)
+CHART_MARGIN = 8  # Pixels around the plot area
+VOLUME_HEIGHT = 0.25  # Share of the plot height given to the volume panel
+GRID_LINES = 5  # Horizontal grid lines across the price panel
+
+# Palette indices; the image is drawn in "P" mode, so no quantization is needed
+_BACKGROUND, _GRID, _UP, _DOWN = 0, 1, 2, 3
+_MA_COLORS = (4, 5, 6)
+_PALETTE = [
+    255, 255, 255,  # Background
+    220, 220, 220,  # Grid
+    0, 128, 0,  # Up candle
+    200, 0, 0,  # Down candle
+    31, 119, 180,  # 10-bar MA
+    255, 127, 14,  # 20-bar MA
+    148, 103, 189,  # 50-bar MA
+]
+
+
+def _scale(values: np.ndarray, low: float, high: float, top: int, bottom: int) -> np.ndarray:
+    """Map values in [low, high] to pixel rows from bottom up to top."""
+    return np.interp(values, (low, high), (bottom, top))
+
+
+def render_chart(data) -> bytes:
+    """
+    Render an OHLCV frame as a candlestick chart with volume and moving averages.
+
+    Args:
+        data: DataFrame with Open/High/Low/Close columns and optionally Volume
+
+    Returns:
+        WebP image bytes
+    """
+    from PIL import Image, ImageDraw
+
+    opens = data["Open"].to_numpy(dtype=float)
+    highs = data["High"].to_numpy(dtype=float)
+    lows = data["Low"].to_numpy(dtype=float)
+    closes = data["Close"].to_numpy(dtype=float)
+    volumes = data["Volume"].to_numpy(dtype=float) if "Volume" in data else None
+    count = len(closes)
+
+    width, height = CHART_SIZE
+    top = CHART_MARGIN
+    bottom = height - CHART_MARGIN
+    price_bottom = bottom
+    if volumes is not None:
+        price_bottom -= int((bottom - top) * VOLUME_HEIGHT)
+    volume_top = price_bottom + CHART_MARGIN
+
+    # Candle centres and body half-width
+    slot = (width - 2 * CHART_MARGIN) / count
+    x = CHART_MARGIN + slot * (np.arange(count) + 0.5)
+    half = max(slot * 0.35, 0.5)
+
+    low, high = float(lows.min()), float(highs.max())
+    if high <= low:
+        high = low + 1.0
+    y_open = _scale(opens, low, high, top, price_bottom)
+    y_close = _scale(closes, low, high, top, price_bottom)
+    y_high = _scale(highs, low, high, top, price_bottom)
+    y_low = _scale(lows, low, high, top, price_bottom)
+    body_top = np.minimum(y_open, y_close)
+    body_bottom = np.maximum(y_open, y_close)
+    up = closes >= opens
+
+    image = Image.new("P", CHART_SIZE, _BACKGROUND)
+    image.putpalette(_PALETTE)
+    draw = ImageDraw.Draw(image)
+
+    for row in np.linspace(top, price_bottom, GRID_LINES).tolist():
+        draw.line((CHART_MARGIN, row, width - CHART_MARGIN, row), fill=_GRID)
+
+    if volumes is not None:
+        volume_peak = float(volumes.max()) or 1.0
+        y_volume = np.interp(volumes, (0.0, volume_peak), (bottom, volume_top))
+
+    # One pass per candle colour: wick line and body rectangle, then volume bar
+    for color, mask in ((_UP, up), (_DOWN, ~up)):
+        centres = x[mask].tolist()
+        for cx, wick_top, wick_bottom, body_y0, body_y1 in zip(
+            centres,
+            y_high[mask].tolist(),
+            y_low[mask].tolist(),
+            body_top[mask].tolist(),
+            body_bottom[mask].tolist(),
+        ):
+            draw.line((cx, wick_top, cx, wick_bottom), fill=color)
+            draw.rectangle((cx - half, body_y0, cx + half, body_y1), fill=color)
+
+        if volumes is not None:
+            for cx, bar_top in zip(centres, y_volume[mask].tolist()):
+                draw.rectangle((cx - half, bar_top, cx + half, bottom), fill=color)
+
+    for period, color in zip(CHART_MOVING_AVERAGES, _MA_COLORS):
+        if count <= period:
+            continue
+        average = np.convolve(closes, np.full(period, 1.0 / period), mode="valid")
+        points = np.column_stack((x[period - 1 :], _scale(average, low, high, top, price_bottom)))
+        draw.line(points.ravel().tolist(), fill=color, width=1)
+
+    buf = BytesIO()
+    image.save(buf, format=CHART_FORMAT, lossless=True)
+    return buf.getvalue()
@@ -0,0 +1,55 @@
+"""Shared HTTP session for the market intelligence model services.
+
+Agents talking to out-of-process model servers (e.g. the Janus-Pro container)
+share one keep-alive connection pool instead of opening a session per agent.
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+from ...utils import json_dumps
+
+
+HTTP_MAX_CONNECTIONS = 64  # Concurrent connections across all model services
+HTTP_KEEPALIVE_SECONDS = 60  # Idle time before a pooled connection is closed
+HTTP_TIMEOUT_SECONDS = 30  # Per-request timeout
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared session for the running event loop, creating it on first use.
+
+    aiohttp sessions are bound to the loop that created them, so a new session
+    is opened if the previous one was closed or belongs to another loop.
+
+    Returns:
+        Shared aiohttp ClientSession
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=HTTP_MAX_CONNECTIONS, keepalive_timeout=HTTP_KEEPALIVE_SECONDS
+            ),
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS),
+            # Request bodies carry base64 images; serialize them with orjson
+            json_serialize=json_dumps,
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_session():
+    """Close the shared session; the next get_session() call opens a new one."""
+    global _session, _session_loop
+
+    session, _session, _session_loop = _session, None, None
+    if session is not None and not session.closed:
+        await session.close()
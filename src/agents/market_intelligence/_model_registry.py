@@ -0,0 +1,57 @@
+"""Process-wide registry of loaded generative models.
+
+Lets several analyst instances share one copy of a (potentially multi-GB)
+model and tokenizer instead of each loading its own.
+"""
+
+import threading
+from typing import Any, Callable
+
+
+class ModelRegistry:
+    """Ref-counted cache of loaded (model, tokenizer) pairs."""
+
+    _models: dict[tuple, tuple[Any, Any]] = {}
+    _refcounts: dict[tuple, int] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_or_load(cls, key: tuple, loader: Callable[[], tuple[Any, Any]]) -> tuple[Any, Any]:
+        """
+        Return the shared model for a key, loading it on first use.
+
+        Args:
+            key: Hashable identity of the model, e.g. (model_name, backend, quant_bits)
+            loader: Called once, under the registry lock, to load the model
+
+        Returns:
+            Tuple of (model, tokenizer)
+        """
+        with cls._lock:
+            if key not in cls._models:
+                cls._models[key] = loader()
+                cls._refcounts[key] = 0
+            cls._refcounts[key] += 1
+            return cls._models[key]
+
+    @classmethod
+    def release(cls, key: tuple) -> None:
+        """
+        Drop one reference to a shared model, unloading it when unused.
+
+        Args:
+            key: Key previously passed to get_or_load
+        """
+        with cls._lock:
+            if key not in cls._refcounts:
+                return
+            cls._refcounts[key] -= 1
+            if cls._refcounts[key] <= 0:
+                del cls._refcounts[key]
+                del cls._models[key]
+
+    @classmethod
+    def refcount(cls, key: tuple) -> int:
+        """Return the number of live references to a shared model."""
+        with cls._lock:
+            return cls._refcounts.get(key, 0)
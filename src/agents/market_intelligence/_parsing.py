@@ -0,0 +1,135 @@
+# cython: language_level=3
+"""Text parsing helpers for market intelligence analysts.
+
+Free of class state and written in Cython's pure-Python mode: the module
+runs as-is, and can optionally be compiled in place for extra speed with
+``cythonize -i src/agents/market_intelligence/_parsing.py`` without any
+source changes.
+"""
+
+import re
+
+
+MAX_INSIGHTS = 5  # Insights kept per analysis
+MAX_RISKS = 3  # Risks kept per analysis
+MAX_OPPORTUNITIES = 3  # Opportunities kept per analysis
+
+# One-pass section scanner. Alternatives are tried in order, so a line naming
+# several sections resolves as insights > risks > opportunities > bullet item.
+_SECTION_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<insights>.*(?:insight|key).*)"
+    r"|(?P<risks>.*(?:risk|concern).*)"
+    r"|(?P<opportunities>.*(?:opportunit|potential).*)"
+    r"|(?P<item>(?:[-*•] (?=.*\S)|\d).*)"
+    r")$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_BULLET_CHARS = "-*•0123456789. "
+
+
+def parse_analysis(response: str) -> dict[str, list[str]]:
+    """
+    Split a generated analysis into insights, risks and opportunities.
+
+    Section headers switch the current list; bullet or numbered lines are
+    appended to it (insights until a header is seen).
+
+    Args:
+        response: Generated analysis text
+
+    Returns:
+        Dict with 'insights', 'risks' and 'opportunities' lists
+    """
+    insights: list = []
+    risks: list = []
+    opportunities: list = []
+    sections: dict = {"insights": insights, "risks": risks, "opportunities": opportunities}
+    current: list = insights
+    section: str
+    item: str
+
+    for match in _SECTION_RE.finditer(response):
+        section = match.lastgroup
+        if section == "item":
+            item = match.group("item")
+            current.append(item.strip().lstrip(_BULLET_CHARS).strip())
+        else:
+            current = sections[section]
+
+    return {
+        "insights": insights[:MAX_INSIGHTS],
+        "risks": risks[:MAX_RISKS],
+        "opportunities": opportunities[:MAX_OPPORTUNITIES],
+    }
+
+
+class AnalysisParser:
+    """
+    Incremental variant of parse_analysis for streamed generations.
+
+    Text is fed in arbitrary chunks; complete lines are classified as they
+    arrive, with the current section carried across chunks. ``full`` turns
+    True once every section has reached its cap, after which further text
+    cannot change the result.
+    """
+
+    def __init__(self):
+        self.insights: list = []
+        self.risks: list = []
+        self.opportunities: list = []
+        self._sections: dict = {
+            "insights": self.insights,
+            "risks": self.risks,
+            "opportunities": self.opportunities,
+        }
+        self._current: list = self.insights
+        self._pending: str = ""
+
+    @property
+    def full(self) -> bool:
+        """Whether all sections have reached their caps."""
+        return (
+            len(self.insights) >= MAX_INSIGHTS
+            and len(self.risks) >= MAX_RISKS
+            and len(self.opportunities) >= MAX_OPPORTUNITIES
+        )
+
+    def feed(self, chunk: str):
+        """
+        Consume a chunk of generated text.
+
+        Args:
+            chunk: Next piece of the generation (may end mid-line)
+        """
+        lines = (self._pending + chunk).split("\n")
+        self._pending = lines.pop()
+        for line in lines:
+            self._feed_line(line)
+
+    def _feed_line(self, line: str):
+        """Classify one complete line."""
+        match = _SECTION_RE.match(line)
+        if match is None:
+            return
+        section: str = match.lastgroup
+        if section == "item":
+            self._current.append(match.group("item").strip().lstrip(_BULLET_CHARS).strip())
+        else:
+            self._current = self._sections[section]
+
+    def result(self) -> dict[str, list[str]]:
+        """
+        Flush any trailing partial line and return the parsed sections.
+
+        Returns:
+            Dict with 'insights', 'risks' and 'opportunities' lists
+        """
+        if self._pending:
+            self._feed_line(self._pending)
+            self._pending = ""
+        return {
+            "insights": self.insights[:MAX_INSIGHTS],
+            "risks": self.risks[:MAX_RISKS],
+            "opportunities": self.opportunities[:MAX_OPPORTUNITIES],
+        }
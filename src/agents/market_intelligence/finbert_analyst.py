@@ -6,6 +6,15 @@ FinBERT model pre-trained on financial text.
 
 from typing import Any
 
+
+try:
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    _HAS_FINBERT = True
+except ImportError:
+    _HAS_FINBERT = False
+
 from ...data.schemas import AgentRole, FinBERTSentimentReport, Sentiment
 from ...utils import get_logger
 
@@ -36,21 +45,19 @@ class FinBERTSentimentAnalyst:
     def _load_model(self):
         """Lazy load the FinBERT model and tokenizer."""
         if self._model is None:
-            try:
-                from transformers import AutoModelForSequenceClassification, AutoTokenizer
-
-                logger.info("Loading FinBERT model", model=self.model_name)
-                self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-                self._model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
-                logger.info("FinBERT model loaded successfully")
-            except ImportError as e:
+            if not _HAS_FINBERT:
                 logger.error(
                     "Failed to import transformers. Install with: pip install transformers torch"
                 )
                 raise ImportError(
                     "transformers library required for FinBERT. "
                     "Install with: pip install transformers torch"
-                ) from e
+                )
+            try:
+                logger.info("Loading FinBERT model", model=self.model_name)
+                self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+                self._model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+                logger.info("FinBERT model loaded successfully")
             except Exception as e:
                 logger.error("Failed to load FinBERT model", error=str(e))
                 raise
@@ -65,8 +72,6 @@ class FinBERTSentimentAnalyst:
         Returns:
             Dict with sentiment scores: {positive, negative, neutral}
         """
-        import torch
-
         self._load_model()
 
         # Tokenize input
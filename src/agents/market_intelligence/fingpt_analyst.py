@@ -4,16 +4,28 @@ This module provides in-depth generative analysis using FinGPT for
 financial text summarization and insights.
 """
 
+import asyncio
+import copy
+import importlib.util
+import os
+import threading
+from collections import OrderedDict
 from typing import Any, Optional
 
+import aiohttp
+
+from ...config import settings
 from ...data.schemas import AgentRole, FinGPTGenerativeReport
-from ...utils import get_logger
+from ...utils import BatchingExecutor, TTLCache, get_logger, hash_key
+from ._model_registry import ModelRegistry
+from ._parsing import AnalysisParser, parse_analysis
 
 
 logger = get_logger(__name__)
 
 # Configuration constants
-MAX_INPUT_LENGTH = 2000  # Maximum input text length to avoid token limits
+MAX_INPUT_LENGTH = 2000  # Maximum input text length when no tokenizer is available
+DEFAULT_CONTEXT_TOKENS = 2048  # Context window assumed if the model config lacks one
 MIN_INSIGHTS_FOR_HIGH_CONFIDENCE = 3  # Minimum insights for confidence >= 0.8
 MIN_RISKS_FOR_HIGH_CONFIDENCE = 2  # Minimum risks for confidence >= 0.9
 MIN_OPPORTUNITIES_FOR_HIGH_CONFIDENCE = 2  # Minimum opportunities for confidence >= 0.9
@@ -21,6 +33,25 @@ BASE_CONFIDENCE = 0.7  # Default confidence level
 HIGH_CONFIDENCE_THRESHOLD = 0.8  # Confidence with good insights
 VERY_HIGH_CONFIDENCE_THRESHOLD = 0.9  # Confidence with insights, risks, and opportunities
 
+# Supported local inference backends
+SUPPORTED_BACKENDS = ("transformers", "llama_cpp", "vllm", "onnx")
+HF_BACKENDS = ("transformers", "onnx")  # Backends driven by an HF tokenizer + generate()
+LLAMA_CPP_CONTEXT_SIZE = 2048  # n_ctx for llama.cpp models
+LLAMA_CPP_BATCH_SIZE = 512  # n_batch (prompt tokens evaluated per step)
+MAX_NEW_TOKENS = 512  # Generation budget per analysis
+MAX_BATCH = 16  # Maximum prompts coalesced into one generate() call
+BATCH_MAX_WAIT = 0.02  # Seconds to wait for more prompts before generating
+PREFIX_CACHE_SIZE = 32  # Maximum cached prompt-prefix KV entries (LRU)
+VLLM_MAX_CONNECTIONS = 64  # Concurrent requests kept open to the vLLM server
+VLLM_TIMEOUT_SECONDS = 120  # Per-request timeout for vLLM completions
+RESPONSE_CACHE_SIZE = 1024  # Maximum cached generations
+RESPONSE_CACHE_TTL = 3600  # Seconds a cached generation stays valid
+SAMPLING_TEMPERATURE = 0.7  # Temperature when do_sample=True
+SAMPLING_TOP_P = 0.9  # Nucleus sampling mass when do_sample=True
+NUM_ASSISTANT_TOKENS = 5  # Draft tokens proposed per speculative decoding step
+
+_LLAMA_CPP_LOCK = threading.Lock()  # Serializes calls into shared llama.cpp models
+
 
 class FinGPTGenerativeAnalyst:
     """
@@ -30,20 +61,84 @@ class FinGPTGenerativeAnalyst:
     analysis including summarization, question-answering, and recommendations.
     """
 
-    def __init__(self, model_name: Optional[str] = None, use_local: bool = True):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        use_local: bool = True,
+        quant_bits: int = 4,
+        backend: str = "transformers",
+        vllm_url: Optional[str] = None,
+        cache_responses: bool = False,
+        do_sample: bool = False,
+        draft_model_name: Optional[str] = None,
+    ):
         """
         Initialize the FinGPT Generative Analyst.
 
         Args:
             model_name: Model name/path for FinGPT
-                (e.g., 'FinGPT/fingpt-forecaster_dow30_llama2-7b_lora')
+                (e.g., 'FinGPT/fingpt-forecaster_dow30_llama2-7b_lora'). For the
+                llama_cpp backend this is the path to a GGUF file of the
+                LoRA-merged model.
             use_local: If True, use local model; if False, use API endpoint
+            quant_bits: Weight quantization for the local model. 4 loads NF4
+                weights (default); 8 keeps LLM.int8() for outlier-sensitive models.
+            backend: Local inference backend. "transformers" (default) uses
+                HuggingFace generate; "llama_cpp" runs a pre-quantized GGUF via
+                llama-cpp-python, which is much faster on CPU-only hosts.
+                q4_K_M GGUFs are the usual speed/quality trade-off; q5_K_M is
+                slightly more accurate at ~20% more memory. GGUF conversions are
+                published on the HuggingFace Hub (search "fingpt gguf") or can be
+                produced with llama.cpp's convert_hf_to_gguf.py + llama-quantize.
+                "vllm" sends completions to a vLLM OpenAI-compatible server,
+                which adds PagedAttention and continuous batching across
+                concurrent analyze() calls. Launch it with e.g.
+                ``vllm serve <model> --quantization fp8 --enable-prefix-caching
+                --max-num-seqs 64``.
+                "onnx" runs the model with ONNX Runtime on CPU through optimum;
+                model_name may be a HF checkpoint (exported on load) or a
+                directory produced by quantize_onnx_model() for int8 weights.
+            vllm_url: Base URL of the vLLM server (defaults to
+                settings.fingpt_vllm_endpoint)
+            cache_responses: If True, identical prompts reuse the previous
+                generation for up to RESPONSE_CACHE_TTL seconds. Useful for
+                retries and multi-agent votes; with greedy decoding a cached
+                answer is exactly what regeneration would produce.
+            do_sample: If True, sample with temperature 0.7 / top-p 0.9.
+                Defaults to greedy decoding: the output is parsed into lists
+                anyway, and greedy decoding enables speculative decoding.
+            draft_model_name: Optional small draft model sharing the target's
+                tokenizer (e.g. 'TinyLlama/TinyLlama-1.1B-Chat-v1.0' for
+                Llama-2 based FinGPT). When set, single-sequence transformers
+                generation uses assisted (speculative) decoding: the draft
+                proposes tokens and the target verifies them in one pass.
         """
+        if quant_bits not in (4, 8):
+            raise ValueError(f"quant_bits must be 4 or 8, got {quant_bits}")
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(f"backend must be one of {SUPPORTED_BACKENDS}, got {backend!r}")
+
         self.role = AgentRole.FINGPT_GENERATIVE_ANALYST
         self.model_name = model_name or "FinGPT/fingpt-forecaster_dow30_llama2-7b_lora"
         self.use_local = use_local
+        self.quant_bits = quant_bits
+        self.backend = backend
+        self.vllm_url = (vllm_url or settings.fingpt_vllm_endpoint).rstrip("/")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.cache_responses = cache_responses
+        self._resp_cache = TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+        self.do_sample = do_sample
+        self.draft_model_name = draft_model_name
         self._model = None
         self._tokenizer = None
+        self._draft_model = None
+        self._max_input_tokens: Optional[int] = None
+        self._batch = BatchingExecutor(
+            self._generate_batch, max_batch=MAX_BATCH, max_wait=BATCH_MAX_WAIT
+        )
+        # (analysis_type, symbol) -> prefix input_ids / past_key_values, LRU ordered
+        self._prefix_ids: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._prefix_kv: OrderedDict[tuple[str, str], Any] = OrderedDict()
 
         # Define task-specific prompts
         self.prompts = {
@@ -86,29 +181,266 @@ Provide:
 """,
         }
 
-    def _load_model(self):
-        """Lazy load the FinGPT model and tokenizer."""
-        if self._model is None and self.use_local:
-            try:
-                from transformers import AutoModelForCausalLM, AutoTokenizer
+    @property
+    def _registry_key(self) -> tuple[str, str, int]:
+        """Identity of the underlying model in the shared ModelRegistry."""
+        return (self.model_name, self.backend, self.quant_bits)
 
-                logger.info("Loading FinGPT model", model=self.model_name)
-                self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-                self._model = AutoModelForCausalLM.from_pretrained(
-                    self.model_name, device_map="auto", load_in_8bit=True
+    def _load_model(self):
+        """Lazy load the FinGPT model and tokenizer, shared across instances."""
+        if self._model is None and self.use_local and self.backend != "vllm":
+            loader = {
+                "llama_cpp": self._load_llama_cpp_model,
+                "onnx": self._load_onnx_model,
+            }.get(self.backend, self._load_transformers_model)
+            self._model, self._tokenizer = ModelRegistry.get_or_load(self._registry_key, loader)
+            if self.draft_model_name and self.backend == "transformers":
+                self._draft_model, _ = ModelRegistry.get_or_load(
+                    self._draft_registry_key, self._load_draft_model
                 )
-                logger.info("FinGPT model loaded successfully")
-            except ImportError as e:
-                logger.error(
-                    "Failed to import transformers. Install with: pip install transformers torch"
+
+    @property
+    def _draft_registry_key(self) -> tuple[str, str, int]:
+        """Identity of the speculative-decoding draft model in the registry."""
+        return (self.draft_model_name, "draft", 16)
+
+    def release_model(self):
+        """Release this instance's reference to the shared model."""
+        if self._model is not None:
+            self._model = None
+            self._tokenizer = None
+            self._prefix_ids.clear()
+            self._prefix_kv.clear()
+            self._max_input_tokens = None
+            ModelRegistry.release(self._registry_key)
+        if self._draft_model is not None:
+            self._draft_model = None
+            ModelRegistry.release(self._draft_registry_key)
+
+    def _load_draft_model(self) -> tuple[Any, None]:
+        """Load the fp16 draft model used for speculative decoding."""
+        import torch
+        from transformers import AutoModelForCausalLM
+
+        logger.info("Loading FinGPT draft model", model=self.draft_model_name)
+        model = AutoModelForCausalLM.from_pretrained(
+            self.draft_model_name, torch_dtype=torch.float16, device_map="auto"
+        )
+        return model, None
+
+    def _decoding_kwargs(self, assisted: bool = False) -> dict[str, Any]:
+        """
+        Build HF generate() decoding arguments.
+
+        Args:
+            assisted: Whether the call decodes a single sequence and may use
+                the draft model (assisted generation does not support batches)
+
+        Returns:
+            Keyword arguments for generate()
+        """
+        if self.do_sample:
+            kwargs = {
+                "do_sample": True,
+                "temperature": SAMPLING_TEMPERATURE,
+                "top_p": SAMPLING_TOP_P,
+            }
+        else:
+            kwargs = {"do_sample": False}
+        if assisted and self._draft_model is not None:
+            kwargs["assistant_model"] = self._draft_model
+            kwargs["num_assistant_tokens"] = NUM_ASSISTANT_TOKENS
+        return kwargs
+
+    def _sampling_params(self) -> tuple[float, float]:
+        """Return (temperature, top_p) for backends taking raw sampling params."""
+        if self.do_sample:
+            return SAMPLING_TEMPERATURE, SAMPLING_TOP_P
+        return 0.0, 1.0
+
+    def _load_transformers_model(self) -> tuple[Any, Any]:
+        """Load a HuggingFace causal LM and its tokenizer."""
+        try:
+            import torch
+            from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
+        except ImportError as e:
+            logger.error(
+                "Failed to import transformers. Install with: pip install transformers torch"
+            )
+            raise ImportError(
+                "transformers library required for FinGPT. "
+                "Install with: pip install transformers torch bitsandbytes accelerate"
+            ) from e
+
+        try:
+            logger.info("Loading FinGPT model", model=self.model_name, quant_bits=self.quant_bits)
+            if self.quant_bits == 4:
+                quant_cfg = BitsAndBytesConfig(
+                    load_in_4bit=True,
+                    bnb_4bit_quant_type="nf4",
+                    bnb_4bit_use_double_quant=True,
+                    bnb_4bit_compute_dtype=torch.bfloat16,
                 )
-                raise ImportError(
-                    "transformers library required for FinGPT. "
-                    "Install with: pip install transformers torch bitsandbytes accelerate"
-                ) from e
-            except Exception as e:
-                logger.error("Failed to load FinGPT model", error=str(e))
-                raise
+            else:
+                quant_cfg = BitsAndBytesConfig(load_in_8bit=True)
+
+            # Rust-backed fast tokenizer
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+            use_cuda = torch.cuda.is_available()
+            attn_implementation = self._attention_implementation(use_cuda)
+            model = AutoModelForCausalLM.from_pretrained(
+                self.model_name,
+                device_map="auto",
+                quantization_config=quant_cfg,
+                torch_dtype=torch.bfloat16,
+                attn_implementation=attn_implementation,
+            )
+            if use_cuda:
+                # Compile the forward pass only: generate() calls model.forward, so
+                # wrapping the module itself would bypass the compiled graph
+                model.forward = torch.compile(model.forward, dynamic=True, fullgraph=False)
+            logger.info(
+                "FinGPT model loaded successfully",
+                attn_implementation=attn_implementation,
+                compiled=use_cuda,
+            )
+            return model, tokenizer
+        except Exception as e:
+            logger.error("Failed to load FinGPT model", error=str(e))
+            raise
+
+    @staticmethod
+    def _attention_implementation(use_cuda: bool) -> str:
+        """
+        Pick the fused attention kernel for the HF model.
+
+        Args:
+            use_cuda: Whether the model runs on a CUDA device
+
+        Returns:
+            "flash_attention_2" when flash-attn is installed on CUDA, else "sdpa"
+        """
+        if use_cuda and importlib.util.find_spec("flash_attn") is not None:
+            return "flash_attention_2"
+        return "sdpa"
+
+    def _load_llama_cpp_model(self) -> tuple[Any, None]:
+        """Load a GGUF model through llama.cpp (no separate tokenizer)."""
+        try:
+            from llama_cpp import Llama
+        except ImportError as e:
+            logger.error("Failed to import llama_cpp. Install with: pip install llama-cpp-python")
+            raise ImportError(
+                "llama-cpp-python library required for the llama_cpp backend. "
+                "Install with: pip install llama-cpp-python"
+            ) from e
+
+        try:
+            logger.info("Loading FinGPT GGUF model", model=self.model_name)
+            model = Llama(
+                model_path=self.model_name,
+                n_ctx=LLAMA_CPP_CONTEXT_SIZE,
+                n_threads=os.cpu_count(),
+                n_batch=LLAMA_CPP_BATCH_SIZE,
+                verbose=False,
+            )
+            logger.info("FinGPT GGUF model loaded successfully")
+            return model, None
+        except Exception as e:
+            logger.error("Failed to load FinGPT GGUF model", error=str(e))
+            raise
+
+    def _load_onnx_model(self) -> tuple[Any, Any]:
+        """Load the model as an ONNX Runtime causal LM on the CPU provider."""
+        try:
+            from optimum.onnxruntime import ORTModelForCausalLM
+            from transformers import AutoTokenizer
+        except ImportError as e:
+            logger.error("Failed to import optimum. Install with: pip install optimum[onnxruntime]")
+            raise ImportError(
+                "optimum[onnxruntime] library required for the onnx backend. "
+                "Install with: pip install optimum[onnxruntime]"
+            ) from e
+
+        try:
+            logger.info("Loading FinGPT ONNX model", model=self.model_name)
+            # Directories already holding an exported model skip the export step
+            export = not os.path.isdir(self.model_name) or not any(
+                name.endswith(".onnx") for name in os.listdir(self.model_name)
+            )
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+            model = ORTModelForCausalLM.from_pretrained(
+                self.model_name, export=export, provider="CPUExecutionProvider"
+            )
+            logger.info("FinGPT ONNX model loaded successfully")
+            return model, tokenizer
+        except Exception as e:
+            logger.error("Failed to load FinGPT ONNX model", error=str(e))
+            raise
+
+    @staticmethod
+    def quantize_onnx_model(onnx_model_dir: str, save_dir: str) -> str:
+        """
+        Build an int8 dynamically-quantized copy of an exported ONNX model.
+
+        Run offline; point model_name at the returned directory with
+        backend="onnx" to serve it. Uses AVX-512 VNNI int8 kernels.
+
+        Args:
+            onnx_model_dir: Directory containing the exported ONNX model
+            save_dir: Output directory for the quantized model
+
+        Returns:
+            The output directory
+        """
+        from optimum.onnxruntime import ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        quantizer = ORTQuantizer.from_pretrained(onnx_model_dir)
+        quantizer.quantize(
+            save_dir=save_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False),
+        )
+        return save_dir
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the pooled aiohttp session for the vLLM server."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=VLLM_MAX_CONNECTIONS),
+                timeout=aiohttp.ClientTimeout(total=VLLM_TIMEOUT_SECONDS),
+            )
+        return self._session
+
+    async def close(self):
+        """Close the vLLM HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def _generate_vllm(self, prompt: str, max_length: int = 512) -> str:
+        """
+        Generate a response through a vLLM OpenAI-compatible server.
+
+        Args:
+            prompt: Input prompt
+            max_length: Maximum number of tokens to generate
+
+        Returns:
+            Generated text response
+        """
+        session = await self._get_session()
+        temperature, top_p = self._sampling_params()
+        payload = {
+            "model": self.model_name,
+            "prompt": prompt,
+            "max_tokens": max_length,
+            "temperature": temperature,
+            "top_p": top_p,
+        }
+        async with session.post(f"{self.vllm_url}/v1/completions", json=payload) as response:
+            response.raise_for_status()
+            result = await response.json()
+        return result["choices"][0]["text"].strip()
 
     def _generate_response(self, prompt: str, max_length: int = 512) -> str:
         """
@@ -116,7 +448,7 @@ Provide:
 
         Args:
             prompt: Input prompt
-            max_length: Maximum length of generated text
+            max_length: Maximum number of new tokens to generate
 
         Returns:
             Generated text response
@@ -135,26 +467,339 @@ Provide:
                 "FinGPT analysis unavailable: local model could not be loaded. "
                 "Check model path or configuration."
             )
+
+        if self.backend == "llama_cpp":
+            # llama.cpp tokenizes internally and returns only the completion
+            temperature, top_p = self._sampling_params()
+            # A llama.cpp context is not thread-safe; worker threads take turns
+            with _LLAMA_CPP_LOCK:
+                result = self._model(
+                    prompt, max_tokens=max_length, temperature=temperature, top_p=top_p
+                )
+            return result["choices"][0]["text"].strip()
+
         # Tokenize input
         inputs = self._tokenizer(prompt, return_tensors="pt").to(self._model.device)
 
-        # Generate response
+        return self._generate_streaming(
+            {
+                **inputs,
+                "max_new_tokens": max_length,
+                "num_return_sequences": 1,
+                **self._decoding_kwargs(assisted=True),
+            }
+        )
+
+    def _generate_streaming(self, generate_kwargs: dict[str, Any]) -> str:
+        """
+        Run HF generate() in a worker thread and parse its output as it streams.
+
+        Generation stops early once the parser has collected every section
+        it keeps, so the tail tokens are never decoded.
+
+        Args:
+            generate_kwargs: Keyword arguments for generate() (single sequence)
+
+        Returns:
+            Generated completion, without the prompt
+        """
+        from transformers import StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+
+        stop = threading.Event()
+
+        class _StopWhenParsed(StoppingCriteria):
+            def __call__(self, input_ids, scores, **kwargs) -> bool:
+                return stop.is_set()
+
+        streamer = TextIteratorStreamer(self._tokenizer, skip_prompt=True, skip_special_tokens=True)
+        errors: list[Exception] = []
+
+        def run():
+            try:
+                self._model.generate(
+                    **generate_kwargs,
+                    streamer=streamer,
+                    stopping_criteria=StoppingCriteriaList([_StopWhenParsed()]),
+                )
+            except Exception as e:
+                errors.append(e)
+                streamer.end()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+
+        parser = AnalysisParser()
+        chunks = []
+        for chunk in streamer:
+            chunks.append(chunk)
+            parser.feed(chunk)
+            if parser.full:
+                stop.set()
+                break
+        thread.join()
+
+        if errors:
+            raise errors[0]
+        return "".join(chunks).strip()
+
+    def _resolve_analysis_type(self, analysis_type: str) -> str:
+        """Map unknown analysis types to the general template."""
+        return analysis_type if analysis_type in self.prompts else "general_analysis"
+
+    def _build_prompt(self, analysis_type: str, symbol: str, text: str) -> str:
+        """Render the full prompt for an (already truncated) analysis request."""
+        template = self.prompts[self._resolve_analysis_type(analysis_type)]
+        return template.format(symbol=symbol, text=text)
+
+    def _input_token_budget(self) -> int:
+        """
+        Number of input-text tokens that fit beside the longest template.
+
+        Computed once per loaded model as context size minus template
+        tokens minus the generation budget.
+        """
+        if self._max_input_tokens is None:
+            config = getattr(self._model, "config", None)
+            model_max = getattr(config, "max_position_embeddings", None) or DEFAULT_CONTEXT_TOKENS
+            template_tokens = max(
+                len(self._tokenizer(template.format(symbol="SYMBOL", text="")).input_ids)
+                for template in self.prompts.values()
+            )
+            self._max_input_tokens = max(model_max - template_tokens - MAX_NEW_TOKENS, 0)
+        return self._max_input_tokens
+
+    def _truncate_text(self, text: str) -> str:
+        """
+        Truncate input text to what fits in the model's context.
+
+        Uses a token-accurate budget when the HF tokenizer is loaded and
+        falls back to MAX_INPUT_LENGTH characters otherwise.
+
+        Args:
+            text: Raw input text
+
+        Returns:
+            Truncated text
+        """
+        if self.backend not in HF_BACKENDS or self._tokenizer is None:
+            return text[:MAX_INPUT_LENGTH]
+
+        ids = self._tokenizer(
+            text,
+            add_special_tokens=False,
+            truncation=True,
+            max_length=self._input_token_budget(),
+        ).input_ids
+        return self._tokenizer.decode(ids, skip_special_tokens=True)
+
+    def _split_template(self, analysis_type: str) -> tuple[str, str]:
+        """Split a template into its static prefix and the {text}-bearing tail."""
+        prefix, marker, rest = self.prompts[analysis_type].partition("{text}")
+        return prefix, marker + rest
+
+    def _get_prefix_ids(self, analysis_type: str, symbol: str) -> Any:
+        """
+        Get the token ids of a template's static prefix.
+
+        The text before a template's {text} marker only depends on the
+        analysis type and symbol, so it is tokenized once and reused.
+
+        Args:
+            analysis_type: Resolved prompt template key
+            symbol: Stock symbol substituted into the prefix
+
+        Returns:
+            Prefix input_ids tensor of shape (1, prefix_len) on the model device
+        """
+        key = (analysis_type, symbol)
+        prefix_ids = self._prefix_ids.get(key)
+        if prefix_ids is not None:
+            self._prefix_ids.move_to_end(key)
+            return prefix_ids
+
+        prefix = self._split_template(analysis_type)[0].format(symbol=symbol)
+        prefix_ids = self._tokenizer(
+            prefix, add_special_tokens=True, return_tensors="pt"
+        ).input_ids.to(self._model.device)
+
+        self._prefix_ids[key] = prefix_ids
+        if len(self._prefix_ids) > PREFIX_CACHE_SIZE:
+            self._prefix_ids.popitem(last=False)
+        return prefix_ids
+
+    def _encode_prompt(self, analysis_type: str, symbol: str, text: str) -> Any:
+        """
+        Tokenize a prompt from its cached prefix ids and a freshly tokenized tail.
+
+        Args:
+            analysis_type: Resolved prompt template key
+            symbol: Stock symbol
+            text: Text to analyze
+
+        Returns:
+            Full prompt input_ids tensor of shape (1, prompt_len)
+        """
+        import torch
+
+        prefix_ids = self._get_prefix_ids(analysis_type, symbol)
+        tail = self._split_template(analysis_type)[1]
+        tail_ids = self._tokenizer(
+            tail.format(symbol=symbol, text=text),
+            add_special_tokens=False,
+            return_tensors="pt",
+        ).input_ids.to(self._model.device)
+        return torch.cat([prefix_ids, tail_ids], dim=1)
+
+    def _get_prefix_kv(self, analysis_type: str, symbol: str) -> Any:
+        """
+        Get (or compute) the KV cache for a template's static prefix.
+
+        Args:
+            analysis_type: Resolved prompt template key
+            symbol: Stock symbol substituted into the prefix
+
+        Returns:
+            past_key_values covering the prefix tokens
+        """
+        import torch
+
+        key = (analysis_type, symbol)
+        prefix_kv = self._prefix_kv.get(key)
+        if prefix_kv is not None:
+            self._prefix_kv.move_to_end(key)
+            return prefix_kv
+
+        with torch.no_grad():
+            out = self._model(input_ids=self._get_prefix_ids(analysis_type, symbol), use_cache=True)
+
+        prefix_kv = out.past_key_values
+        self._prefix_kv[key] = prefix_kv
+        if len(self._prefix_kv) > PREFIX_CACHE_SIZE:
+            self._prefix_kv.popitem(last=False)
+        return prefix_kv
+
+    def _generate_single(self, analysis_type: str, symbol: str, text: str) -> str:
+        """
+        Generate one response from the pre-tokenized template prefix.
+
+        Uses speculative decoding when a draft model is loaded (it outweighs
+        prefix reuse on long outputs); otherwise, for PyTorch models, starts
+        from the cached prefix KV so only the tail tokens are prefilled.
+
+        Args:
+            analysis_type: Resolved prompt template key
+            symbol: Stock symbol
+            text: Text to analyze
+
+        Returns:
+            Generated completion
+        """
+        import torch
+
+        input_ids = self._encode_prompt(analysis_type, symbol, text)
+        decoding = self._decoding_kwargs(assisted=True)
+        if "assistant_model" not in decoding and self.backend == "transformers":
+            # generate() extends the cache in place, so hand it a copy
+            decoding["past_key_values"] = copy.deepcopy(self._get_prefix_kv(analysis_type, symbol))
+
+        return self._generate_streaming(
+            {
+                "input_ids": input_ids,
+                "attention_mask": torch.ones_like(input_ids),
+                "use_cache": True,
+                "max_new_tokens": MAX_NEW_TOKENS,
+                **decoding,
+            }
+        )
+
+    def _generate_batch(self, requests: list[tuple[str, str, str]]) -> list[str]:
+        """
+        Generate responses for several requests in one generate() call.
+
+        A batch of one reuses the pre-tokenized template prefix (and its KV
+        cache or the draft model); larger batches are padded and generated
+        together.
+
+        Args:
+            requests: (analysis_type, symbol, text) tuples
+
+        Returns:
+            Generated completions, one per request and in the same order
+        """
+        self._load_model()
+
+        requests = [
+            (analysis_type, symbol, self._truncate_text(text))
+            for analysis_type, symbol, text in requests
+        ]
+        prompts = [self._build_prompt(*request) for request in requests]
+        if self._model is None:
+            return [self._generate_response(prompt) for prompt in prompts]
+
+        if len(requests) == 1:
+            analysis_type, symbol, text = requests[0]
+            return [self._generate_single(self._resolve_analysis_type(analysis_type), symbol, text)]
+
+        # Decoder-only models need left padding so completions line up
+        self._tokenizer.padding_side = "left"
+        if self._tokenizer.pad_token is None:
+            self._tokenizer.pad_token = self._tokenizer.eos_token
+
+        batch = self._tokenizer(prompts, padding=True, return_tensors="pt").to(self._model.device)
         outputs = self._model.generate(
-            **inputs,
-            max_length=max_length,
-            num_return_sequences=1,
-            temperature=0.7,
-            top_p=0.9,
-            do_sample=True,
+            **batch,
+            max_new_tokens=MAX_NEW_TOKENS,
+            pad_token_id=self._tokenizer.pad_token_id,
+            **self._decoding_kwargs(),
         )
 
-        # Decode response
-        response = self._tokenizer.decode(outputs[0], skip_special_tokens=True)
+        # Decode only the generated tokens of each row
+        prompt_length = batch["input_ids"].shape[1]
+        responses = self._tokenizer.batch_decode(
+            outputs[:, prompt_length:], skip_special_tokens=True
+        )
+        return [response.strip() for response in responses]
+
+    async def _generate(self, analysis_type: str, symbol: str, text: str) -> str:
+        """
+        Generate an analysis through the configured backend.
 
-        # Remove the input prompt from response
-        if prompt in response:
-            response = response.replace(prompt, "").strip()
+        Local transformers models coalesce concurrent calls into one batched
+        generate(); vLLM batches server-side; llama.cpp runs in a worker
+        thread. Responses are served from the content-addressed cache when
+        cache_responses is enabled.
 
+        Args:
+            analysis_type: Prompt template key
+            symbol: Stock symbol
+            text: Text to analyze
+
+        Returns:
+            Generated text response
+        """
+        cache_key = None
+        if self.cache_responses:
+            cache_key = hash_key(self.backend, self.model_name, analysis_type, symbol, text)
+            cached = self._resp_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("FinGPT response cache hit", symbol=symbol)
+                return cached
+
+        if self.use_local and self.backend in HF_BACKENDS:
+            # Truncated to the token budget in the worker, once the tokenizer is loaded
+            response = await self._batch.submit((analysis_type, symbol, text))
+        else:
+            prompt = self._build_prompt(analysis_type, symbol, self._truncate_text(text))
+            if self.backend == "vllm":
+                response = await self._generate_vllm(prompt, max_length=MAX_NEW_TOKENS)
+            else:
+                # llama.cpp inference (and its lazy GGUF load) is CPU-bound
+                response = await asyncio.to_thread(
+                    self._generate_response, prompt, max_length=MAX_NEW_TOKENS
+                )
+
+        if cache_key is not None:
+            self._resp_cache[cache_key] = response
         return response
 
     def _parse_analysis(self, response: str) -> dict[str, Any]:
@@ -167,49 +812,7 @@ Provide:
         Returns:
             Structured analysis dict
         """
-        # Simple parsing - look for numbered lists or bullet points
-        insights = []
-        risks = []
-        opportunities = []
-
-        lines = response.split("\n")
-        current_section = None
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Detect sections
-            lower_line = line.lower()
-            if "insight" in lower_line or "key" in lower_line:
-                current_section = "insights"
-                continue
-            elif "risk" in lower_line or "concern" in lower_line:
-                current_section = "risks"
-                continue
-            elif "opportunit" in lower_line or "potential" in lower_line:
-                current_section = "opportunities"
-                continue
-
-            # Add to appropriate list
-            if line.startswith(("- ", "* ", "• ")) or (line and line[0].isdigit()):
-                clean_line = line.lstrip("-*•0123456789. ").strip()
-                if current_section == "insights":
-                    insights.append(clean_line)
-                elif current_section == "risks":
-                    risks.append(clean_line)
-                elif current_section == "opportunities":
-                    opportunities.append(clean_line)
-                else:
-                    # Default to insights if no section detected
-                    insights.append(clean_line)
-
-        return {
-            "insights": insights[:5],  # Top 5
-            "risks": risks[:3],  # Top 3
-            "opportunities": opportunities[:3],  # Top 3
-        }
+        return parse_analysis(response)
 
     async def analyze(self, context: dict[str, Any]) -> FinGPTGenerativeReport:
         """
@@ -237,12 +840,8 @@ Provide:
         )
 
         try:
-            # Select appropriate prompt
-            prompt_template = self.prompts.get(analysis_type, self.prompts["general_analysis"])
-            prompt = prompt_template.format(symbol=symbol, text=text[:MAX_INPUT_LENGTH])
-
             # Generate analysis
-            response = self._generate_response(prompt, max_length=512)
+            response = await self._generate(analysis_type, symbol, text)
 
             # Parse structured data
             parsed = self._parse_analysis(response)
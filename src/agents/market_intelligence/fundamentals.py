@@ -1,18 +1,84 @@
 """Market Intelligence Team - Fundamentals Analyst."""
 
-import json
+import asyncio
+import string
+from collections import defaultdict
 from typing import Any
 
 from ...config.prompts import FUNDAMENTALS_ANALYST_PROMPT
 from ...data.providers import MarketDataProvider
 from ...data.schemas import AgentRole, FundamentalsReport, Sentiment
-from ...utils import get_logger
+from ...utils import JSONDecodeError, get_logger, parse_json_response
 from ..base import BaseAgent
 
 
 logger = get_logger(__name__)
 
 
+class _PromptTemplate(string.Template):
+    """string.Template that also accepts placeholders such as $52_week_high."""
+
+    idpattern = r"(?a:[_a-z0-9]+)"
+
+
+# Compiled once and shared by every analyze() call; missing metrics render "N/A"
+_INPUT_TEMPLATE = _PromptTemplate(
+    """
+Analyze the fundamental data for $symbol and provide a comprehensive investment analysis.
+
+COMPANY INFORMATION:
+- Name: $company_name
+- Sector: $sector
+- Industry: $industry
+- Current Price: $$$current_price
+
+VALUATION METRICS:
+- Market Cap: $$$market_cap
+- Enterprise Value: $$$enterprise_value
+- P/E Ratio (Trailing): $pe_ratio
+- P/E Ratio (Forward): $forward_pe
+- PEG Ratio: $peg_ratio
+- Price to Book: $pb_ratio
+- Price to Sales: $ps_ratio
+
+PROFITABILITY:
+- Profit Margin: $profit_margin
+- Operating Margin: $operating_margin
+- Return on Equity: $roe
+- Return on Assets: $roa
+
+GROWTH:
+- Revenue Growth: $revenue_growth
+- Earnings Growth: $earnings_growth
+
+FINANCIAL HEALTH:
+- Debt to Equity: $debt_to_equity
+- Current Ratio: $current_ratio
+- Quick Ratio: $quick_ratio
+- Free Cash Flow: $$$free_cash_flow
+
+DIVIDEND:
+- Dividend Yield: $dividend_yield
+- Payout Ratio: $payout_ratio
+
+TECHNICAL FACTORS:
+- Beta: $beta
+- 52 Week High: $$$52_week_high
+- 52 Week Low: $$$52_week_low
+
+Please provide your analysis in the following JSON format:
+{
+    "key_points": ["point1", "point2", "point3"],
+    "intrinsic_value_estimate": <number or null>,
+    "investment_thesis": "bullish" or "bearish" or "neutral",
+    "risk_factors": ["risk1", "risk2", "risk3"],
+    "confidence_level": <1-10>,
+    "analysis_summary": "brief summary of your analysis"
+}
+"""
+)
+
+
 class FundamentalsAnalyst(BaseAgent):
     """
     Fundamentals Analyst agent.
@@ -27,7 +93,7 @@ class FundamentalsAnalyst(BaseAgent):
             system_prompt=FUNDAMENTALS_ANALYST_PROMPT,
             temperature=0.5,  # Lower temperature for factual analysis
         )
-        self.data_provider = MarketDataProvider()
+        self.data_provider = MarketDataProvider.shared()
 
     async def analyze(self, context: dict[str, Any]) -> FundamentalsReport:
         """
@@ -47,67 +113,19 @@ class FundamentalsAnalyst(BaseAgent):
         logger.info("Starting fundamental analysis", symbol=symbol)
 
         try:
-            # Fetch fundamental data
-            fundamentals = data_provider.get_fundamentals(symbol)
-            info = data_provider.get_info(symbol)
-
-            # Get current price for valuation
-            current_price = data_provider.get_current_price(symbol)
+            # Fetch fundamental data and current price concurrently
+            fundamentals, current_price = await asyncio.gather(
+                asyncio.to_thread(data_provider.get_fundamentals, symbol),
+                asyncio.to_thread(data_provider.get_current_price, symbol),
+            )
+            current_price = current_price or fundamentals.get("current_price")
 
             # Construct detailed input for LLM
-            input_text = f"""
-Analyze the fundamental data for {symbol} and provide a comprehensive investment analysis.
-
-COMPANY INFORMATION:
-- Name: {info.get("longName", "N/A")}
-- Sector: {fundamentals.get("sector", "N/A")}
-- Industry: {fundamentals.get("industry", "N/A")}
-- Current Price: ${current_price or "N/A"}
-
-VALUATION METRICS:
-- Market Cap: ${fundamentals.get("market_cap", "N/A")}
-- Enterprise Value: ${fundamentals.get("enterprise_value", "N/A")}
-- P/E Ratio (Trailing): {fundamentals.get("trailing_pe", "N/A")}
-- P/E Ratio (Forward): {fundamentals.get("forward_pe", "N/A")}
-- PEG Ratio: {fundamentals.get("peg_ratio", "N/A")}
-- Price to Book: {fundamentals.get("price_to_book", "N/A")}
-- Price to Sales: {fundamentals.get("price_to_sales", "N/A")}
-
-PROFITABILITY:
-- Profit Margin: {fundamentals.get("profit_margins", "N/A")}
-- Operating Margin: {fundamentals.get("operating_margins", "N/A")}
-- Return on Equity: {fundamentals.get("return_on_equity", "N/A")}
-- Return on Assets: {fundamentals.get("return_on_assets", "N/A")}
-
-GROWTH:
-- Revenue Growth: {fundamentals.get("revenue_growth", "N/A")}
-- Earnings Growth: {fundamentals.get("earnings_growth", "N/A")}
-
-FINANCIAL HEALTH:
-- Debt to Equity: {fundamentals.get("debt_to_equity", "N/A")}
-- Current Ratio: {fundamentals.get("current_ratio", "N/A")}
-- Quick Ratio: {fundamentals.get("quick_ratio", "N/A")}
-- Free Cash Flow: ${fundamentals.get("free_cash_flow", "N/A")}
-
-DIVIDEND:
-- Dividend Yield: {fundamentals.get("dividend_yield", "N/A")}
-- Payout Ratio: {fundamentals.get("payout_ratio", "N/A")}
-
-TECHNICAL FACTORS:
-- Beta: {fundamentals.get("beta", "N/A")}
-- 52 Week High: ${fundamentals.get("52_week_high", "N/A")}
-- 52 Week Low: ${fundamentals.get("52_week_low", "N/A")}
-
-Please provide your analysis in the following JSON format:
-{{
-    "key_points": ["point1", "point2", "point3"],
-    "intrinsic_value_estimate": <number or null>,
-    "investment_thesis": "bullish" or "bearish" or "neutral",
-    "risk_factors": ["risk1", "risk2", "risk3"],
-    "confidence_level": <1-10>,
-    "analysis_summary": "brief summary of your analysis"
-}}
-"""
+            fields: defaultdict[str, Any] = defaultdict(lambda: "N/A")
+            fields.update((k, v) for k, v in fundamentals.items() if v is not None)
+            fields["symbol"] = symbol
+            fields["current_price"] = current_price or "N/A"
+            input_text = _INPUT_TEMPLATE.substitute(fields)
 
             # Generate analysis
             response = await self._generate_response(input_text)
@@ -115,14 +133,7 @@ Please provide your analysis in the following JSON format:
             # Try to parse JSON response
             try:
                 # Extract JSON from response (handle markdown code blocks)
-                if "```json" in response:
-                    json_str = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    json_str = response.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response.strip()
-
-                parsed = json.loads(json_str)
+                parsed = parse_json_response(response)
 
                 # Extract fields with defaults
                 key_points = parsed.get("key_points", [])
@@ -140,7 +151,7 @@ Please provide your analysis in the following JSON format:
                 else:
                     investment_thesis = Sentiment.NEUTRAL
 
-            except (json.JSONDecodeError, KeyError, IndexError) as e:
+            except (JSONDecodeError, KeyError, IndexError) as e:
                 logger.warning("Failed to parse LLM response as JSON, using defaults", error=str(e))
                 key_points = ["Analysis pending - parsing error"]
                 intrinsic_value = None
@@ -153,11 +164,23 @@ Please provide your analysis in the following JSON format:
                 symbol=symbol,
                 confidence_level=confidence_level,
                 analysis=analysis_summary,
-                key_points=key_points,
+                revenue=fundamentals.get("revenue"),
+                net_income=fundamentals.get("net_income"),
+                pe_ratio=fundamentals.get("pe_ratio"),
+                pb_ratio=fundamentals.get("pb_ratio"),
+                ps_ratio=fundamentals.get("ps_ratio"),
+                roe=fundamentals.get("roe"),
+                roa=fundamentals.get("roa"),
+                debt_to_equity=fundamentals.get("debt_to_equity"),
+                current_ratio=fundamentals.get("current_ratio"),
                 intrinsic_value=intrinsic_value,
-                financial_metrics=fundamentals,
+                current_price=current_price,
                 investment_thesis=investment_thesis,
-                risk_factors=risk_factors,
+                metadata={
+                    "key_points": key_points,
+                    "risk_factors": risk_factors,
+                    "financial_metrics": fundamentals,
+                },
             )
 
             logger.info(
@@ -177,9 +200,10 @@ Please provide your analysis in the following JSON format:
                 symbol=symbol,
                 confidence_level=1,
                 analysis=f"Analysis failed: {str(e)}",
-                key_points=["Analysis error occurred"],
                 intrinsic_value=None,
-                financial_metrics={},
                 investment_thesis=Sentiment.NEUTRAL,
-                risk_factors=[f"Error: {str(e)}"],
+                metadata={
+                    "key_points": ["Analysis error occurred"],
+                    "risk_factors": [f"Error: {str(e)}"],
+                },
             )
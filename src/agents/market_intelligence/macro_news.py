@@ -1,18 +1,27 @@
 """Market Intelligence Team - Macro & News Analyst."""
 
-import json
+import asyncio
 from typing import Any
 
 from ...config.prompts import MACRO_NEWS_ANALYST_PROMPT
 from ...data.providers import MarketDataProvider, NewsProvider
 from ...data.schemas import AgentRole, MacroNewsReport, Sentiment
-from ...utils import get_logger
+from ...utils import JSONDecodeError, get_logger, parse_json_response
 from ..base import BaseAgent
 
 
 logger = get_logger(__name__)
 
 
+def _news_line(item: dict[str, Any]) -> str:
+    """Render one news item as a prompt line; fields missing from the item get defaults."""
+    return "- [{}] {} ({})".format(
+        item.get("published_iso", "N/A"),
+        item.get("title", ""),
+        item.get("publisher", "Unknown"),
+    )
+
+
 class MacroNewsAnalyst(BaseAgent):
     """
     Macro & News Analyst agent.
@@ -27,8 +36,8 @@ class MacroNewsAnalyst(BaseAgent):
             system_prompt=MACRO_NEWS_ANALYST_PROMPT,
             temperature=0.6,
         )
-        self.market_data_provider = MarketDataProvider()
-        self.news_provider = NewsProvider()
+        self.market_data_provider = MarketDataProvider.shared()
+        self.news_provider = NewsProvider.shared()
 
     async def analyze(self, context: dict[str, Any]) -> MacroNewsReport:
         """
@@ -48,18 +57,15 @@ class MacroNewsAnalyst(BaseAgent):
         logger.info("Starting macro & news analysis", symbol=symbol)
 
         try:
-            # Fetch news data
-            news_items = news_provider.get_news(symbol, limit=20)
-            news_sentiment = news_provider.get_news_sentiment(symbol, lookback_days=7)
-
-            # Format news for LLM
-            news_text = "\n".join(
-                [
-                    f"- [{item['published'].strftime('%Y-%m-%d')}] {item['title']} ({item['publisher']})"
-                    for item in news_items[:10]
-                ]
+            # Fetch news and sentiment concurrently
+            news_items, news_sentiment = await asyncio.gather(
+                asyncio.to_thread(news_provider.get_company_news, symbol, max_articles=20),
+                asyncio.to_thread(news_provider.aggregate_sentiment, symbol, days_back=7),
             )
 
+            # Format news for LLM (dates are pre-rendered by the provider)
+            news_text = "\n".join(_news_line(item) for item in news_items[:10])
+
             # Construct input for LLM
             input_text = f"""
 Analyze the macroeconomic context and recent news for {symbol}.
@@ -68,11 +74,11 @@ RECENT NEWS (Past 7 Days):
 {news_text if news_text else "No recent news available"}
 
 NEWS SENTIMENT ANALYSIS:
-- Overall Sentiment: {news_sentiment["sentiment"]}
-- Sentiment Score: {news_sentiment["score"]:.2f}
-- Positive Articles: {news_sentiment.get("positive_articles", 0)}
-- Negative Articles: {news_sentiment.get("negative_articles", 0)}
-- Neutral Articles: {news_sentiment.get("neutral_articles", 0)}
+- Overall Sentiment: {news_sentiment.get("sentiment_label", "neutral")}
+- Sentiment Score: {news_sentiment.get("sentiment_score", 0.0):.2f}
+- Positive Articles: {news_sentiment.get("positive_count", 0)}
+- Negative Articles: {news_sentiment.get("negative_count", 0)}
+- Neutral Articles: {news_sentiment.get("neutral_count", 0)}
 
 Please analyze:
 1. Key macro themes affecting this stock and its sector
@@ -101,15 +107,8 @@ Provide your analysis in the following JSON format:
 
             # Parse JSON response
             try:
-                # Extract JSON from response
-                if "```json" in response:
-                    json_str = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    json_str = response.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response.strip()
-
-                parsed = json.loads(json_str)
+                # Extract JSON from response (handle markdown code blocks)
+                parsed = parse_json_response(response)
 
                 macro_themes = parsed.get("macro_themes", [])
                 key_news = parsed.get("key_news_items", [])
@@ -127,7 +126,7 @@ Provide your analysis in the following JSON format:
                 else:
                     market_sentiment = Sentiment.NEUTRAL
 
-            except (json.JSONDecodeError, KeyError, IndexError) as e:
+            except (JSONDecodeError, KeyError, IndexError) as e:
                 logger.warning("Failed to parse LLM response, using defaults", error=str(e))
                 macro_themes = ["Analysis pending - parsing error"]
                 key_news = []
@@ -1,17 +1,44 @@
 """Market Intelligence Team - Sentiment Analyst."""
 
-import json
+import asyncio
+import re
+from collections import Counter
+from datetime import datetime
+from itertools import islice
 from typing import Any
 
+from ...config import settings
 from ...config.prompts import SENTIMENT_ANALYST_PROMPT
 from ...data.providers import NewsProvider
 from ...data.schemas import AgentRole, Sentiment, SentimentReport
-from ...utils import get_logger
+from ...utils import JSONDecodeError, get_logger, parse_json_response
 from ..base import BaseAgent
 
 
 logger = get_logger(__name__)
 
+# Topic extraction from headlines: words of 5+ letters, minus common filler
+_WORD_RE = re.compile(r"[a-z]{5,}")
+_STOPWORDS = frozenset({"about", "after", "before", "their", "these", "those"})
+TOPIC_WORDS_PER_ARTICLE = 2  # Leading meaningful words counted per headline
+
+# LLM sentiment labels; anything else maps to neutral
+_SENTIMENT_MAP = {
+    "bullish": Sentiment.BULLISH,
+    "positive": Sentiment.BULLISH,
+    "bearish": Sentiment.BEARISH,
+    "negative": Sentiment.BEARISH,
+}
+
+# Validated once and copied on the error path with per-call fields replaced
+_EMPTY_SENTIMENT_REPORT = SentimentReport(
+    symbol="",
+    confidence=0.1,
+    summary="",
+    social_sentiment=Sentiment.NEUTRAL,
+    sentiment_score=0.0,
+)
+
 
 class SentimentAnalyst(BaseAgent):
     """
@@ -26,7 +53,7 @@ class SentimentAnalyst(BaseAgent):
             system_prompt=SENTIMENT_ANALYST_PROMPT,
             temperature=0.6,
         )
-        self.news_provider = NewsProvider()
+        self.news_provider = NewsProvider.shared()
 
     async def analyze(self, context: dict[str, Any]) -> SentimentReport:
         """
@@ -46,47 +73,37 @@ class SentimentAnalyst(BaseAgent):
         logger.info("Starting sentiment analysis", symbol=symbol)
 
         try:
-            # Fetch sentiment data
-            news_sentiment = news_provider.get_news_sentiment(symbol, lookback_days=7)
-            news_items = news_provider.get_news(symbol, limit=15)
+            # Fetch sentiment data and headlines concurrently
+            news_sentiment, news_items = await asyncio.gather(
+                asyncio.to_thread(news_provider.aggregate_sentiment, symbol, days_back=7),
+                asyncio.to_thread(news_provider.get_company_news, symbol, max_articles=15),
+            )
 
-            # Analyze individual news items for trending topics
-            topics = []
+            # Count the leading meaningful title words of each article
+            topic_counts = Counter()
             for item in news_items:
-                # Extract potential topics from titles
-                title_words = item["title"].lower().split()
-                # Filter out common words and keep meaningful ones
-                meaningful_words = [
-                    w
-                    for w in title_words
-                    if len(w) > 4
-                    and w not in ["about", "after", "before", "their", "these", "those"]
-                ]
-                topics.extend(meaningful_words[:2])  # Top 2 words per article
-
-            # Get most common topics
-            from collections import Counter
-
-            topic_counts = Counter(topics)
+                words = (w for w in _WORD_RE.findall(item["title"].lower()) if w not in _STOPWORDS)
+                topic_counts.update(islice(words, TOPIC_WORDS_PER_ARTICLE))
             trending_topics = [topic for topic, _ in topic_counts.most_common(5)]
+            headlines = "\n".join(f"- {item['title']}" for item in islice(news_items, 5))
 
             # Construct input for LLM
             input_text = f"""
 Analyze the sentiment and market mood for {symbol} based on recent news and data.
 
 SENTIMENT DATA:
-- Overall News Sentiment: {news_sentiment["sentiment"]}
-- Sentiment Score: {news_sentiment["score"]:.2f} (range: -1 to 1)
-- News Count (7 days): {news_sentiment["news_count"]}
-- Positive Articles: {news_sentiment.get("positive_articles", 0)}
-- Negative Articles: {news_sentiment.get("negative_articles", 0)}
-- Neutral Articles: {news_sentiment.get("neutral_articles", 0)}
+- Overall News Sentiment: {news_sentiment["sentiment_label"]}
+- Sentiment Score: {news_sentiment["sentiment_score"]:.2f} (range: -1 to 1)
+- News Count (7 days): {news_sentiment["article_count"]}
+- Positive Articles: {news_sentiment.get("positive_count", 0)}
+- Negative Articles: {news_sentiment.get("negative_count", 0)}
+- Neutral Articles: {news_sentiment.get("neutral_count", 0)}
 
 TRENDING TOPICS:
 {", ".join(trending_topics) if trending_topics else "No clear trends identified"}
 
 RECENT HEADLINES:
-{chr(10).join([f"- {item['title']}" for item in news_items[:5]])}
+{headlines}
 
 Please analyze:
 1. Overall social/market sentiment (bullish/bearish/neutral)
@@ -107,23 +124,21 @@ Provide your analysis in JSON format:
 }}
 """
 
-            # Generate analysis
-            response = await self._generate_response(input_text)
+            # Generate analysis, decoding fields while streaming when enabled
+            response, parsed = await self._generate_json(
+                input_text, stream=settings.llm_streaming is True
+            )
 
             # Parse JSON response
             try:
-                # Extract JSON from response
-                if "```json" in response:
-                    json_str = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    json_str = response.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response.strip()
-
-                parsed = json.loads(json_str)
+                # Extract JSON from response (handle markdown code blocks)
+                if parsed is None:
+                    parsed = parse_json_response(response)
 
                 sentiment_str = parsed.get("social_sentiment", "neutral").lower()
-                sentiment_score = float(parsed.get("sentiment_score", news_sentiment["score"]))
+                sentiment_score = float(
+                    parsed.get("sentiment_score", news_sentiment["sentiment_score"])
+                )
                 trending = parsed.get("trending_topics", trending_topics)
                 retail_pos = parsed.get(
                     "retail_positioning", "Mixed sentiment among retail investors"
@@ -133,20 +148,15 @@ Provide your analysis in JSON format:
                 analysis_summary = parsed.get("analysis_summary", response[:500])
 
                 # Map sentiment
-                if sentiment_str in ["bullish", "positive"]:
-                    social_sentiment = Sentiment.BULLISH
-                elif sentiment_str in ["bearish", "negative"]:
-                    social_sentiment = Sentiment.BEARISH
-                else:
-                    social_sentiment = Sentiment.NEUTRAL
+                social_sentiment = _SENTIMENT_MAP.get(sentiment_str, Sentiment.NEUTRAL)
 
                 # Clamp sentiment score
                 sentiment_score = max(-1.0, min(1.0, sentiment_score))
 
-            except (json.JSONDecodeError, KeyError, IndexError, ValueError) as e:
+            except (JSONDecodeError, KeyError, IndexError, ValueError) as e:
                 logger.warning("Failed to parse LLM response, using defaults", error=str(e))
                 social_sentiment = Sentiment.NEUTRAL
-                sentiment_score = news_sentiment["score"]
+                sentiment_score = news_sentiment["sentiment_score"]
                 trending = trending_topics
                 retail_pos = "Unable to determine retail positioning"
                 key_points = ["Analysis pending - parsing error"]
@@ -177,13 +187,11 @@ Provide your analysis in JSON format:
         except Exception as e:
             logger.error("Sentiment analysis failed", symbol=symbol, error=str(e))
 
-            return SentimentReport(
-                symbol=symbol,
-                confidence_level=1,
-                analysis=f"Analysis failed: {str(e)}",
-                key_points=["Analysis error occurred"],
-                social_sentiment=Sentiment.NEUTRAL,
-                sentiment_score=0.0,
-                trending_topics=[],
-                retail_positioning="Error determining positioning",
+            return _EMPTY_SENTIMENT_REPORT.model_copy(
+                update={
+                    "symbol": symbol,
+                    "summary": f"Analysis failed: {str(e)}",
+                    "timestamp": datetime.now(),
+                    "metadata": {"key_points": ["Analysis error occurred"]},
+                }
             )
@@ -1,19 +1,256 @@
 """Market Intelligence Team - Technical Analyst."""
 
-import json
-from typing import Any
+import asyncio
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Union
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from ...config.prompts import TECHNICAL_ANALYST_PROMPT
 from ...data.providers import MarketDataProvider
 from ...data.schemas import AgentRole, TechnicalReport, TrendDirection
-from ...utils import get_logger
+from ...utils import JSONDecodeError, get_logger, parse_json_response
 from ..base import BaseAgent
 
 
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
 logger = get_logger(__name__)
 
+LEVEL_CLUSTER_TOLERANCE = 0.02  # Relative gap that separates support/resistance clusters
+MAX_LEVELS = 5  # Highest support/resistance clusters reported per side
+
+# LLM trend labels; anything else maps to sideways
+_TREND_MAP = {
+    "bullish": TrendDirection.UPTREND,
+    "uptrend": TrendDirection.UPTREND,
+    "up": TrendDirection.UPTREND,
+    "bearish": TrendDirection.DOWNTREND,
+    "downtrend": TrendDirection.DOWNTREND,
+    "down": TrendDirection.DOWNTREND,
+}
+
+# Validated once and copied on the error path; mutable fields and the
+# timestamp are replaced on every copy so reports never share state
+_EMPTY_TECH_REPORT = TechnicalReport(
+    symbol="",
+    confidence=0.1,  # Low confidence on error
+    summary="",
+    trend_direction=TrendDirection.SIDEWAYS,
+)
+
+# Price/indicator columns captured in an IndicatorSnapshot
+_SNAPSHOT_COLUMNS = (
+    "High",
+    "Low",
+    "Close",
+    "SMA_20",
+    "SMA_50",
+    "SMA_200",
+    "MACD",
+    "MACD_Signal",
+    "RSI",
+    "ATR",
+    "BB_Upper",
+    "BB_Lower",
+)
+
+
+@dataclass(frozen=True)
+class IndicatorSnapshot:
+    """
+    Column arrays and last-bar values extracted once per analysis.
+
+    Attributes:
+        columns: Float arrays for each available column in _SNAPSHOT_COLUMNS
+        last: Last-bar value of each available column
+        length: Number of bars
+    """
+
+    columns: dict[str, np.ndarray]
+    last: dict[str, float]
+    length: int
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "IndicatorSnapshot":
+        """
+        Build a snapshot from a price/indicator DataFrame.
+
+        Args:
+            df: DataFrame with price data and optional indicator columns
+
+        Returns:
+            IndicatorSnapshot of the frame
+        """
+        # One hash set instead of an Index membership probe per column
+        available = frozenset(df.columns)
+        columns = {
+            col: df[col].to_numpy(dtype=float) for col in _SNAPSHOT_COLUMNS if col in available
+        }
+        last = {col: float(values[-1]) for col, values in columns.items()} if len(df) else {}
+        return cls(columns=columns, last=last, length=len(df))
+
+
+def _cluster_levels(
+    levels: np.ndarray, tolerance: float = 0.02, keep: Optional[int] = None
+) -> list[float]:
+    """
+    Merge price levels that lie within a relative tolerance of their neighbour.
+
+    Args:
+        levels: Candidate price levels
+        tolerance: Relative gap to the previous sorted level that starts a new cluster
+        keep: If given, only the highest keep clusters are converted and returned
+
+    Returns:
+        Mean of each cluster, in ascending order
+    """
+    if len(levels) == 0:
+        return []
+
+    arr = np.sort(np.asarray(levels, dtype=float))
+    breaks = np.empty(arr.size, dtype=bool)
+    breaks[0] = True
+    breaks[1:] = np.diff(arr) / arr[:-1] >= tolerance
+    starts = np.flatnonzero(breaks)
+    counts = np.diff(np.append(starts, arr.size))
+    means = np.add.reduceat(arr, starts) / counts
+    if keep is not None:
+        means = means[-keep:]
+    return means.tolist()
+
+
+def _is_available(value: Optional[float]) -> bool:
+    """True if an indicator value exists and is not NaN (e.g. SMA_200 on a short history)."""
+    return value is not None and not math.isnan(value)
+
+
+def _format_indicator(value: Optional[float], spec: str = "${:.2f}") -> str:
+    """Render an indicator value for the prompt, or N/A if unavailable."""
+    return spec.format(value) if _is_available(value) else "N/A"
+
+
+def _add_indicator_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the indicator columns the technical analysis reads to a price history.
+
+    Rolling indicators are NaN until enough bars exist for their window.
+
+    Args:
+        df: OHLC price history
+
+    Returns:
+        Copy of df with SMA, MACD, RSI, ATR and Bollinger Band columns
+    """
+    df = df.copy()
+    close = df["Close"]
+
+    df["SMA_20"] = close.rolling(window=20).mean()
+    df["SMA_50"] = close.rolling(window=50).mean()
+    df["SMA_200"] = close.rolling(window=200).mean()
+
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    df["MACD"] = macd
+    df["MACD_Signal"] = macd.ewm(span=9, adjust=False).mean()
+
+    delta = close.diff()
+    avg_gain = delta.clip(lower=0).rolling(window=14).mean()
+    avg_loss = (-delta.clip(upper=0)).rolling(window=14).mean()
+    df["RSI"] = 100 - 100 / (1 + avg_gain / avg_loss)
+
+    prev_close = close.shift(1)
+    true_range = pd.concat(
+        [df["High"] - df["Low"], (df["High"] - prev_close).abs(), (df["Low"] - prev_close).abs()],
+        axis=1,
+    ).max(axis=1)
+    df["ATR"] = true_range.rolling(window=14).mean()
+
+    band = 2 * close.rolling(window=20).std()
+    df["BB_Upper"] = df["SMA_20"] + band
+    df["BB_Lower"] = df["SMA_20"] - band
+
+    return df
+
+
+def _local_extrema(values: np.ndarray, window: int, find_max: bool) -> np.ndarray:
+    """
+    Values of bars equal to the max (or min) of the 2*window+1 bars centred on them.
+
+    Single forward pass keeping a monotonic deque of window indices, written
+    as plain loops so numba can compile it.
+    """
+    n = values.shape[0]
+    span = 2 * window + 1
+    out = np.empty(max(n - 2 * window, 0))
+    count = 0
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        value = values[i]
+        if find_max:
+            while tail > head and values[deque[tail - 1]] <= value:
+                tail -= 1
+        else:
+            while tail > head and values[deque[tail - 1]] >= value:
+                tail -= 1
+        deque[tail] = i
+        tail += 1
+        if deque[head] <= i - span:
+            head += 1
+        if i >= span - 1:
+            center = i - window
+            if values[center] == values[deque[head]]:
+                out[count] = values[center]
+                count += 1
+    return out[:count]
+
+
+def _cluster_sorted(levels: np.ndarray, tolerance: float) -> np.ndarray:
+    """Loop form of _cluster_levels for the compiled kernel."""
+    if levels.shape[0] == 0:
+        return np.empty(0)
+    arr = np.sort(levels)
+    out = np.empty(arr.shape[0])
+    count = 0
+    total = arr[0]
+    members = 1
+    for i in range(1, arr.shape[0]):
+        if (arr[i] - arr[i - 1]) / arr[i - 1] >= tolerance:
+            out[count] = total / members
+            count += 1
+            total = 0.0
+            members = 0
+        total += arr[i]
+        members += 1
+    out[count] = total / members
+    return out[: count + 1]
+
+
+def _sr_kernel(
+    highs: np.ndarray, lows: np.ndarray, window: int, tolerance: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Clustered (support, resistance) levels in one compiled call."""
+    support = _cluster_sorted(_local_extrema(lows, window, False), tolerance)
+    resistance = _cluster_sorted(_local_extrema(highs, window, True), tolerance)
+    return support, resistance
+
+
+if _HAS_NUMBA:
+    _local_extrema = njit(cache=True, fastmath=True)(_local_extrema)
+    _cluster_sorted = njit(cache=True, fastmath=True)(_cluster_sorted)
+    _sr_kernel = njit(cache=True, fastmath=True)(_sr_kernel)
+
 
 class TechnicalAnalyst(BaseAgent):
     """
@@ -29,120 +266,126 @@ class TechnicalAnalyst(BaseAgent):
             system_prompt=TECHNICAL_ANALYST_PROMPT,
             temperature=0.5,
         )
-        self.market_data_provider = MarketDataProvider()
+        self.market_data_provider = MarketDataProvider.shared()
 
     def _identify_support_resistance(
-        self, df: pd.DataFrame, window: int = 20
+        self, data: Union[IndicatorSnapshot, pd.DataFrame], window: int = 20
     ) -> tuple[list[float], list[float]]:
         """
         Identify support and resistance levels using local minima/maxima.
 
         Args:
-            df: DataFrame with price data
+            data: Snapshot (or DataFrame) with price data
             window: Window for local min/max detection
 
         Returns:
             Tuple of (support_levels, resistance_levels)
         """
-        if df.empty or len(df) < window * 2:
+        if isinstance(data, pd.DataFrame):
+            data = IndicatorSnapshot.from_frame(data)
+
+        # Shorter frames have no bar with a full window on both sides
+        if data.length <= window * 2:
             return [], []
 
-        highs = df["High"].values
-        lows = df["Low"].values
+        highs = data.columns["High"]
+        lows = data.columns["Low"]
+
+        if _HAS_NUMBA:
+            # Extrema search and clustering in one native pass
+            support, resistance = _sr_kernel(
+                np.ascontiguousarray(highs),
+                np.ascontiguousarray(lows),
+                window,
+                LEVEL_CLUSTER_TOLERANCE,
+            )
+            return support[-MAX_LEVELS:].tolist(), resistance[-MAX_LEVELS:].tolist()
+
+        # A bar is a local extremum if it equals the max/min of the
+        # 2*window+1 bars centred on it; all windows are reduced in one pass.
+        # The O(n) monotonic deque lives in the compiled kernel above: run by
+        # the interpreter it is slower than this vectorized reduction even
+        # on 50k-bar intraday histories with wide windows
+        span = 2 * window + 1
+        center_highs = highs[window : len(highs) - window]
+        center_lows = lows[window : len(lows) - window]
 
         # Find local maxima (resistance)
-        resistance = []
-        for i in range(window, len(highs) - window):
-            if highs[i] == max(highs[i - window : i + window + 1]):
-                resistance.append(float(highs[i]))
+        resistance_mask = center_highs == sliding_window_view(highs, span).max(axis=1)
+        resistance = center_highs[resistance_mask]
 
         # Find local minima (support)
-        support = []
-        for i in range(window, len(lows) - window):
-            if lows[i] == min(lows[i - window : i + window + 1]):
-                support.append(float(lows[i]))
-
-        # Cluster nearby levels (within 2%)
-        def cluster_levels(levels: list[float], tolerance: float = 0.02) -> list[float]:
-            if not levels:
-                return []
-
-            levels = sorted(levels)
-            clustered = []
-            current_cluster = [levels[0]]
-
-            for level in levels[1:]:
-                if abs(level - current_cluster[-1]) / current_cluster[-1] < tolerance:
-                    current_cluster.append(level)
-                else:
-                    clustered.append(sum(current_cluster) / len(current_cluster))
-                    current_cluster = [level]
+        support_mask = center_lows == sliding_window_view(lows, span).min(axis=1)
+        support = center_lows[support_mask]
 
-            clustered.append(sum(current_cluster) / len(current_cluster))
-            return clustered
-
-        support_levels = cluster_levels(support)[-5:]  # Top 5 support levels
-        resistance_levels = cluster_levels(resistance)[-5:]  # Top 5 resistance levels
+        # Cluster nearby levels and keep the top MAX_LEVELS of each; only those
+        # are converted to Python floats
+        support_levels = _cluster_levels(support, LEVEL_CLUSTER_TOLERANCE, MAX_LEVELS)
+        resistance_levels = _cluster_levels(resistance, LEVEL_CLUSTER_TOLERANCE, MAX_LEVELS)
 
         return support_levels, resistance_levels
 
-    def _detect_chart_patterns(self, df: pd.DataFrame) -> list[str]:
+    def _detect_chart_patterns(self, data: Union[IndicatorSnapshot, pd.DataFrame]) -> list[str]:
         """
         Detect basic chart patterns.
 
         Args:
-            df: DataFrame with price and indicator data
+            data: Snapshot (or DataFrame) with price and indicator data
 
         Returns:
             List of detected patterns
         """
         patterns = []
 
-        if df.empty or len(df) < 50:
+        if isinstance(data, pd.DataFrame):
+            data = IndicatorSnapshot.from_frame(data)
+
+        if data.length < 50:
             return patterns
 
         try:
-            # Get recent data
-            recent = df.tail(50)
-            close = recent["Close"]
+            # The checks below only need the last two points and the close
+            # 20 bars back
+            arr = data.columns
+            close = arr["Close"]
 
             # Moving average crossovers
-            if "SMA_20" in recent.columns and "SMA_50" in recent.columns:
-                sma20 = recent["SMA_20"]
-                sma50 = recent["SMA_50"]
+            if "SMA_20" in arr and "SMA_50" in arr:
+                sma20 = arr["SMA_20"]
+                sma50 = arr["SMA_50"]
 
                 # Golden cross
-                if sma20.iloc[-2] < sma50.iloc[-2] and sma20.iloc[-1] > sma50.iloc[-1]:
+                if sma20[-2] < sma50[-2] and sma20[-1] > sma50[-1]:
                     patterns.append("Golden Cross (SMA 20/50)")
 
                 # Death cross
-                if sma20.iloc[-2] > sma50.iloc[-2] and sma20.iloc[-1] < sma50.iloc[-1]:
+                if sma20[-2] > sma50[-2] and sma20[-1] < sma50[-1]:
                     patterns.append("Death Cross (SMA 20/50)")
 
             # MACD crossover
-            if "MACD" in recent.columns and "MACD_Signal" in recent.columns:
-                macd = recent["MACD"]
-                signal = recent["MACD_Signal"]
+            if "MACD" in arr and "MACD_Signal" in arr:
+                macd = arr["MACD"]
+                signal = arr["MACD_Signal"]
 
-                if macd.iloc[-2] < signal.iloc[-2] and macd.iloc[-1] > signal.iloc[-1]:
+                if macd[-2] < signal[-2] and macd[-1] > signal[-1]:
                     patterns.append("MACD Bullish Crossover")
 
-                if macd.iloc[-2] > signal.iloc[-2] and macd.iloc[-1] < signal.iloc[-1]:
+                if macd[-2] > signal[-2] and macd[-1] < signal[-1]:
                     patterns.append("MACD Bearish Crossover")
 
             # RSI levels
-            if "RSI" in recent.columns:
-                rsi = recent["RSI"].iloc[-1]
+            if "RSI" in arr:
+                rsi = arr["RSI"][-1]
                 if rsi > 70:
                     patterns.append("RSI Overbought (>70)")
                 elif rsi < 30:
                     patterns.append("RSI Oversold (<30)")
 
             # Bollinger Bands
-            if all(col in recent.columns for col in ["BB_Upper", "BB_Lower", "Close"]):
-                close_val = close.iloc[-1]
-                bb_upper = recent["BB_Upper"].iloc[-1]
-                bb_lower = recent["BB_Lower"].iloc[-1]
+            if "BB_Upper" in arr and "BB_Lower" in arr:
+                close_val = close[-1]
+                bb_upper = arr["BB_Upper"][-1]
+                bb_lower = arr["BB_Lower"][-1]
 
                 if close_val > bb_upper:
                     patterns.append("Price Above Upper Bollinger Band")
@@ -151,7 +394,7 @@ class TechnicalAnalyst(BaseAgent):
 
             # Price trend
             if len(close) >= 20:
-                recent_change = (close.iloc[-1] - close.iloc[-20]) / close.iloc[-20] * 100
+                recent_change = (close[-1] - close[-20]) / close[-20] * 100
                 if recent_change > 10:
                     patterns.append(f"Strong Uptrend (+{recent_change:.1f}% in 20 days)")
                 elif recent_change < -10:
@@ -180,32 +423,36 @@ class TechnicalAnalyst(BaseAgent):
         logger.info("Starting technical analysis", symbol=symbol)
 
         try:
-            # Fetch price data
-            price_data = data_provider.get_price_history(symbol, period="6mo", interval="1d")
+            # Fetch price data off the event loop so other analysts keep running
+            price_data = await asyncio.to_thread(
+                data_provider.get_price_history, symbol, period="6mo", interval="1d"
+            )
 
             if price_data.empty:
                 raise ValueError("No price data available")
 
             # Calculate technical indicators
-            price_data = data_provider.calculate_technical_indicators(price_data)
+            price_data = await asyncio.to_thread(_add_indicator_columns, price_data)
+
+            # Extract column arrays and last-bar values once for all helpers
+            snapshot = IndicatorSnapshot.from_frame(price_data)
+            last = snapshot.last
 
             # Identify support and resistance
-            support_levels, resistance_levels = self._identify_support_resistance(price_data)
+            support_levels, resistance_levels = self._identify_support_resistance(snapshot)
 
             # Detect chart patterns
-            chart_patterns = self._detect_chart_patterns(price_data)
+            chart_patterns = self._detect_chart_patterns(snapshot)
 
             # Get current price and indicators
-            current_price = float(price_data["Close"].iloc[-1])
-            current_rsi = float(price_data["RSI"].iloc[-1]) if "RSI" in price_data.columns else None
-            current_macd = (
-                float(price_data["MACD"].iloc[-1]) if "MACD" in price_data.columns else None
-            )
+            current_price = last["Close"]
+            current_rsi = last.get("RSI")
+            current_macd = last.get("MACD")
 
             # Determine trend
-            if "SMA_50" in price_data.columns and "SMA_200" in price_data.columns:
-                sma50 = price_data["SMA_50"].iloc[-1]
-                sma200 = price_data["SMA_200"].iloc[-1]
+            if _is_available(last.get("SMA_50")) and _is_available(last.get("SMA_200")):
+                sma50 = last["SMA_50"]
+                sma200 = last["SMA_200"]
 
                 if current_price > sma50 > sma200:
                     trend_direction = TrendDirection.UPTREND
@@ -218,9 +465,8 @@ class TechnicalAnalyst(BaseAgent):
                     trend_desc = "sideways"
             else:
                 # Fallback to simple price momentum
-                price_change = (
-                    price_data["Close"].iloc[-1] - price_data["Close"].iloc[-20]
-                ) / price_data["Close"].iloc[-20]
+                close = snapshot.columns["Close"]
+                price_change = (close[-1] - close[-20]) / close[-20]
                 if price_change > 0.05:
                     trend_direction = TrendDirection.UPTREND
                     trend_desc = "uptrend"
@@ -231,16 +477,31 @@ class TechnicalAnalyst(BaseAgent):
                     trend_direction = TrendDirection.SIDEWAYS
                     trend_desc = "sideways"
 
-            # Prepare indicators for LLM
-            indicators_text = f"""
-- Current Price: ${current_price:.2f}
-- RSI (14): {current_rsi:.2f if current_rsi else 'N/A'}
-- MACD: {current_macd:.4f if current_macd else 'N/A'}
-- 20-day SMA: ${price_data["SMA_20"].iloc[-1]:.2f if 'SMA_20' in price_data.columns else 'N/A'}
-- 50-day SMA: ${price_data["SMA_50"].iloc[-1]:.2f if 'SMA_50' in price_data.columns else 'N/A'}
-- 200-day SMA: ${price_data["SMA_200"].iloc[-1]:.2f if 'SMA_200' in price_data.columns else 'N/A'}
-- ATR: ${price_data["ATR"].iloc[-1]:.2f if 'ATR' in price_data.columns else 'N/A'}
-"""
+            # Prepare indicators for LLM; values are rendered up front so a
+            # missing or NaN indicator shows as N/A instead of breaking the format
+            rsi_s = _format_indicator(current_rsi, "{:.2f}")
+            macd_s = _format_indicator(current_macd, "{:.4f}")
+            sma20_s = _format_indicator(last.get("SMA_20"))
+            sma50_s = _format_indicator(last.get("SMA_50"))
+            sma200_s = _format_indicator(last.get("SMA_200"))
+            atr_s = _format_indicator(last.get("ATR"))
+            indicators_text = "\n".join(
+                [
+                    f"- Current Price: ${current_price:.2f}",
+                    f"- RSI (14): {rsi_s}",
+                    f"- MACD: {macd_s}",
+                    f"- 20-day SMA: {sma20_s}",
+                    f"- 50-day SMA: {sma50_s}",
+                    f"- 200-day SMA: {sma200_s}",
+                    f"- ATR: {atr_s}",
+                ]
+            )
+
+            # Render level and pattern lists outside the f-string (no backslashes
+            # allowed in its expressions before Python 3.12)
+            support_text = ", ".join(f"${level:.2f}" for level in support_levels)
+            resistance_text = ", ".join(f"${level:.2f}" for level in resistance_levels)
+            patterns_text = "\n".join(f"- {pattern}" for pattern in chart_patterns)
 
             # Construct input for LLM
             input_text = f"""
@@ -254,13 +515,13 @@ TECHNICAL INDICATORS:
 {indicators_text}
 
 SUPPORT LEVELS:
-{", ".join([f"${level:.2f}" for level in support_levels]) if support_levels else "None identified"}
+{support_text or "None identified"}
 
 RESISTANCE LEVELS:
-{", ".join([f"${level:.2f}" for level in resistance_levels]) if resistance_levels else "None identified"}
+{resistance_text or "None identified"}
 
 DETECTED PATTERNS:
-{chr(10).join([f"- {pattern}" for pattern in chart_patterns]) if chart_patterns else "- No significant patterns detected"}
+{patterns_text or "- No significant patterns detected"}
 
 Please provide your technical analysis in JSON format:
 {{
@@ -277,14 +538,8 @@ Please provide your technical analysis in JSON format:
 
             # Parse JSON response
             try:
-                if "```json" in response:
-                    json_str = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    json_str = response.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response.strip()
-
-                parsed = json.loads(json_str)
+                # Extract JSON from response (handle markdown code blocks)
+                parsed = parse_json_response(response)
 
                 trend_str = parsed.get("trend_direction", trend_desc).lower()
                 key_points = parsed.get("key_points", [])
@@ -293,14 +548,9 @@ Please provide your technical analysis in JSON format:
                 analysis_summary = parsed.get("analysis_summary", response[:500])
 
                 # Map trend
-                if trend_str in ["bullish", "uptrend", "up"]:
-                    final_trend = TrendDirection.UPTREND
-                elif trend_str in ["bearish", "downtrend", "down"]:
-                    final_trend = TrendDirection.DOWNTREND
-                else:
-                    final_trend = TrendDirection.SIDEWAYS
+                final_trend = _TREND_MAP.get(trend_str, TrendDirection.SIDEWAYS)
 
-            except (json.JSONDecodeError, KeyError, IndexError) as e:
+            except (JSONDecodeError, KeyError, IndexError) as e:
                 logger.warning("Failed to parse LLM response, using defaults", error=str(e))
                 final_trend = trend_direction
                 pattern_interp = chart_patterns
@@ -312,18 +562,10 @@ Please provide your technical analysis in JSON format:
                 "current_price": current_price,
                 "rsi": current_rsi,
                 "macd": current_macd,
-                "sma_20": (
-                    float(price_data["SMA_20"].iloc[-1]) if "SMA_20" in price_data.columns else None
-                ),
-                "sma_50": (
-                    float(price_data["SMA_50"].iloc[-1]) if "SMA_50" in price_data.columns else None
-                ),
-                "sma_200": (
-                    float(price_data["SMA_200"].iloc[-1])
-                    if "SMA_200" in price_data.columns
-                    else None
-                ),
-                "atr": (float(price_data["ATR"].iloc[-1]) if "ATR" in price_data.columns else None),
+                "sma_20": last.get("SMA_20"),
+                "sma_50": last.get("SMA_50"),
+                "sma_200": last.get("SMA_200"),
+                "atr": last.get("ATR"),
             }
 
             report = TechnicalReport(
@@ -349,13 +591,15 @@ Please provide your technical analysis in JSON format:
         except Exception as e:
             logger.error("Technical analysis failed", symbol=symbol, error=str(e))
 
-            return TechnicalReport(
-                symbol=symbol,
-                confidence=0.1,  # Low confidence on error
-                summary=f"Analysis failed: {str(e)}",
-                trend_direction=TrendDirection.SIDEWAYS,
-                support_levels=[],
-                resistance_levels=[],
-                indicators={},
-                chart_patterns=[],
+            return _EMPTY_TECH_REPORT.model_copy(
+                update={
+                    "symbol": symbol,
+                    "summary": f"Analysis failed: {str(e)}",
+                    "timestamp": datetime.now(),
+                    "support_levels": [],
+                    "resistance_levels": [],
+                    "indicators": {},
+                    "chart_patterns": [],
+                    "metadata": {},
+                }
             )
@@ -8,13 +8,12 @@ Note:
     due to dependency conflicts with custom PyTorch requirements.
 """
 
-import base64
-import json
-from io import BytesIO
+import asyncio
 from pathlib import Path
 from typing import Any, Optional
 
 import aiohttp
+from pydantic import BaseModel, Field
 
 from ...config import settings
 from ...config.prompts import JANUS_VISUAL_ANALYST_PROMPT
@@ -22,12 +21,83 @@ from ...data.schemas import (
     AgentRole,
     JanusVisualReport,
 )
-from ...utils import get_logger
+from ...utils import TTLCache, get_logger, json_dumps
 from ..base import BaseAgent
+from ._charts import render_chart
+from ._http import close_session, get_session
+
+
+try:
+    # SIMD-accelerated, accepts any buffer; same output as the stdlib encoder
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 
 
 logger = get_logger(__name__)
 
+CHART_PERIODS = 60  # Most recent bars drawn on a generated chart
+FALLBACK_PERIODS = 20  # Most recent bars summarized for the LLM fallback
+CHART_CACHE_SIZE = 64  # Rendered charts kept across analyses
+
+# Lower-case OHLCV names from data providers -> the names render_chart expects
+_CHART_COLUMNS = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "volume": "Volume",
+}
+
+# Janus-Pro request prompt, split around the symbol so only it is spliced in per call
+_JANUS_PROMPT_HEAD = "Analyze this "
+_JANUS_PROMPT_TAIL = """ candlestick chart for visual patterns.
+
+Identify:
+1. Chart patterns (Head & Shoulders, Double Top/Bottom, Triangles, etc.)
+2. Trend lines and channels
+3. Support/Resistance zones
+4. Candlestick patterns
+5. Volume patterns
+
+Provide structured JSON output with pattern details and confidence scores.
+"""
+
+# (symbol, last bar, bar count) -> base64 image; expires with the market data cache
+# so a bar still forming is redrawn once its data is refreshed
+_CHART_CACHE = TTLCache(maxsize=CHART_CACHE_SIZE, ttl=settings.market_data_cache_ttl)
+
+
+class _PatternReply(BaseModel):
+    """One chart pattern in the LLM fallback reply."""
+
+    name: str
+    confidence: float = Field(ge=0.0, le=1.0)
+    stage: str = Field(description="forming or complete")
+
+
+class _LevelsReply(BaseModel):
+    """Support and resistance levels in the LLM fallback reply."""
+
+    support: list[float] = Field(default_factory=list)
+    resistance: list[float] = Field(default_factory=list)
+
+
+class _FallbackReply(BaseModel):
+    """Schema the LLM fallback analysis is generated against."""
+
+    patterns_detected: list[_PatternReply] = Field(default_factory=list)
+    trend_analysis: str = ""
+    support_resistance: _LevelsReply = Field(default_factory=_LevelsReply)
+    trading_implications: str = ""
+    confidence_score: float = Field(default=0.5, ge=0.0, le=1.0)
+    summary: str = Field(description="Brief summary of the analysis")
+
+
+def _encode_file(path: Path) -> str:
+    """Read a chart image file and base64-encode it."""
+    return b64encode(path.read_bytes()).decode("ascii")
+
 
 class JanusVisualAnalyst(BaseAgent):
     """
@@ -54,18 +124,14 @@ class JanusVisualAnalyst(BaseAgent):
             system_prompt=JANUS_VISUAL_ANALYST_PROMPT,
             temperature=0.4,
         )
-        self._session: Optional[aiohttp.ClientSession] = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+        """Get the keep-alive session shared by all model service clients."""
+        return get_session()
 
     async def close(self):
-        """Close the aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the shared HTTP session (reopened on the next request)."""
+        await close_session()
 
     async def analyze(self, context: dict[str, Any]) -> JanusVisualReport:
         """
@@ -95,7 +161,7 @@ class JanusVisualAnalyst(BaseAgent):
 
             # Check if Janus-Pro service is enabled
             if settings.janus_pro_enabled:
-                report = await self._analyze_with_janus(symbol, chart_image)
+                report = await self._analyze_with_janus(symbol, chart_image, context)
             else:
                 # Fallback to LLM-based analysis with description
                 report = await self._analyze_with_llm_fallback(symbol, context)
@@ -104,6 +170,7 @@ class JanusVisualAnalyst(BaseAgent):
                 "Visual analysis complete",
                 symbol=symbol,
                 patterns_found=len(report.patterns_detected),
+                image_bytes=len(chart_image),
             )
 
             return report
@@ -116,6 +183,27 @@ class JanusVisualAnalyst(BaseAgent):
                 confidence=0.1,
             )
 
+    async def analyze_batch(self, contexts: list[dict[str, Any]]) -> list[JanusVisualReport]:
+        """
+        Analyze charts for several symbols concurrently.
+
+        At most settings.janus_pro_max_concurrent analyses run at once, so the
+        Janus-Pro service is not flooded.
+
+        Args:
+            contexts: One analyze() context per symbol
+
+        Returns:
+            JanusVisualReports in the same order as contexts
+        """
+        semaphore = asyncio.Semaphore(settings.janus_pro_max_concurrent)
+
+        async def analyze_one(context: dict[str, Any]) -> JanusVisualReport:
+            async with semaphore:
+                return await self.analyze(context)
+
+        return await asyncio.gather(*(analyze_one(context) for context in contexts))
+
     async def _get_chart_image(self, context: dict[str, Any]) -> Optional[str]:
         """
         Get chart image from context or generate one.
@@ -130,12 +218,11 @@ class JanusVisualAnalyst(BaseAgent):
         if "chart_image" in context:
             return context["chart_image"]
 
-        # Check for file path
+        # Check for file path; read and encode off the event loop
         if "chart_path" in context:
             chart_path = Path(context["chart_path"])
             if chart_path.exists():
-                with open(chart_path, "rb") as f:
-                    return base64.b64encode(f.read()).decode("utf-8")
+                return await asyncio.to_thread(_encode_file, chart_path)
 
         # Generate chart from price data if available
         if "chart_data" in context or "price_history" in context:
@@ -147,50 +234,51 @@ class JanusVisualAnalyst(BaseAgent):
         """
         Generate a candlestick chart image from price data.
 
-        Uses mplfinance for chart generation.
+        Charts are drawn with Pillow in a worker thread. Renders are cached per
+        symbol and last bar, so re-analysing within the same bar skips drawing.
 
         Args:
             context: Contains 'chart_data' or 'price_history' DataFrame
 
         Returns:
-            Base64 encoded PNG image
+            Base64 encoded chart image
         """
         try:
-            import mplfinance as mpf
-
-            df = context.get("chart_data") or context.get("price_history")
+            # DataFrames have no truth value, so test for None explicitly
+            df = context.get("chart_data")
+            if df is None:
+                df = context.get("price_history")
 
             if df is None or df.empty:
                 return None
 
-            # Ensure proper column names
-            df = df.copy()
-            df.columns = [c.title() for c in df.columns]
-
-            # Generate candlestick chart
-            buf = BytesIO()
-            mpf.plot(
-                df.tail(60),  # Last 60 periods
-                type="candle",
-                style="charles",
-                volume=True,
-                mav=(10, 20, 50),
-                savefig={"fname": buf, "format": "png", "dpi": 150},
-                figsize=(12, 8),
-            )
-            buf.seek(0)
+            # Key on the frame's last bar, so cache hits return before any slicing
+            cache_key = (context.get("symbol"), df.index[-1], min(len(df), CHART_PERIODS))
+            cached = _CHART_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Ensure proper column names; tail() returns a new frame, so
+            # relabelling it leaves the caller's frame untouched
+            window = df.tail(CHART_PERIODS)
+            window.columns = [_CHART_COLUMNS.get(c, c) for c in window.columns]
 
-            return base64.b64encode(buf.read()).decode("utf-8")
+            # Generate candlestick chart off the event loop
+            image = await asyncio.to_thread(render_chart, window)
+
+            encoded = b64encode(image).decode("ascii")
+            _CHART_CACHE[cache_key] = encoded
+            return encoded
 
         except ImportError:
-            logger.warning("mplfinance not installed, cannot generate charts")
+            logger.warning("Pillow not installed, cannot generate charts")
             return None
         except Exception as e:
             logger.warning("Failed to generate chart", error=str(e))
             return None
 
     async def _analyze_with_janus(
-        self, symbol: str, chart_image: str
+        self, symbol: str, chart_image: str, context: dict[str, Any]
     ) -> JanusVisualReport:
         """
         Analyze chart using Janus-Pro REST API.
@@ -198,6 +286,7 @@ class JanusVisualAnalyst(BaseAgent):
         Args:
             symbol: Stock symbol
             chart_image: Base64 encoded image
+            context: Analysis context, passed to the LLM fallback on failure
 
         Returns:
             JanusVisualReport from Janus-Pro
@@ -206,29 +295,15 @@ class JanusVisualAnalyst(BaseAgent):
 
         payload = {
             "image": chart_image,
-            "prompt": f"""Analyze this {symbol} candlestick chart for visual patterns.
-
-Identify:
-1. Chart patterns (Head & Shoulders, Double Top/Bottom, Triangles, etc.)
-2. Trend lines and channels
-3. Support/Resistance zones
-4. Candlestick patterns
-5. Volume patterns
-
-Provide structured JSON output with pattern details and confidence scores.
-""",
+            "prompt": _JANUS_PROMPT_HEAD + symbol + _JANUS_PROMPT_TAIL,
         }
 
         try:
             endpoint = f"{settings.janus_pro_endpoint}/analyze"
-            async with session.post(
-                endpoint,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as response:
+            async with session.post(endpoint, json=payload) as response:
                 if response.status == 200:
                     result = await response.json()
-                    return self._parse_janus_response(symbol, result, chart_image)
+                    return self._parse_janus_response(symbol, result)
                 else:
                     error = await response.text()
                     logger.warning(
@@ -236,19 +311,13 @@ Provide structured JSON output with pattern details and confidence scores.
                         status=response.status,
                         error=error,
                     )
-                    return await self._analyze_with_llm_fallback(
-                        symbol, {"chart_image": chart_image}
-                    )
+                    return await self._analyze_with_llm_fallback(symbol, context)
 
         except aiohttp.ClientError as e:
             logger.warning("Janus-Pro connection failed", error=str(e))
-            return await self._analyze_with_llm_fallback(
-                symbol, {"chart_image": chart_image}
-            )
+            return await self._analyze_with_llm_fallback(symbol, context)
 
-    def _parse_janus_response(
-        self, symbol: str, result: dict, chart_image: str
-    ) -> JanusVisualReport:
+    def _parse_janus_response(self, symbol: str, result: dict) -> JanusVisualReport:
         """Parse Janus-Pro API response into a report."""
         patterns = result.get("patterns", [])
         confidence = result.get("confidence", 0.5)
@@ -275,7 +344,6 @@ Provide structured JSON output with pattern details and confidence scores.
             support_resistance_visual=result.get("levels", {}),
             pattern_confluence=result.get("confluence", []),
             trading_implications=result.get("implications", ""),
-            image_analyzed=chart_image[:100] + "...",  # Truncate for logging
         )
 
     async def _analyze_with_llm_fallback(
@@ -297,13 +365,16 @@ Provide structured JSON output with pattern details and confidence scores.
 
         # Build prompt from available data
         technical_data = context.get("technical_indicators", {})
-        price_data = context.get("chart_data") or context.get("price_history")
+        # DataFrames have no truth value, so test for None explicitly
+        price_data = context.get("chart_data")
+        if price_data is None:
+            price_data = context.get("price_history")
 
         if price_data is not None and not price_data.empty:
-            recent = price_data.tail(20)
-            current_close = recent["Close"].iloc[-1]
-            high_max = recent["High"].max()
-            low_min = recent["Low"].min()
+            # Slice the raw arrays rather than building a Series per statistic
+            current_close = float(price_data["Close"].to_numpy()[-1])
+            high_max = float(price_data["High"].to_numpy()[-FALLBACK_PERIODS:].max())
+            low_min = float(price_data["Low"].to_numpy()[-FALLBACK_PERIODS:].min())
             # Avoid division by zero
             range_pct = (
                 ((high_max - low_min) / current_close * 100)
@@ -311,7 +382,7 @@ Provide structured JSON output with pattern details and confidence scores.
                 else 0.0
             )
             price_summary = f"""
-Recent price action (last 20 periods):
+Recent price action (last {FALLBACK_PERIODS} periods):
 - High: ${high_max:.2f}
 - Low: ${low_min:.2f}
 - Current: ${current_close:.2f}
@@ -327,48 +398,27 @@ that would be visible if analyzing a candlestick chart:
 {price_summary}
 
 Technical Indicators:
-{json.dumps(technical_data, indent=2) if technical_data else "Not available"}
-
-Identify patterns and provide analysis in JSON format:
-{{
-    "patterns_detected": [
-        {{"name": "pattern_name", "confidence": 0.0-1.0, "stage": "forming/complete"}}
-    ],
-    "trend_analysis": "description",
-    "support_resistance": {{"support": [], "resistance": []}},
-    "trading_implications": "implications",
-    "confidence_score": 0.0-1.0,
-    "summary": "brief summary"
-}}
-"""
+{json_dumps(technical_data, indent=True) if technical_data else "Not available"}
 
-        response = await self._generate_response(prompt)
+Identify the patterns and provide your analysis.
+"""
 
         try:
-            # Parse JSON response
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = response.strip()
-
-            parsed = json.loads(json_str)
-
-            return JanusVisualReport(
-                symbol=symbol,
-                summary=parsed.get("summary", "LLM-based pattern analysis"),
-                confidence=parsed.get("confidence_score", 0.5),
-                patterns_detected=parsed.get("patterns_detected", []),
-                trend_analysis=parsed.get("trend_analysis", ""),
-                support_resistance_visual=parsed.get("support_resistance", {}),
-                trading_implications=parsed.get("trading_implications", ""),
-            )
-
-        except (json.JSONDecodeError, KeyError) as e:
+            reply = await self._generate_structured(prompt, _FallbackReply)
+        except ValueError as e:
             logger.warning("Failed to parse LLM fallback response", error=str(e))
             return JanusVisualReport(
                 symbol=symbol,
-                summary=response[:500],
+                summary="LLM-based pattern analysis unavailable",
                 confidence=0.3,
             )
+
+        return JanusVisualReport(
+            symbol=symbol,
+            summary=reply.summary,
+            confidence=reply.confidence_score,
+            patterns_detected=[p.model_dump() for p in reply.patterns_detected],
+            trend_analysis=reply.trend_analysis,
+            support_resistance_visual=reply.support_resistance.model_dump(),
+            trading_implications=reply.trading_implications,
+        )
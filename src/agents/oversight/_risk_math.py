@@ -0,0 +1,171 @@
+"""Hard risk-limit arithmetic for the Risk Manager.
+
+Plain scalar functions and loops over floats, so numba can compile them
+when it is installed; without numba they run as ordinary Python, and the
+batch check falls back to NumPy array expressions.
+"""
+
+import numpy as np
+
+
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+    prange = range
+
+
+def hard_limits(
+    portfolio_value: float,
+    position_size_pct: float,
+    max_loss: float,
+    current_var: float,
+    current_sector_exposure: float,
+    max_position_size: float,
+    max_portfolio_risk: float,
+    max_sector_concentration: float,
+) -> tuple[bool, bool, bool, float, float, float, float, float, float]:
+    """
+    Evaluate one proposal against the position, VaR and sector limits.
+
+    Returns:
+        Tuple of (position_size_ok, var_ok, sector_ok, position_value,
+        max_position_value, estimated_var, projected_var, var_limit,
+        sector_concentration)
+    """
+    position_value = portfolio_value * position_size_pct
+    max_position_value = portfolio_value * max_position_size
+
+    # Simplified VaR: the proposal's max loss applied to the position
+    estimated_var = abs(max_loss) / 100.0 * position_value
+    projected_var = current_var + estimated_var
+    var_limit = portfolio_value * max_portfolio_risk
+
+    sector_concentration = (current_sector_exposure + position_value) / portfolio_value
+
+    return (
+        position_value <= max_position_value,
+        projected_var <= var_limit,
+        sector_concentration <= max_sector_concentration,
+        position_value,
+        max_position_value,
+        estimated_var,
+        projected_var,
+        var_limit,
+        sector_concentration,
+    )
+
+
+def _hard_limits_rows(
+    portfolio_value: float,
+    position_size_pcts: np.ndarray,
+    max_losses: np.ndarray,
+    current_var: float,
+    current_sector_exposure: float,
+    max_position_size: float,
+    max_portfolio_risk: float,
+    max_sector_concentration: float,
+    checks: np.ndarray,
+    values: np.ndarray,
+):
+    """Loop form of hard_limits_batch for the compiled kernel; fills checks and values."""
+    max_position_value = portfolio_value * max_position_size
+    var_limit = portfolio_value * max_portfolio_risk
+    for i in prange(position_size_pcts.shape[0]):
+        position_value = portfolio_value * position_size_pcts[i]
+        estimated_var = abs(max_losses[i]) / 100.0 * position_value
+        projected_var = current_var + estimated_var
+        sector_concentration = (current_sector_exposure + position_value) / portfolio_value
+
+        checks[i, 0] = position_value <= max_position_value
+        checks[i, 1] = projected_var <= var_limit
+        checks[i, 2] = sector_concentration <= max_sector_concentration
+        values[i, 0] = position_value
+        values[i, 1] = max_position_value
+        values[i, 2] = estimated_var
+        values[i, 3] = projected_var
+        values[i, 4] = var_limit
+        values[i, 5] = sector_concentration
+
+
+if _HAS_NUMBA:
+    hard_limits = njit(cache=True)(hard_limits)
+    _hard_limits_rows = njit(cache=True, parallel=True)(_hard_limits_rows)
+
+
+def hard_limits_batch(
+    portfolio_value: float,
+    position_size_pcts: np.ndarray,
+    max_losses: np.ndarray,
+    current_var: float,
+    current_sector_exposure: float,
+    max_position_size: float,
+    max_portfolio_risk: float,
+    max_sector_concentration: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate many proposals against one portfolio in a single pass.
+
+    Args:
+        portfolio_value: Total portfolio value
+        position_size_pcts: Position size of each proposal (fraction of portfolio)
+        max_losses: Max loss of each proposal (percent)
+        current_var: Portfolio VaR before any of the proposals
+        current_sector_exposure: Exposure already held in the proposals' sector
+        max_position_size: Position size limit (fraction of portfolio)
+        max_portfolio_risk: VaR limit (fraction of portfolio)
+        max_sector_concentration: Sector concentration limit (fraction)
+
+    Returns:
+        Tuple of (checks, values): an (n, 3) bool array of position/VaR/sector
+        checks and an (n, 6) array of position_value, max_position_value,
+        estimated_var, projected_var, var_limit and sector_concentration
+    """
+    position_size_pcts = np.ascontiguousarray(position_size_pcts, dtype=np.float64)
+    max_losses = np.ascontiguousarray(max_losses, dtype=np.float64)
+    count = position_size_pcts.shape[0]
+
+    if _HAS_NUMBA:
+        checks = np.empty((count, 3), dtype=np.bool_)
+        values = np.empty((count, 6))
+        _hard_limits_rows(
+            portfolio_value,
+            position_size_pcts,
+            max_losses,
+            current_var,
+            current_sector_exposure,
+            max_position_size,
+            max_portfolio_risk,
+            max_sector_concentration,
+            checks,
+            values,
+        )
+        return checks, values
+
+    position_value = portfolio_value * position_size_pcts
+    max_position_value = np.full(count, portfolio_value * max_position_size)
+    estimated_var = np.abs(max_losses) / 100.0 * position_value
+    projected_var = current_var + estimated_var
+    var_limit = np.full(count, portfolio_value * max_portfolio_risk)
+    sector_concentration = (current_sector_exposure + position_value) / portfolio_value
+
+    checks = np.column_stack(
+        (
+            position_value <= max_position_value,
+            projected_var <= var_limit,
+            sector_concentration <= max_sector_concentration,
+        )
+    )
+    values = np.column_stack(
+        (
+            position_value,
+            max_position_value,
+            estimated_var,
+            projected_var,
+            var_limit,
+            sector_concentration,
+        )
+    )
+    return checks, values
@@ -1,8 +1,9 @@
 """Oversight & Learning Team - Portfolio Manager."""
 
-import json
 from typing import Any
 
+from pydantic import BaseModel, Field
+
 from ...config.prompts import PORTFOLIO_MANAGER_PROMPT
 from ...data.schemas import (
     AgentRole,
@@ -17,6 +18,19 @@ from ..base import CriticalAgent
 logger = get_logger(__name__)
 
 
+class _DecisionReply(BaseModel):
+    """Schema the LLM's final decision is generated against."""
+
+    approved: bool = Field(description="Whether the trade is approved")
+    rationale: str = Field(description="Explanation of the decision")
+    monitoring_requirements: list[str] = Field(
+        default_factory=list, description="What to monitor while the position is open"
+    )
+    exit_triggers: list[str] = Field(
+        default_factory=list, description="Conditions that should close the position"
+    )
+
+
 class PortfolioManager(CriticalAgent):
     """
     Portfolio Manager agent.
@@ -54,6 +68,19 @@ class PortfolioManager(CriticalAgent):
             risk_approved = risk_assessment.approved if risk_assessment else False
             risk_score = risk_assessment.risk_score if risk_assessment else 1.0
 
+            # A risk rejection is final, so skip the LLM round-trip entirely
+            if not risk_approved:
+                logger.info("Portfolio decision made", symbol=symbol, approved=False)
+                return PortfolioDecision(
+                    symbol=symbol,
+                    approved=False,
+                    decision_rationale="Risk Manager rejected trade.",
+                    adjusted_position_size=None,
+                    monitoring_requirements=[],
+                    exit_triggers=[],
+                    notes="",
+                )
+
             # Construct input for LLM
             input_text = f"""
 Make the FINAL decision on whether to approve the trade for {symbol}.
@@ -66,20 +93,14 @@ STRATEGY PROPOSAL:
 - Confidence: {strategy_proposal.confidence_score if strategy_proposal else 0}
 
 RISK ASSESSMENT:
-- Risk Manager Approval: {"APPROVED" if risk_approved else "REJECTED"}
+- Risk Manager Approval: APPROVED
 - Risk Score: {risk_score:.2f} (0=low risk, 1=high risk)
 - Warnings: {len(risk_assessment.risk_warnings) if risk_assessment else 0}
 
 DEBATE SUMMARY:
 {debate_summary[:500]}
 
-As Portfolio Manager, make your final decision in JSON format:
-{{
-    "approved": true or false,
-    "rationale": "explanation of your decision",
-    "monitoring_requirements": ["requirement1", "requirement2"],
-    "exit_triggers": ["trigger1", "trigger2"]
-}}
+As Portfolio Manager, make your final decision.
 
 Consider:
 - Strategic fit with portfolio objectives
@@ -88,37 +109,22 @@ Consider:
 - Confidence levels
 """
 
-            # Generate decision
-            response = await self._generate_response(input_text)
-
-            # Parse JSON response
+            # Generate decision, constrained to the reply schema
             try:
-                if "```json" in response:
-                    json_str = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    json_str = response.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response.strip()
-
-                parsed = json.loads(json_str)
+                reply = await self._generate_structured(input_text, _DecisionReply)
 
-                approved = parsed.get("approved", False)
-                rationale = parsed.get("rationale", response[:300])
-                monitoring = parsed.get("monitoring_requirements", [])
-                exit_triggers = parsed.get("exit_triggers", [])
+                approved = reply.approved
+                rationale = reply.rationale
+                monitoring = reply.monitoring_requirements
+                exit_triggers = reply.exit_triggers
 
-            except (json.JSONDecodeError, KeyError, IndexError) as e:
+            except ValueError as e:
                 logger.warning("Failed to parse response, using conservative default", error=str(e))
                 approved = False
                 rationale = "Could not parse decision - rejecting for safety"
                 monitoring = []
                 exit_triggers = []
 
-            # Override if risk manager rejected
-            if not risk_approved:
-                approved = False
-                rationale = f"Risk Manager rejected trade. {rationale}"
-
             decision = PortfolioDecision(
                 symbol=symbol,
                 approved=approved,
@@ -46,6 +46,7 @@ class ReflectiveAgent(CriticalAgent):
 
         logger.info("Reflecting on trade", trade_id=trade_outcome.trade_id)
 
+        stored = False
         try:
             # Determine if trade was successful
             if trade_outcome.return_pct:
@@ -53,9 +54,6 @@ class ReflectiveAgent(CriticalAgent):
             else:
                 success = False
 
-            # Store trade outcome in episodic memory
-            self.episodic_memory.store_trade(trade_outcome)
-
             # Simple reflection for now
             # In production, would use LLM to generate deeper insights
 
@@ -93,8 +91,9 @@ class ReflectiveAgent(CriticalAgent):
                 ),
             )
 
-            # Store reflection
-            self.episodic_memory.store_reflection(reflection)
+            # Store trade outcome and reflection in episodic memory together
+            self.episodic_memory.store_trade_and_reflection(trade_outcome, reflection)
+            stored = True
 
             logger.info(
                 "Reflection complete",
@@ -110,4 +109,14 @@ class ReflectiveAgent(CriticalAgent):
                 trade_id=trade_outcome.trade_id if trade_outcome else "unknown",
                 error=str(e),
             )
+            if not stored:
+                # Keep the trade outcome even though no reflection was stored with it
+                try:
+                    self.episodic_memory.store_trade(trade_outcome)
+                except Exception as store_error:
+                    logger.error(
+                        "Failed to store trade outcome",
+                        trade_id=trade_outcome.trade_id,
+                        error=str(store_error),
+                    )
             return None
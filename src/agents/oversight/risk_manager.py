@@ -1,7 +1,11 @@
 """Oversight & Learning Team - Risk Manager."""
 
-import json
-from typing import Any
+import asyncio
+import string
+from typing import Any, Literal, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
 
 from ...config import settings
 from ...config.prompts import RISK_MANAGER_PROMPT
@@ -13,10 +17,178 @@ from ...data.schemas import (
 )
 from ...utils import get_logger
 from ..base import CriticalAgent
+from ._risk_math import hard_limits, hard_limits_batch
 
 
 logger = get_logger(__name__)
 
+REPORT_CONFIDENCE = 0.9  # Confidence attached to the Risk Manager's AgentReport
+
+
+class _ReviewReply(BaseModel):
+    """Schema the LLM's risk review is generated against."""
+
+    approved: bool = Field(description="Whether the trade is approved")
+    risk_score: float = Field(description="Risk from 0.0 (low) to 1.0 (high)")
+    recommendation: Literal["approve", "modify", "reject"] = Field(description="Recommended action")
+    rationale: str = Field(description="Brief explanation of the decision")
+    additional_warnings: list[str] = Field(
+        default_factory=list, description="Risks not covered by the checks"
+    )
+
+
+# Compiled once at import and filled per assess_risk() call
+_INPUT_TEMPLATE = string.Template(
+    """
+Assess the risk of the proposed trade for $symbol.
+
+STRATEGY:
+- Type: $strategy_type
+- Direction: $direction
+- Position Size: $position_pct% ($$$position_value)
+- Expected Return: $expected_return%
+- Max Loss: $max_loss%
+- Confidence: $confidence
+
+RISK PARAMETERS:
+- Max Position Size: $max_position_pct% ($$$max_position_value)
+- Max Portfolio Risk (VaR): $max_risk_pct% ($$$var_limit)
+- Max Sector Concentration: $max_sector_pct%
+
+CHECKS:
+- Position Size Check: $position_check
+- VaR Check: $var_check
+- Sector Check: $sector_check
+
+WARNINGS:
+$warnings
+
+As Risk Manager, provide your assessment.
+
+Note: You have VETO AUTHORITY. If risk parameters are violated or the risk is unacceptable, you MUST reject the trade.
+"""
+)
+
+
+# Order of the values returned by the _risk_math kernels
+_LIMIT_FIELDS = (
+    "position_size_ok",
+    "var_ok",
+    "sector_ok",
+    "position_value",
+    "max_position_value",
+    "estimated_var",
+    "projected_var",
+    "var_limit",
+    "sector_concentration",
+)
+
+
+def _portfolio_inputs(portfolio_state: dict[str, Any]) -> tuple[float, float, float]:
+    """Portfolio value, current VaR and sector exposure used by the limit checks."""
+    portfolio_value = portfolio_state.get("total_value", 100000.0)
+    sector_exposures = portfolio_state.get("sector_exposures", {})
+
+    # Sector data is not tracked yet, so every position counts as "Unknown"
+    return (
+        float(portfolio_value),
+        float(portfolio_state.get("var", 0.0)),
+        float(sector_exposures.get("Unknown", 0.0)),
+    )
+
+
+def _limits_report(strategy_proposal: StrategyProposal, results: tuple) -> dict[str, Any]:
+    """Name the kernel results for one proposal and attach its risk warnings."""
+    limits = dict(zip(_LIMIT_FIELDS, results))
+
+    # Compile risk warnings
+    risk_warnings = []
+    if not limits["position_size_ok"]:
+        risk_warnings.append(
+            f"Position size ${limits['position_value']:.0f} exceeds limit "
+            f"${limits['max_position_value']:.0f}"
+        )
+    if not limits["var_ok"]:
+        risk_warnings.append(
+            f"Projected VaR ${limits['projected_var']:.0f} exceeds limit ${limits['var_limit']:.0f}"
+        )
+    if not limits["sector_ok"]:
+        risk_warnings.append(
+            f"Sector concentration {limits['sector_concentration'] * 100:.1f}% exceeds "
+            f"{settings.max_sector_concentration * 100:.0f}%"
+        )
+
+    # Additional qualitative risk assessment
+    if strategy_proposal.confidence_score < 0.5:
+        risk_warnings.append("Low strategy confidence score")
+
+    if abs(strategy_proposal.max_loss) > 10:
+        risk_warnings.append(f"High maximum loss potential: {strategy_proposal.max_loss:.1f}%")
+
+    limits["risk_warnings"] = risk_warnings
+    return limits
+
+
+def check_hard_limits(
+    strategy_proposal: StrategyProposal, portfolio_state: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Evaluate a proposal against the hard risk limits.
+
+    Pure arithmetic with no I/O, so it can run for many proposals without
+    touching the LLM.
+
+    Args:
+        strategy_proposal: Proposed trade
+        portfolio_state: Portfolio metrics (total_value, var, sector_exposures)
+
+    Returns:
+        Dict of limit checks, intermediate values and risk warnings
+    """
+    portfolio_value, current_var, sector_exposure = _portfolio_inputs(portfolio_state)
+    results = hard_limits(
+        portfolio_value,
+        float(strategy_proposal.position_size_pct),
+        float(strategy_proposal.max_loss),
+        current_var,
+        sector_exposure,
+        settings.max_position_size,
+        settings.max_portfolio_risk,
+        settings.max_sector_concentration,
+    )
+    return _limits_report(strategy_proposal, results)
+
+
+def check_hard_limits_batch(
+    proposals: list[StrategyProposal], portfolio_state: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """
+    Evaluate many proposals against the same portfolio in one kernel call.
+
+    Args:
+        proposals: Proposed trades
+        portfolio_state: Portfolio metrics (total_value, var, sector_exposures)
+
+    Returns:
+        One check_hard_limits result per proposal, in order
+    """
+    count = len(proposals)
+    portfolio_value, current_var, sector_exposure = _portfolio_inputs(portfolio_state)
+    checks, values = hard_limits_batch(
+        portfolio_value,
+        np.fromiter((p.position_size_pct for p in proposals), dtype=np.float64, count=count),
+        np.fromiter((p.max_loss for p in proposals), dtype=np.float64, count=count),
+        current_var,
+        sector_exposure,
+        settings.max_position_size,
+        settings.max_portfolio_risk,
+        settings.max_sector_concentration,
+    )
+    return [
+        _limits_report(proposal, (*row_checks, *row_values))
+        for proposal, row_checks, row_values in zip(proposals, checks.tolist(), values.tolist())
+    ]
+
 
 class RiskManager(CriticalAgent):
     """
@@ -31,6 +203,8 @@ class RiskManager(CriticalAgent):
             role=AgentRole.RISK_MANAGER,
             system_prompt=RISK_MANAGER_PROMPT,
             temperature=0.3,  # Low temperature for conservative risk assessment
+            # The review is a short JSON object; a smaller model can serve it
+            model_name=settings.risk_manager_model,
         )
 
     async def analyze(self, context: dict[str, Any]) -> AgentReport:
@@ -46,20 +220,58 @@ class RiskManager(CriticalAgent):
         assessment = await self.assess_risk(context)
         symbol = context.get("symbol", "UNKNOWN")
 
-        return AgentReport(
-            agent_role=self.role,
+        # Every field is built here from trusted values, so skip re-validation;
+        # agent_role is stored as its value, as use_enum_values would
+        return AgentReport.model_construct(
+            agent_role=self.role.value,
             symbol=symbol,
             summary=f"Risk assessment: {'APPROVED' if assessment.approved else 'REJECTED'}",
-            confidence=0.9,
-            metadata={"risk_assessment": assessment.model_dump()},
+            confidence=REPORT_CONFIDENCE,
+            # Stored as the model; AgentReport.model_dump() serializes it on demand
+            metadata={"risk_assessment": assessment},
+        )
+
+    async def assess_risk_batch(
+        self, proposals: list[StrategyProposal], portfolio_state: dict[str, Any]
+    ) -> list[RiskAssessment]:
+        """
+        Assess many proposals against the same portfolio.
+
+        The hard limits for every proposal are computed in one kernel call,
+        then the per-proposal assessments run concurrently.
+
+        Args:
+            proposals: Proposed trades
+            portfolio_state: Portfolio metrics shared by all proposals
+
+        Returns:
+            One RiskAssessment per proposal, in order
+        """
+        all_limits = check_hard_limits_batch(proposals, portfolio_state)
+
+        return await asyncio.gather(
+            *(
+                self.assess_risk(
+                    {
+                        "symbol": proposal.symbol,
+                        "strategy_proposal": proposal,
+                        "portfolio_state": portfolio_state,
+                    },
+                    limits=limits,
+                )
+                for proposal, limits in zip(proposals, all_limits)
+            )
         )
 
-    async def assess_risk(self, context: dict[str, Any]) -> RiskAssessment:
+    async def assess_risk(
+        self, context: dict[str, Any], limits: Optional[dict[str, Any]] = None
+    ) -> RiskAssessment:
         """
         Assess risk of proposed trade.
 
         Args:
             context: Contains strategy_proposal, execution_plan, portfolio_state
+            limits: Precomputed check_hard_limits result; computed here if omitted
 
         Returns:
             RiskAssessment with approval/rejection
@@ -71,138 +283,34 @@ class RiskManager(CriticalAgent):
         logger.info("Assessing risk", symbol=symbol)
 
         try:
-            # Get portfolio metrics
-            portfolio_value = portfolio_state.get("total_value", 100000.0)
-            sector_exposures = portfolio_state.get("sector_exposures", {})
-
-            # Calculate position size check
-            position_value = portfolio_value * strategy_proposal.position_size_pct
-            max_position_value = portfolio_value * settings.max_position_size
-            position_size_ok = position_value <= max_position_value
-
-            # Calculate VaR impact (simplified)
-            # In production, would use proper VaR calculations
-            estimated_var = abs(strategy_proposal.max_loss) / 100 * position_value
-            current_var = portfolio_state.get("var", 0.0)
-            projected_var = current_var + estimated_var
-            var_limit = portfolio_value * settings.max_portfolio_risk
-            var_ok = projected_var <= var_limit
-
-            # Check sector concentration (simplified)
-            # Would need actual sector data in production
-            sector = "Unknown"
-            current_sector_exposure = sector_exposures.get(sector, 0.0)
-            new_sector_exposure = current_sector_exposure + position_value
-            sector_concentration = new_sector_exposure / portfolio_value
-            sector_ok = sector_concentration <= settings.max_sector_concentration
-
-            # Compile risk warnings
-            risk_warnings = []
-            if not position_size_ok:
-                risk_warnings.append(
-                    f"Position size ${position_value:.0f} exceeds limit ${max_position_value:.0f}"
-                )
-            if not var_ok:
-                risk_warnings.append(
-                    f"Projected VaR ${projected_var:.0f} exceeds limit ${var_limit:.0f}"
-                )
-            if not sector_ok:
-                risk_warnings.append(
-                    f"Sector concentration {sector_concentration * 100:.1f}% exceeds {settings.max_sector_concentration * 100:.0f}%"
-                )
-
-            # Additional qualitative risk assessment
-            if strategy_proposal.confidence_score < 0.5:
-                risk_warnings.append("Low strategy confidence score")
-
-            if abs(strategy_proposal.max_loss) > 10:
-                risk_warnings.append(
-                    f"High maximum loss potential: {strategy_proposal.max_loss:.1f}%"
-                )
-
-            # Construct input for LLM
-            input_text = f"""
-Assess the risk of the proposed trade for {symbol}.
-
-STRATEGY:
-- Type: {strategy_proposal.strategy_type.value}
-- Direction: {strategy_proposal.direction.value}
-- Position Size: {strategy_proposal.position_size_pct * 100:.1f}% (${position_value:.0f})
-- Expected Return: {strategy_proposal.expected_return:.1f}%
-- Max Loss: {strategy_proposal.max_loss:.1f}%
-- Confidence: {strategy_proposal.confidence_score:.2f}
-
-RISK PARAMETERS:
-- Max Position Size: {settings.max_position_size * 100:.0f}% (${max_position_value:.0f})
-- Max Portfolio Risk (VaR): {settings.max_portfolio_risk * 100:.0f}% (${var_limit:.0f})
-- Max Sector Concentration: {settings.max_sector_concentration * 100:.0f}%
-
-CHECKS:
-- Position Size Check: {"PASS" if position_size_ok else "FAIL"}
-- VaR Check: {"PASS" if var_ok else "FAIL"}
-- Sector Check: {"PASS" if sector_ok else "FAIL"}
-
-WARNINGS:
-{chr(10).join([f"- {w}" for w in risk_warnings]) if risk_warnings else "- None"}
-
-As Risk Manager, provide your assessment in JSON format:
-{{
-    "approved": true or false,
-    "risk_score": <0.0 to 1.0>,
-    "recommendation": "approve", "modify", or "reject",
-    "rationale": "brief explanation of decision",
-    "additional_warnings": ["warning1", "warning2"]
-}}
-
-Note: You have VETO AUTHORITY. If risk parameters are violated or the risk is unacceptable, you MUST reject the trade.
-"""
-
-            # Generate assessment
-            response = await self._generate_response(input_text)
-
-            # Parse JSON response
-            try:
-                if "```json" in response:
-                    json_str = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    json_str = response.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response.strip()
-
-                parsed = json.loads(json_str)
-
-                llm_approved = parsed.get("approved", True)
-                risk_score = float(parsed.get("risk_score", 0.5))
-                recommendation = parsed.get("recommendation", "approve")
-                rationale = parsed.get("rationale", response[:200])
-                additional_warnings = parsed.get("additional_warnings", [])
-
-                risk_warnings.extend(additional_warnings)
-
-            except (json.JSONDecodeError, KeyError, IndexError, ValueError) as e:
-                logger.warning(
-                    "Failed to parse LLM response, using rule-based decision",
-                    error=str(e),
-                )
-                llm_approved = True
-                risk_score = 0.5
-                recommendation = "approve"
-                rationale = "Rule-based assessment"
+            if limits is None:
+                limits = check_hard_limits(strategy_proposal, portfolio_state)
+            position_value = limits["position_value"]
+            position_size_ok = limits["position_size_ok"]
+            estimated_var = limits["estimated_var"]
 
             # Final decision: Must pass hard limits AND LLM approval
-            hard_limits_passed = position_size_ok and var_ok and sector_ok
-            final_approved = hard_limits_passed and llm_approved
+            hard_limits_passed = position_size_ok and limits["var_ok"] and limits["sector_ok"]
 
-            if not hard_limits_passed:
+            if hard_limits_passed:
+                llm_approved, risk_score, recommendation, rationale = await self._review(
+                    symbol, strategy_proposal, limits
+                )
+            else:
+                # A hard-limit breach is an automatic veto; skip the LLM round trip
+                llm_approved = False
+                risk_score = 1.0
                 recommendation = "reject"
                 rationale = "Hard risk limits violated"
 
+            final_approved = hard_limits_passed and llm_approved
+
             # Calculate portfolio impact
             portfolio_impact = {
                 "position_value": position_value,
                 "position_pct": strategy_proposal.position_size_pct * 100,
                 "var_increase": estimated_var,
-                "projected_var": projected_var,
+                "projected_var": limits["projected_var"],
             }
 
             assessment = RiskAssessment(
@@ -210,9 +318,9 @@ Note: You have VETO AUTHORITY. If risk parameters are violated or the risk is un
                 approved=final_approved,
                 portfolio_impact=portfolio_impact,
                 var_impact=estimated_var,
-                sector_concentration=sector_concentration,
+                sector_concentration=limits["sector_concentration"],
                 position_size_check=position_size_ok,
-                risk_warnings=risk_warnings,
+                risk_warnings=limits["risk_warnings"],
                 risk_score=risk_score,
                 recommendation=f"{recommendation}: {rationale}",
             )
@@ -241,3 +349,64 @@ Note: You have VETO AUTHORITY. If risk parameters are violated or the risk is un
                 risk_score=1.0,
                 recommendation="reject: Assessment failed",
             )
+
+    async def _review(
+        self, symbol: str, strategy_proposal: StrategyProposal, limits: dict[str, Any]
+    ) -> tuple[bool, float, str, str]:
+        """
+        Ask the LLM for a qualitative review of a proposal within the hard limits.
+
+        Args:
+            symbol: Stock symbol
+            strategy_proposal: Proposed trade
+            limits: check_hard_limits result; its risk_warnings are extended
+                with any warnings the LLM adds
+
+        Returns:
+            Tuple of (approved, risk_score, recommendation, rationale)
+        """
+        risk_warnings = limits["risk_warnings"]
+
+        # Construct input for LLM
+        input_text = _INPUT_TEMPLATE.substitute(
+            symbol=symbol,
+            strategy_type=strategy_proposal.strategy_type.value,
+            direction=strategy_proposal.direction.value,
+            position_pct=f"{strategy_proposal.position_size_pct * 100:.1f}",
+            position_value=f"{limits['position_value']:.0f}",
+            expected_return=f"{strategy_proposal.expected_return:.1f}",
+            max_loss=f"{strategy_proposal.max_loss:.1f}",
+            confidence=f"{strategy_proposal.confidence_score:.2f}",
+            max_position_pct=f"{settings.max_position_size * 100:.0f}",
+            max_position_value=f"{limits['max_position_value']:.0f}",
+            max_risk_pct=f"{settings.max_portfolio_risk * 100:.0f}",
+            var_limit=f"{limits['var_limit']:.0f}",
+            max_sector_pct=f"{settings.max_sector_concentration * 100:.0f}",
+            position_check="PASS" if limits["position_size_ok"] else "FAIL",
+            var_check="PASS" if limits["var_ok"] else "FAIL",
+            sector_check="PASS" if limits["sector_ok"] else "FAIL",
+            warnings="\n".join(f"- {w}" for w in risk_warnings) or "- None",
+        )
+
+        # Generate assessment, constrained to the reply schema; LLM warnings
+        # are appended to the limit warnings
+        try:
+            reply = await self._generate_structured(input_text, _ReviewReply)
+
+            llm_approved = reply.approved
+            # Clamp so an off-scale score (e.g. 7 out of 10) cannot fail
+            # RiskAssessment validation; anything above 1.0 counts as maximum risk
+            risk_score = max(0.0, min(1.0, reply.risk_score))
+            recommendation = reply.recommendation
+            rationale = reply.rationale
+
+            risk_warnings.extend(reply.additional_warnings)
+
+        except ValueError as e:
+            logger.warning("Failed to parse risk review, rejecting for safety", error=str(e))
+            llm_approved = False
+            risk_score = 1.0
+            recommendation = "reject"
+            rationale = "Could not parse risk review - rejecting for safety"
+
+        return llm_approved, risk_score, recommendation, rationale
@@ -1,9 +1,27 @@
 """Strategy & Research Team agents."""
 
+from importlib import import_module
+
 from .bearish import BearishResearcher
 from .bullish import BullishResearcher
-from .derivatives import DerivativesStrategist
-from .reasoning import DeepSeekReasoningAgent
+from .debate import debate_pair
+
+
+# Imported on first access (PEP 562): DerivativesStrategist pulls in the
+# market data provider (pandas, yfinance), which the debate agents never need
+_LAZY_AGENTS = {
+    "DerivativesStrategist": ".derivatives",
+    "DeepSeekReasoningAgent": ".reasoning",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_AGENTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -11,4 +29,5 @@ __all__ = [
     "BearishResearcher",
     "DerivativesStrategist",
     "DeepSeekReasoningAgent",
+    "debate_pair",
 ]
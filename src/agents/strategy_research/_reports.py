@@ -0,0 +1,129 @@
+"""Analyst-report fields and debate context shared by the researchers' prompts."""
+
+from operator import attrgetter
+from typing import Any
+
+
+# Opposing argument carried into a rebuttal prompt (~300 tokens), so the
+# per-round prompt stays the same size however long the arguments get
+DEBATE_CONTEXT_CHARS = 1200
+
+# Report attributes read for the debate prompts, one getter per analyst
+_FUNDAMENTALS_FIELDS = attrgetter(
+    "investment_thesis.value", "intrinsic_value", "key_points", "risk_factors", "confidence_level"
+)
+_MACRO_FIELDS = attrgetter(
+    "market_sentiment.value", "risk_events", "macro_themes", "confidence_level"
+)
+_SENTIMENT_FIELDS = attrgetter(
+    "social_sentiment.value",
+    "sentiment_score",
+    "trending_topics",
+    "retail_positioning",
+    "confidence_level",
+)
+_TECHNICAL_FIELDS = attrgetter(
+    "trend_direction.value",
+    "support_levels",
+    "resistance_levels",
+    "chart_patterns",
+    "confidence_level",
+)
+
+# Rendered in place of a missing analyst report
+_MISSING_FIELDS = {
+    "investment_thesis": "N/A",
+    "intrinsic_value": "N/A",
+    "key_points": "",
+    "risk_factors": "",
+    "fundamentals_confidence": 0,
+    "market_sentiment": "N/A",
+    "risk_events": "",
+    "macro_themes": "",
+    "macro_confidence": 0,
+    "social_sentiment": "N/A",
+    "sentiment_score": "0.00",
+    "trending_topics": "",
+    "retail_positioning": "N/A",
+    "sentiment_confidence": 0,
+    "trend": "N/A",
+    "support": "",
+    "resistance": "",
+    "patterns": "",
+    "technical_confidence": 0,
+}
+
+
+def _prices(levels: list[float]) -> str:
+    """Render price levels as a comma-separated dollar list."""
+    return ", ".join(f"${x:.2f}" for x in levels)
+
+
+def extract_report_fields(analyst_reports: dict[str, Any]) -> dict[str, Any]:
+    """
+    Format the analyst-report values used by the debate prompts.
+
+    Args:
+        analyst_reports: Reports keyed by fundamentals, macro_news, sentiment
+            and technical; any of them may be missing
+
+    Returns:
+        Prompt fields keyed by template placeholder name
+    """
+    fields = dict(_MISSING_FIELDS)
+
+    fundamentals = analyst_reports.get("fundamentals")
+    if fundamentals:
+        thesis, intrinsic_value, key_points, risk_factors, confidence = _FUNDAMENTALS_FIELDS(
+            fundamentals
+        )
+        fields["investment_thesis"] = thesis
+        fields["intrinsic_value"] = intrinsic_value or "N/A"
+        fields["key_points"] = ", ".join(key_points)
+        fields["risk_factors"] = ", ".join(risk_factors)
+        fields["fundamentals_confidence"] = confidence
+
+    macro_news = analyst_reports.get("macro_news")
+    if macro_news:
+        market_sentiment, risk_events, themes, confidence = _MACRO_FIELDS(macro_news)
+        fields["market_sentiment"] = market_sentiment
+        fields["risk_events"] = ", ".join(risk_events)
+        fields["macro_themes"] = ", ".join(themes)
+        fields["macro_confidence"] = confidence
+
+    sentiment = analyst_reports.get("sentiment")
+    if sentiment:
+        social, score, trending, positioning, confidence = _SENTIMENT_FIELDS(sentiment)
+        fields["social_sentiment"] = social
+        fields["sentiment_score"] = f"{score:.2f}"
+        fields["trending_topics"] = ", ".join(trending)
+        fields["retail_positioning"] = positioning
+        fields["sentiment_confidence"] = confidence
+
+    technical = analyst_reports.get("technical")
+    if technical:
+        trend, support, resistance, patterns, confidence = _TECHNICAL_FIELDS(technical)
+        fields["trend"] = trend
+        fields["support"] = _prices(support)
+        fields["resistance"] = _prices(resistance)
+        fields["patterns"] = ", ".join(patterns)
+        fields["technical_confidence"] = confidence
+
+    return fields
+
+
+def debate_context(argument_text: str) -> str:
+    """
+    Bound an opposing argument for the next round's rebuttal prompt.
+
+    Args:
+        argument_text: Full text of the opposing argument
+
+    Returns:
+        The text, cut at the last sentence end within DEBATE_CONTEXT_CHARS
+    """
+    if len(argument_text) <= DEBATE_CONTEXT_CHARS:
+        return argument_text
+    cut = argument_text.rfind(". ", 0, DEBATE_CONTEXT_CHARS)
+    end = cut + 1 if cut > 0 else DEBATE_CONTEXT_CHARS
+    return argument_text[:end] + " [...]"
@@ -1,16 +1,96 @@
 """Strategy & Research Team - Bullish Researcher."""
 
-import json
+import string
 from typing import Any
 
+from pydantic import BaseModel, Field
+
 from ...config.prompts import BULLISH_RESEARCHER_PROMPT
 from ...data.schemas import AgentRole, DebateArgument, Sentiment
 from ...utils import get_logger
 from ..base import BaseAgent
+from ._reports import debate_context, extract_report_fields
 
 
 logger = get_logger(__name__)
 
+# Prompts are compiled once at import and filled per debate() call
+_ROUND_ONE_TEMPLATE = string.Template(
+    """
+Construct a strong BULLISH argument for $symbol based on the following analyst reports:
+
+FUNDAMENTALS:
+- Investment Thesis: $investment_thesis
+- Intrinsic Value: $$$intrinsic_value
+- Key Points: $key_points
+- Confidence: $fundamentals_confidence/10
+
+MACRO & NEWS:
+- Market Sentiment: $market_sentiment
+- Key Themes: $macro_themes
+- Confidence: $macro_confidence/10
+
+SENTIMENT:
+- Social Sentiment: $social_sentiment
+- Score: $sentiment_score
+- Trending: $trending_topics
+- Confidence: $sentiment_confidence/10
+
+TECHNICAL:
+- Trend: $trend
+- Support: $support
+- Resistance: $resistance
+- Patterns: $patterns
+- Confidence: $technical_confidence/10
+
+Build your BULLISH case with:
+1. Investment thesis summary (why this is a buying opportunity)
+2. Key supporting evidence from each analyst
+3. Catalysts that could drive price higher
+4. Proposed strategy (buy stock, call options, bull spreads)
+5. Acknowledgment of risks but why they're manageable
+"""
+)
+
+_REBUTTAL_TEMPLATE = string.Template(
+    """
+This is debate round $round_number for $symbol.
+
+PREVIOUS BEARISH ARGUMENT:
+$latest_bearish
+
+COUNTER these bearish points while strengthening your BULLISH case:
+
+Respond with a rebuttal that:
+1. Directly addresses the bearish concerns
+2. Provides additional evidence supporting your bullish view
+3. Highlights what the bears are missing
+4. Reinforces why this is still a buying opportunity
+"""
+)
+
+
+class _RoundOneReply(BaseModel):
+    """Schema the opening bullish argument is generated against."""
+
+    thesis_summary: str = Field(description="Brief bullish thesis")
+    supporting_evidence: list[str] = Field(description="Key supporting evidence from the analysts")
+    catalysts: list[str] = Field(description="Catalysts that could drive the price higher")
+    proposed_strategy: str = Field(description="Description of the proposed trade")
+    risk_acknowledgment: list[str] = Field(description="Risks and why they are manageable")
+    conviction_level: int = Field(description="Conviction from 1 to 10")
+    argument_text: str = Field(description="Full argument text")
+
+
+class _RebuttalReply(BaseModel):
+    """Schema a bullish rebuttal is generated against."""
+
+    counterpoints: list[str] = Field(description="Direct counters to the bearish concerns")
+    additional_evidence: list[str] = Field(description="New evidence supporting the bullish view")
+    bearish_mistakes: list[str] = Field(description="What the bears are missing")
+    conviction_level: int = Field(description="Conviction from 1 to 10")
+    argument_text: str = Field(description="Full counter-argument text")
+
 
 class BullishResearcher(BaseAgent):
     """
@@ -49,120 +129,45 @@ class BullishResearcher(BaseAgent):
 
         logger.info("Bullish researcher debating", symbol=symbol, round=round_number)
 
-        # Extract key information from analyst reports
-        fundamentals = analyst_reports.get("fundamentals")
-        macro_news = analyst_reports.get("macro_news")
-        sentiment = analyst_reports.get("sentiment")
-        technical = analyst_reports.get("technical")
-
         # Build context for this round
         if round_number == 1:
             # First round - build initial case
-            input_text = f"""
-Construct a strong BULLISH argument for {symbol} based on the following analyst reports:
-
-FUNDAMENTALS:
-- Investment Thesis: {fundamentals.investment_thesis.value if fundamentals else "N/A"}
-- Intrinsic Value: ${fundamentals.intrinsic_value if fundamentals and fundamentals.intrinsic_value else "N/A"}
-- Key Points: {", ".join(fundamentals.key_points if fundamentals else [])}
-- Confidence: {fundamentals.confidence_level if fundamentals else 0}/10
-
-MACRO & NEWS:
-- Market Sentiment: {macro_news.market_sentiment.value if macro_news else "N/A"}
-- Key Themes: {", ".join(macro_news.macro_themes if macro_news else [])}
-- Confidence: {macro_news.confidence_level if macro_news else 0}/10
-
-SENTIMENT:
-- Social Sentiment: {sentiment.social_sentiment.value if sentiment else "N/A"}
-- Score: {sentiment.sentiment_score if sentiment else 0:.2f}
-- Trending: {", ".join(sentiment.trending_topics if sentiment else [])}
-- Confidence: {sentiment.confidence_level if sentiment else 0}/10
-
-TECHNICAL:
-- Trend: {technical.trend_direction.value if technical else "N/A"}
-- Support: {", ".join([f"${x:.2f}" for x in (technical.support_levels if technical else [])])}
-- Resistance: {", ".join([f"${x:.2f}" for x in (technical.resistance_levels if technical else [])])}
-- Patterns: {", ".join(technical.chart_patterns if technical else [])}
-- Confidence: {technical.confidence_level if technical else 0}/10
-
-Build your BULLISH case with:
-1. Investment thesis summary (why this is a buying opportunity)
-2. Key supporting evidence from each analyst
-3. Catalysts that could drive price higher
-4. Proposed strategy (buy stock, call options, bull spreads)
-5. Acknowledgment of risks but why they're manageable
-
-Provide your argument in JSON format:
-{{
-    "thesis_summary": "brief bullish thesis",
-    "supporting_evidence": ["evidence1", "evidence2", "evidence3"],
-    "catalysts": ["catalyst1", "catalyst2"],
-    "proposed_strategy": "description of trade",
-    "risk_acknowledgment": ["risk1", "risk2"],
-    "conviction_level": <1-10>,
-    "argument_text": "full argument text"
-}}
-"""
+            input_text = _ROUND_ONE_TEMPLATE.substitute(
+                extract_report_fields(analyst_reports), symbol=symbol
+            )
         else:
             # Subsequent rounds - respond to bearish counterarguments
-            bearish_args = [arg for arg in previous_arguments if arg.position == Sentiment.BEARISH]
-            latest_bearish = bearish_args[-1] if bearish_args else None
-
-            input_text = f"""
-This is debate round {round_number} for {symbol}.
-
-PREVIOUS BEARISH ARGUMENT:
-{latest_bearish.argument if latest_bearish else "No bearish argument yet"}
-
-COUNTER these bearish points while strengthening your BULLISH case:
-
-Respond with a rebuttal that:
-1. Directly addresses the bearish concerns
-2. Provides additional evidence supporting your bullish view
-3. Highlights what the bears are missing
-4. Reinforces why this is still a buying opportunity
+            # Most recent bearish argument, scanning back from the end
+            latest_bearish = next(
+                (
+                    arg
+                    for arg in reversed(previous_arguments or ())
+                    if arg.position == Sentiment.BEARISH
+                ),
+                None,
+            )
 
-Provide your counter-argument in JSON format:
-{{
-    "counterpoints": ["counter1", "counter2", "counter3"],
-    "additional_evidence": ["evidence1", "evidence2"],
-    "bearish_mistakes": ["what bears missed1", "what bears missed2"],
-    "conviction_level": <1-10>,
-    "argument_text": "full counter-argument text"
-}}
-"""
+            input_text = _REBUTTAL_TEMPLATE.substitute(
+                symbol=symbol,
+                round_number=round_number,
+                latest_bearish=debate_context(latest_bearish.argument)
+                if latest_bearish
+                else "No bearish argument yet",
+            )
 
         try:
-            # Generate argument
-            response = await self._generate_response(input_text)
-
-            # Parse JSON response
-            try:
-                if "```json" in response:
-                    json_str = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    json_str = response.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response.strip()
-
-                parsed = json.loads(json_str)
-
-                if round_number == 1:
-                    supporting_evidence = parsed.get("supporting_evidence", [])
-                    counterpoints = []
-                else:
-                    supporting_evidence = parsed.get("additional_evidence", [])
-                    counterpoints = parsed.get("counterpoints", [])
-
-                conviction = parsed.get("conviction_level", 7)
-                argument_text = parsed.get("argument_text", response[:500])
-
-            except (json.JSONDecodeError, KeyError, IndexError) as e:
-                logger.warning("Failed to parse response, using full text", error=str(e))
-                supporting_evidence = ["See full argument"]
+            # Generate argument, constrained to the round's reply schema
+            if round_number == 1:
+                reply = await self._generate_structured(input_text, _RoundOneReply)
+                supporting_evidence = reply.supporting_evidence
                 counterpoints = []
-                conviction = 7
-                argument_text = response
+            else:
+                reply = await self._generate_structured(input_text, _RebuttalReply)
+                supporting_evidence = reply.additional_evidence
+                counterpoints = reply.counterpoints
+
+            conviction = reply.conviction_level
+            argument_text = reply.argument_text
 
             argument = DebateArgument(
                 round_number=round_number,
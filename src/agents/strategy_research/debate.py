@@ -0,0 +1,41 @@
+"""Strategy & Research Team - paired debate rounds."""
+
+import asyncio
+from typing import Any
+
+from ...data.schemas import DebateArgument
+from .bearish import BearishResearcher
+from .bullish import BullishResearcher
+
+
+async def debate_pair(
+    bullish: BullishResearcher,
+    bearish: BearishResearcher,
+    context: dict[str, Any],
+    round_number: int,
+    previous_arguments: list[DebateArgument] = None,
+) -> tuple[DebateArgument, DebateArgument]:
+    """
+    Run one debate round for both researchers concurrently.
+
+    Both sides respond to the arguments from earlier rounds, so the two LLM
+    round trips of a round overlap instead of running back to back.
+
+    Args:
+        bullish: Bullish researcher
+        bearish: Bearish researcher
+        context: Contains analyst reports and symbol
+        round_number: Current debate round
+        previous_arguments: Arguments from previous rounds
+
+    Returns:
+        Tuple of (bullish argument, bearish argument)
+    """
+    previous_arguments = list(previous_arguments or [])
+
+    bullish_arg, bearish_arg = await asyncio.gather(
+        bullish.debate(context, round_number=round_number, previous_arguments=previous_arguments),
+        bearish.debate(context, round_number=round_number, previous_arguments=previous_arguments),
+    )
+
+    return bullish_arg, bearish_arg
@@ -1,6 +1,7 @@
 """Strategy & Research Team - Derivatives Strategist."""
 
-import json
+import asyncio
+import string
 from typing import Any
 
 from ...config.prompts import DERIVATIVES_STRATEGIST_PROMPT
@@ -11,12 +12,82 @@ from ...data.schemas import (
     StrategyProposal,
     StrategyType,
 )
-from ...utils import get_logger
+from ...utils import JSONDecodeError, get_logger, parse_json_response
 from ..base import CriticalAgent
 
 
 logger = get_logger(__name__)
 
+# Static part of every strategy request. It is appended to the system prompt so
+# the provider can reuse its cached prefix; only the per-symbol data is sent
+# in the human message.
+_STRATEGY_CATALOG = """
+Based on the analysis, formulate a strategy that:
+1. Aligns with the consensus view from the debate
+2. Has clear entry and exit conditions
+3. Manages risk appropriately
+4. Specifies position sizing
+
+Choose from these strategy types:
+- LONG_EQUITY: Buy stock (bullish, simple)
+- SHORT_EQUITY: Short stock (bearish, simple)
+- COVERED_CALL: Own stock + sell calls (neutral to slightly bullish)
+- PROTECTIVE_PUT: Own stock + buy puts (bullish with protection)
+- BULL_CALL_SPREAD: Buy call + sell higher call (moderately bullish)
+- BEAR_PUT_SPREAD: Buy put + sell lower put (moderately bearish)
+- IRON_CONDOR: Sell both spreads (neutral, range-bound)
+- STRADDLE: Buy call + put (expecting big move, uncertain direction)
+- STRANGLE: Buy OTM call + OTM put (expecting big move, cheaper than straddle)
+- CALENDAR_SPREAD: Buy far-dated + sell near-dated options (profit from time decay)
+
+Provide your strategy in JSON format:
+{
+    "strategy_type": "one of the types above",
+    "rationale": "why this strategy fits the analysis",
+    "entry_conditions": ["condition1", "condition2"],
+    "exit_conditions": ["condition1", "condition2"],
+    "position_size_pct": <0.01 to 0.05>,
+    "expected_return": <percentage>,
+    "max_loss": <percentage>,
+    "time_horizon_days": <number>,
+    "confidence_score": <0.0 to 1.0>
+}
+"""
+
+# Per-call prompts, compiled once at import and filled per formulate_strategy() call
+_DEBATE_SUMMARY_TEMPLATE = string.Template(
+    """
+Debate Outcome:
+- Bullish Arguments: $bullish_strength
+- Bearish Arguments: $bearish_strength
+- Direction: $direction
+
+Latest Bullish Points:
+$latest_bullish
+
+Latest Bearish Points:
+$latest_bearish
+"""
+)
+
+_INPUT_TEMPLATE = string.Template(
+    """
+Formulate a trading strategy for $symbol based on the debate outcome and analysis.
+
+DEBATE SUMMARY:
+$debate_summary
+
+MARKET DATA:
+- Current Price: $$$current_price
+- Options Available: $has_options
+- Support Levels: $support
+- Resistance Levels: $resistance
+
+SENTIMENT:
+- Overall Direction: $direction
+"""
+)
+
 
 class DerivativesStrategist(CriticalAgent):
     """
@@ -29,10 +100,10 @@ class DerivativesStrategist(CriticalAgent):
     def __init__(self):
         super().__init__(
             role=AgentRole.DERIVATIVES_STRATEGIST,
-            system_prompt=DERIVATIVES_STRATEGIST_PROMPT,
+            system_prompt=DERIVATIVES_STRATEGIST_PROMPT + _STRATEGY_CATALOG,
             temperature=0.6,
         )
-        self.market_data_provider = MarketDataProvider()
+        self.market_data_provider = MarketDataProvider.shared()
 
     async def formulate_strategy(self, context: dict[str, Any]) -> StrategyProposal:
         """
@@ -54,13 +125,19 @@ class DerivativesStrategist(CriticalAgent):
         logger.info("Formulating strategy", symbol=symbol)
 
         try:
-            # Analyze debate outcome
-            bullish_args = [arg for arg in debate_arguments if arg.position == Sentiment.BULLISH]
-            bearish_args = [arg for arg in debate_arguments if arg.position == Sentiment.BEARISH]
+            # Analyze debate outcome in one pass: argument count and latest
+            # argument per side
+            bullish_strength = bearish_strength = 0
+            latest_bullish = latest_bearish = None
+            for arg in debate_arguments:
+                if arg.position == Sentiment.BULLISH:
+                    bullish_strength += 1
+                    latest_bullish = arg
+                elif arg.position == Sentiment.BEARISH:
+                    bearish_strength += 1
+                    latest_bearish = arg
 
             # Determine overall sentiment from debate
-            bullish_strength = len(bullish_args)
-            bearish_strength = len(bearish_args)
 
             if bullish_strength > bearish_strength:
                 overall_direction = Sentiment.BULLISH
@@ -69,29 +146,30 @@ class DerivativesStrategist(CriticalAgent):
             else:
                 overall_direction = Sentiment.NEUTRAL
 
-            # Get current price and options data
-            current_price = data_provider.get_current_price(symbol)
+            # Get current price and options data; both block on yfinance, so
+            # fetch them concurrently off the event loop
+            current_price, options_data = await asyncio.gather(
+                asyncio.to_thread(data_provider.get_current_price, symbol),
+                asyncio.to_thread(data_provider.get_options_chain, symbol),
+                return_exceptions=True,
+            )
+            if isinstance(current_price, Exception):
+                raise current_price
 
-            try:
-                options_data = data_provider.get_options_chain(symbol)
-                has_options = len(options_data.get("calls", [])) > 0
-            except Exception:
+            if isinstance(options_data, Exception):
                 has_options = False
                 options_data = {}
+            else:
+                has_options = len(options_data.get("calls", [])) > 0
 
             # Prepare debate summary
-            debate_summary = f"""
-Debate Outcome:
-- Bullish Arguments: {bullish_strength}
-- Bearish Arguments: {bearish_strength}
-- Direction: {overall_direction.value}
-
-Latest Bullish Points:
-{bullish_args[-1].argument[:300] if bullish_args else "None"}
-
-Latest Bearish Points:
-{bearish_args[-1].argument[:300] if bearish_args else "None"}
-"""
+            debate_summary = _DEBATE_SUMMARY_TEMPLATE.substitute(
+                bullish_strength=bullish_strength,
+                bearish_strength=bearish_strength,
+                direction=overall_direction.value,
+                latest_bullish=latest_bullish.argument[:300] if latest_bullish else "None",
+                latest_bearish=latest_bearish.argument[:300] if latest_bearish else "None",
+            )
 
             # Get technical levels for strike selection
             technical = analyst_reports.get("technical")
@@ -99,66 +177,22 @@ Latest Bearish Points:
             resistance_levels = technical.resistance_levels if technical else []
 
             # Construct input for LLM
-            input_text = f"""
-Formulate a trading strategy for {symbol} based on the debate outcome and analysis.
-
-DEBATE SUMMARY:
-{debate_summary}
-
-MARKET DATA:
-- Current Price: ${current_price or "N/A"}
-- Options Available: {has_options}
-- Support Levels: {", ".join([f"${x:.2f}" for x in support_levels])}
-- Resistance Levels: {", ".join([f"${x:.2f}" for x in resistance_levels])}
-
-SENTIMENT:
-- Overall Direction: {overall_direction.value}
-
-Based on the analysis, formulate a strategy that:
-1. Aligns with the consensus view from the debate
-2. Has clear entry and exit conditions
-3. Manages risk appropriately
-4. Specifies position sizing
-
-Choose from these strategy types:
-- LONG_EQUITY: Buy stock (bullish, simple)
-- SHORT_EQUITY: Short stock (bearish, simple)
-- COVERED_CALL: Own stock + sell calls (neutral to slightly bullish)
-- PROTECTIVE_PUT: Own stock + buy puts (bullish with protection)
-- BULL_CALL_SPREAD: Buy call + sell higher call (moderately bullish)
-- BEAR_PUT_SPREAD: Buy put + sell lower put (moderately bearish)
-- IRON_CONDOR: Sell both spreads (neutral, range-bound)
-- STRADDLE: Buy call + put (expecting big move, uncertain direction)
-- STRANGLE: Buy OTM call + OTM put (expecting big move, cheaper than straddle)
-- CALENDAR_SPREAD: Buy far-dated + sell near-dated options (profit from time decay)
-
-Provide your strategy in JSON format:
-{{
-    "strategy_type": "one of the types above",
-    "rationale": "why this strategy fits the analysis",
-    "entry_conditions": ["condition1", "condition2"],
-    "exit_conditions": ["condition1", "condition2"],
-    "position_size_pct": <0.01 to 0.05>,
-    "expected_return": <percentage>,
-    "max_loss": <percentage>,
-    "time_horizon_days": <number>,
-    "confidence_score": <0.0 to 1.0>
-}}
-"""
+            input_text = _INPUT_TEMPLATE.substitute(
+                symbol=symbol,
+                debate_summary=debate_summary,
+                current_price=current_price or "N/A",
+                has_options=has_options,
+                support=", ".join(f"${x:.2f}" for x in support_levels),
+                resistance=", ".join(f"${x:.2f}" for x in resistance_levels),
+                direction=overall_direction.value,
+            )
 
             # Generate strategy
             response = await self._generate_response(input_text)
 
             # Parse JSON response
             try:
-                if "```json" in response:
-                    json_str = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    json_str = response.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = response.strip()
-
-                parsed = json.loads(json_str)
+                parsed = parse_json_response(response)
 
                 strategy_type_str = parsed.get("strategy_type", "LONG_EQUITY")
                 rationale = parsed.get("rationale", "Strategy based on analysis")
@@ -188,7 +222,7 @@ Provide your strategy in JSON format:
                 position_size_pct = max(0.001, min(0.05, position_size_pct))
                 confidence_score = max(0.0, min(1.0, confidence_score))
 
-            except (json.JSONDecodeError, KeyError, IndexError, ValueError) as e:
+            except (JSONDecodeError, KeyError, ValueError) as e:
                 logger.warning("Failed to parse response, using defaults", error=str(e))
 
                 # Default strategy based on direction
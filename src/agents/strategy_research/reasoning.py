@@ -9,10 +9,12 @@ SECURITY WARNING:
     with base_url="https://api.deepseek.com".
 """
 
-import json
+import string
+from functools import lru_cache
 from typing import Any, Optional
 
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGenerationChunk
 from langchain_openai import ChatOpenAI
 
 from ...config import settings
@@ -22,12 +24,150 @@ from ...data.schemas import (
     DeepSeekReasoningReport,
     StrategyProposal,
 )
-from ...utils import get_logger
-from ..base import CriticalAgent
+from ...utils import JSONDecodeError, TTLCache, get_logger, hash_key, parse_json_response
+from .._http import get_llm_http_client
+from ..base import CriticalAgent, read_json_stream
 
 
 logger = get_logger(__name__)
 
+LOW_CONFIDENCE = 0.7  # Validations below this are candidates for self-correction
+SELF_CORRECTION_CONFIDENCE = 0.65  # Corrected only below this, and only with an R1 trace
+
+# R1 validation memoization (settings.llm_response_cache). Kept shorter-lived
+# than agent responses so a cached verdict never outlasts the market it saw.
+VALIDATION_CACHE_SIZE = 256  # Reasoning responses kept
+VALIDATION_CACHE_TTL = 900.0  # Seconds a cached response is reused
+
+_VALIDATION_CACHE = TTLCache(maxsize=VALIDATION_CACHE_SIZE, ttl=VALIDATION_CACHE_TTL)
+
+VALIDATION_PROMPT_CACHE_SIZE = 512  # Rendered validation prompts kept
+
+# Static validation instructions, appended to the system prompt so the
+# provider can reuse its cached prefix across validations and self-corrections
+_VALIDATION_TASKS_BLOCK = """
+VALIDATION TASKS:
+1. Mathematically validate the expected return vs max loss ratio
+2. Assess if position sizing is appropriate for the risk level
+3. Evaluate entry/exit conditions for logical consistency
+4. Calculate estimated risk metrics (Greeks if options)
+5. Identify any hedging requirements
+6. Self-critique: What could be wrong with this analysis?
+
+Provide your validation in JSON format:
+{
+    "strategy_validated": true/false,
+    "approval_status": "approved" or "rejected" or "needs_modification",
+    "mathematical_analysis": "detailed analysis",
+    "risk_metrics": {
+        "risk_reward_ratio": <number>,
+        "expected_sharpe": <number>,
+        "max_drawdown_estimate": <percentage>
+    },
+    "hedging_recommendation": "recommendation if needed",
+    "self_correction_notes": ["note1", "note2"],
+    "confidence_score": <0.0-1.0>,
+    "summary": "brief summary"
+}
+"""
+
+# Per-call prompts, compiled once at import and filled per validation
+_VALIDATION_TEMPLATE = string.Template(
+    """
+Validate the following trading strategy using mathematical reasoning.
+
+STRATEGY PROPOSAL:
+- Symbol: $symbol
+- Strategy Type: $strategy_type
+- Direction: $direction
+- Expected Return: $expected_return%
+- Max Loss: $max_loss%
+- Position Size: $position_pct%
+- Time Horizon: $time_horizon_days days
+- Rationale: $rationale
+
+ENTRY CONDITIONS:
+$entry_conditions
+
+EXIT CONDITIONS:
+$exit_conditions
+
+SUPPORTING ANALYSIS:
+- Technical Trend: $tech_trend
+- Technical Confidence: $tech_confidence
+- Fundamentals Thesis: $fund_thesis
+"""
+)
+
+_CORRECTION_TEMPLATE = string.Template(
+    """
+Your initial validation had low confidence ($confidence).
+
+INITIAL ASSESSMENT:
+$summary
+
+SELF-CORRECTION NOTES:
+$notes
+
+Please re-evaluate your analysis:
+1. What assumptions may have been incorrect?
+2. Are there alternative interpretations?
+3. What additional information would help?
+4. Provide a refined assessment with updated confidence.
+
+Respond in JSON format with the same structure as before.
+"""
+)
+
+
+@lru_cache(maxsize=VALIDATION_PROMPT_CACHE_SIZE)
+def _render_validation_prompt(
+    entry_conditions: tuple[str, ...], exit_conditions: tuple[str, ...], **fields: Any
+) -> str:
+    """
+    Render the validation prompt; an identical proposal reuses the rendered text.
+
+    Args:
+        entry_conditions: Strategy entry conditions
+        exit_conditions: Strategy exit conditions
+        **fields: Remaining _VALIDATION_TEMPLATE fields (hashable values)
+
+    Returns:
+        Validation prompt text
+    """
+    return _VALIDATION_TEMPLATE.substitute(
+        fields,
+        entry_conditions="\n".join(f"- {c}" for c in entry_conditions),
+        exit_conditions="\n".join(f"- {c}" for c in exit_conditions),
+    )
+
+
+class _ReasonerChatOpenAI(ChatOpenAI):
+    """
+    ChatOpenAI that keeps DeepSeek R1's streamed chain of thought.
+
+    ChatOpenAI drops delta fields outside the OpenAI schema, so R1's
+    ``reasoning_content`` is copied into each chunk's additional_kwargs here,
+    the same place langchain-deepseek puts it.
+    """
+
+    def _convert_chunk_to_generation_chunk(
+        self,
+        chunk: dict,
+        default_chunk_class: type,
+        base_generation_info: Optional[dict],
+    ) -> Optional[ChatGenerationChunk]:
+        """Convert a raw stream chunk, carrying over its reasoning delta."""
+        generation_chunk = super()._convert_chunk_to_generation_chunk(
+            chunk, default_chunk_class, base_generation_info
+        )
+        choices = chunk.get("choices") or []
+        if generation_chunk is not None and choices:
+            reasoning = (choices[0].get("delta") or {}).get("reasoning_content")
+            if reasoning:
+                generation_chunk.message.additional_kwargs["reasoning_content"] = reasoning
+        return generation_chunk
+
 
 class DeepSeekReasoningAgent(CriticalAgent):
     """
@@ -47,47 +187,82 @@ class DeepSeekReasoningAgent(CriticalAgent):
         - Use for strategic decisions, not real-time execution
     """
 
+    # (model, base_url, api_key) -> R1 client shared across instances
+    _reasoning_llms: dict[tuple[str, str, str], _ReasonerChatOpenAI] = {}
+
     def __init__(self):
         """Initialize DeepSeek Reasoning Agent."""
         super().__init__(
             role=AgentRole.DEEPSEEK_REASONING_AGENT,
-            system_prompt=DEEPSEEK_REASONING_AGENT_PROMPT,
+            system_prompt=DEEPSEEK_REASONING_AGENT_PROMPT + _VALIDATION_TASKS_BLOCK,
             temperature=0.3,  # Lower temperature for more deterministic reasoning
         )
 
         # Initialize DeepSeek R1 LLM using OpenAI SDK
-        self._reasoning_llm: Optional[ChatOpenAI] = None
+        self._reasoning_llm: Optional[_ReasonerChatOpenAI] = None
 
-    def _get_reasoning_llm(self) -> ChatOpenAI:
+    def _get_reasoning_llm(self) -> _ReasonerChatOpenAI:
         """
         Get or create the DeepSeek R1 reasoning LLM.
 
-        Uses OpenAI SDK with custom base_url for DeepSeek API.
+        Uses OpenAI SDK with custom base_url for DeepSeek API. Clients are
+        shared by every agent instance with the same model, endpoint and key,
+        and use the shared LLM connection pool.
 
         Returns:
-            ChatOpenAI configured for DeepSeek R1
+            ChatOpenAI client configured for DeepSeek R1
         """
         if self._reasoning_llm is None:
             api_key = settings.deepseek_api_key or settings.openai_api_key
-            self._reasoning_llm = ChatOpenAI(
-                model=settings.deepseek_reasoner_model,
-                temperature=0.3,
-                openai_api_key=api_key,
-                openai_api_base=settings.deepseek_base_url,
-            )
+            key = (settings.deepseek_reasoner_model, settings.deepseek_base_url, api_key)
+            llm = self._reasoning_llms.get(key)
+            if llm is None:
+                llm = _ReasonerChatOpenAI(
+                    model=settings.deepseek_reasoner_model,
+                    temperature=0.3,
+                    openai_api_key=api_key,
+                    openai_api_base=settings.deepseek_base_url,
+                    http_async_client=get_llm_http_client(),
+                )
+                self._reasoning_llms[key] = llm
+            self._reasoning_llm = llm
         return self._reasoning_llm
 
-    async def _generate_reasoning_response(self, input_text: str) -> tuple[str, str]:
+    async def _generate_reasoning_response(
+        self, input_text: str, cache_key: Optional[bytes] = None
+    ) -> tuple[str, str, Optional[dict[str, Any]]]:
         """
         Generate response using DeepSeek R1 with reasoning extraction.
 
+        The response is streamed and its JSON object decoded as it arrives; the
+        request is closed once the object is complete, so trailing prose is
+        never generated.
+
+        With settings.llm_response_cache enabled, R1 responses are reused for
+        VALIDATION_CACHE_TTL seconds. Fallback responses are never cached.
+
         Args:
             input_text: The input prompt
+            cache_key: Key identifying equivalent requests (defaults to a
+                hash of input_text)
 
         Returns:
-            Tuple of (response_content, reasoning_content)
+            Tuple of (response_content, reasoning_content, parsed JSON object or
+            None if the answer held no complete object or R1 was unavailable)
             reasoning_content is logged for auditability but stripped from context
         """
+        # Only a real True opts in (settings are often mocked in tests)
+        if settings.llm_response_cache is not True:
+            cache_key = None
+        elif cache_key is None:
+            cache_key = hash_key(settings.deepseek_reasoner_model, self.system_prompt, input_text)
+
+        if cache_key is not None:
+            cached = _VALIDATION_CACHE.get(cache_key)
+            if cached is not None:
+                logger.info("Reusing cached DeepSeek R1 response")
+                return cached
+
         try:
             llm = self._get_reasoning_llm()
             messages = [
@@ -95,14 +270,25 @@ class DeepSeekReasoningAgent(CriticalAgent):
                 HumanMessage(content=input_text),
             ]
 
-            response = await llm.ainvoke(messages)
-            content = response.content
-
-            # Extract reasoning content if present (DeepSeek R1 format)
-            # The reasoning_content is typically in a special format
-            reasoning_content = ""
-            if hasattr(response, "additional_kwargs"):
-                reasoning_content = response.additional_kwargs.get("reasoning_content", "")
+            # Stream the answer so the request ends as soon as the JSON object
+            # closes; the reasoning trace (DeepSeek R1 format) arrives in each
+            # chunk's additional_kwargs
+            reasoning_parts = []
+
+            async def answer_chunks():
+                stream = llm.astream(messages)
+                try:
+                    async for chunk in stream:
+                        reasoning_parts.append(
+                            chunk.additional_kwargs.get("reasoning_content") or ""
+                        )
+                        if chunk.content:
+                            yield chunk.content
+                finally:
+                    await stream.aclose()
+
+            content, parsed = await read_json_stream(answer_chunks())
+            reasoning_content = "".join(reasoning_parts)
 
             # Log reasoning for auditability
             if reasoning_content:
@@ -111,7 +297,9 @@ class DeepSeekReasoningAgent(CriticalAgent):
                     reasoning_length=len(reasoning_content),
                 )
 
-            return content, reasoning_content
+            if cache_key is not None:
+                _VALIDATION_CACHE[cache_key] = (content, reasoning_content, parsed)
+            return content, reasoning_content, parsed
 
         except Exception as e:
             logger.warning(
@@ -120,7 +308,7 @@ class DeepSeekReasoningAgent(CriticalAgent):
             )
             # Fallback to standard LLM
             response = await self._generate_response(input_text)
-            return response, ""
+            return response, "", None
 
     async def analyze(self, context: dict[str, Any]) -> DeepSeekReasoningReport:
         """
@@ -150,21 +338,31 @@ class DeepSeekReasoningAgent(CriticalAgent):
             # Prepare validation prompt
             validation_prompt = self._build_validation_prompt(context)
 
-            # Generate reasoning response
-            response, reasoning_trace = await self._generate_reasoning_response(
-                validation_prompt
+            # Generate reasoning response; equivalent proposals share a cache slot
+            response, reasoning_trace, parsed = await self._generate_reasoning_response(
+                validation_prompt, cache_key=self._validation_key(context)
             )
 
-            # Parse the response
+            # Build the report from the object decoded while streaming
             report = self._parse_validation_response(
                 symbol=symbol,
                 response=response,
                 reasoning_trace=reasoning_trace,
+                parsed=parsed,
             )
 
-            # Self-correction loop
-            if report.confidence < 0.7:
+            # Self-correction loop. Skipped when R1 was unavailable (the fallback
+            # LLM leaves no reasoning to refine) or confidence is only marginally
+            # low, where a second R1 round-trip rarely changes the verdict.
+            if report.confidence < SELF_CORRECTION_CONFIDENCE and report.reasoning_trace:
                 report = await self._self_correct(context, report)
+            elif report.confidence < LOW_CONFIDENCE:
+                logger.info(
+                    "Self-correction skipped",
+                    symbol=symbol,
+                    confidence=report.confidence,
+                    has_reasoning=bool(report.reasoning_trace),
+                )
 
             logger.info(
                 "Strategy validation complete",
@@ -185,6 +383,61 @@ class DeepSeekReasoningAgent(CriticalAgent):
                 approval_status="rejected",
             )
 
+    def _validation_key(self, context: dict[str, Any]) -> bytes:
+        """
+        Build the cache key for validating a proposal.
+
+        Only the structured fields are used, rounded to 0.01, so proposals
+        that differ just in free-text rationale or by rounding noise share a
+        key. The entry and exit conditions, technical trend and confidence and
+        fundamentals thesis are included, since the prompt asks R1 to judge
+        them; a change in any of them gets a fresh validation.
+
+        Args:
+            context: Contains strategy_proposal and analyst_reports
+
+        Returns:
+            Cache key bytes
+        """
+        strategy = context.get("strategy_proposal")
+        analyst_reports = context.get("analyst_reports", {})
+        technical = analyst_reports.get("technical")
+        fundamentals = analyst_reports.get("fundamentals")
+
+        thesis = None
+        if fundamentals:
+            thesis = getattr(
+                fundamentals.investment_thesis, "value", fundamentals.investment_thesis
+            )
+
+        levels = ()
+        trend = tech_confidence = None
+        if technical:
+            trend = getattr(technical.trend_direction, "value", technical.trend_direction)
+            tech_confidence = round(technical.confidence, 2)
+            levels = (
+                tuple(sorted(round(x, 2) for x in technical.support_levels)),
+                tuple(sorted(round(x, 2) for x in technical.resistance_levels)),
+            )
+
+        return hash_key(
+            settings.deepseek_reasoner_model,
+            self.system_prompt,
+            strategy.symbol,
+            getattr(strategy.strategy_type, "value", strategy.strategy_type),
+            getattr(strategy.direction, "value", strategy.direction),
+            round(strategy.position_size_pct * 100, 2),
+            round(strategy.expected_return, 2),
+            round(strategy.max_loss, 2),
+            strategy.time_horizon_days,
+            tuple(strategy.entry_conditions),
+            tuple(strategy.exit_conditions),
+            trend,
+            tech_confidence,
+            levels,
+            thesis,
+        )
+
     def _build_validation_prompt(self, context: dict[str, Any]) -> str:
         """Build the validation prompt for DeepSeek R1."""
         strategy = context.get("strategy_proposal")
@@ -218,73 +471,33 @@ class DeepSeekReasoningAgent(CriticalAgent):
                 else str(fundamentals.investment_thesis)
             )
 
-        prompt = f"""
-Validate the following trading strategy using mathematical reasoning.
-
-STRATEGY PROPOSAL:
-- Symbol: {strategy.symbol}
-- Strategy Type: {strategy.strategy_type}
-- Direction: {direction_value}
-- Expected Return: {strategy.expected_return}%
-- Max Loss: {strategy.max_loss}%
-- Position Size: {strategy.position_size_pct * 100}%
-- Time Horizon: {strategy.time_horizon_days} days
-- Rationale: {strategy.rationale}
-
-ENTRY CONDITIONS:
-{chr(10).join([f"- {c}" for c in strategy.entry_conditions])}
-
-EXIT CONDITIONS:
-{chr(10).join([f"- {c}" for c in strategy.exit_conditions])}
-
-SUPPORTING ANALYSIS:
-- Technical Trend: {tech_trend}
-- Technical Confidence: {technical.confidence if technical else "N/A"}
-- Fundamentals Thesis: {fund_thesis}
-
-VALIDATION TASKS:
-1. Mathematically validate the expected return vs max loss ratio
-2. Assess if position sizing is appropriate for the risk level
-3. Evaluate entry/exit conditions for logical consistency
-4. Calculate estimated risk metrics (Greeks if options)
-5. Identify any hedging requirements
-6. Self-critique: What could be wrong with this analysis?
-
-Provide your validation in JSON format:
-{{
-    "strategy_validated": true/false,
-    "approval_status": "approved" or "rejected" or "needs_modification",
-    "mathematical_analysis": "detailed analysis",
-    "risk_metrics": {{
-        "risk_reward_ratio": <number>,
-        "expected_sharpe": <number>,
-        "max_drawdown_estimate": <percentage>
-    }},
-    "hedging_recommendation": "recommendation if needed",
-    "self_correction_notes": ["note1", "note2"],
-    "confidence_score": <0.0-1.0>,
-    "summary": "brief summary"
-}}
-"""
-        return prompt
+        return _render_validation_prompt(
+            symbol=strategy.symbol,
+            strategy_type=strategy.strategy_type,
+            direction=direction_value,
+            expected_return=strategy.expected_return,
+            max_loss=strategy.max_loss,
+            position_pct=strategy.position_size_pct * 100,
+            time_horizon_days=strategy.time_horizon_days,
+            rationale=strategy.rationale,
+            entry_conditions=tuple(strategy.entry_conditions),
+            exit_conditions=tuple(strategy.exit_conditions),
+            tech_trend=tech_trend,
+            tech_confidence=technical.confidence if technical else "N/A",
+            fund_thesis=fund_thesis,
+        )
 
     def _parse_validation_response(
         self,
         symbol: str,
         response: str,
         reasoning_trace: str,
+        parsed: Optional[dict[str, Any]] = None,
     ) -> DeepSeekReasoningReport:
-        """Parse the validation response into a report."""
+        """Parse the validation response into a report, unless it was already decoded."""
         try:
-            # Extract JSON from response
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = response.strip()
-
-            parsed = json.loads(json_str)
+            if parsed is None:
+                parsed = parse_json_response(response)
 
             return DeepSeekReasoningReport(
                 symbol=symbol,
@@ -300,7 +513,7 @@ Provide your validation in JSON format:
                 approval_status=parsed.get("approval_status", "pending"),
             )
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (JSONDecodeError, KeyError) as e:
             logger.warning("Failed to parse validation response", error=str(e))
             return DeepSeekReasoningReport(
                 symbol=symbol,
@@ -328,25 +541,17 @@ Provide your validation in JSON format:
         """
         logger.info("Performing self-correction loop", symbol=initial_report.symbol)
 
-        correction_prompt = f"""
-Your initial validation had low confidence ({initial_report.confidence}).
-
-INITIAL ASSESSMENT:
-{initial_report.summary}
-
-SELF-CORRECTION NOTES:
-{chr(10).join(initial_report.self_correction_notes)}
-
-Please re-evaluate your analysis:
-1. What assumptions may have been incorrect?
-2. Are there alternative interpretations?
-3. What additional information would help?
-4. Provide a refined assessment with updated confidence.
-
-Respond in JSON format with the same structure as before.
-"""
+        correction_prompt = _CORRECTION_TEMPLATE.substitute(
+            confidence=initial_report.confidence,
+            summary=initial_report.summary,
+            notes="\n".join(initial_report.self_correction_notes),
+        )
 
-        response, reasoning = await self._generate_reasoning_response(correction_prompt)
+        # The correction prompt omits the proposal, so key it on the validation too
+        response, reasoning, parsed = await self._generate_reasoning_response(
+            correction_prompt,
+            cache_key=hash_key(self._validation_key(context), correction_prompt),
+        )
 
         # Merge reasoning traces
         combined_reasoning = f"""
@@ -361,6 +566,7 @@ Respond in JSON format with the same structure as before.
             symbol=initial_report.symbol,
             response=response,
             reasoning_trace=combined_reasoning,
+            parsed=parsed,
         )
 
         # Add self-correction note
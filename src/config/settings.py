@@ -63,6 +63,16 @@ class Settings(BaseSettings):
         default="deepseek-ai/Janus-Pro-7B",
         description="Janus-Pro model for chart pattern recognition",
     )
+    janus_pro_max_concurrent: int = Field(
+        default=8,
+        description="Maximum Janus-Pro chart analyses in flight at once",
+    )
+
+    # FinGPT Configuration
+    fingpt_vllm_endpoint: str = Field(
+        default="http://localhost:8003",
+        description="vLLM OpenAI-compatible server hosting FinGPT (backend='vllm')",
+    )
 
     # FinRL Configuration (Deep Reasoner v2.0 - Execution Engine)
     finrl_enabled: bool = Field(
@@ -123,6 +133,10 @@ class Settings(BaseSettings):
     max_sector_concentration: float = Field(
         default=0.25, description="Maximum concentration in any sector"
     )
+    risk_manager_model: Optional[str] = Field(
+        default=None,
+        description="Model for the Risk Manager's short JSON review (defaults to the premium model)",
+    )
 
     # Execution Configuration
     paper_trading: bool = Field(default=True, description="Enable paper trading mode")
@@ -135,6 +149,14 @@ class Settings(BaseSettings):
     )
     max_debate_rounds: int = Field(default=3, description="Maximum number of debate rounds")
     analysis_timeout_seconds: int = Field(default=30, description="Timeout for analysis phase")
+    llm_streaming: bool = Field(
+        default=False,
+        description="Stream agent LLM responses and decode JSON fields as they arrive",
+    )
+    llm_response_cache: bool = Field(
+        default=False,
+        description="Reuse an agent's LLM response for an identical prompt for five minutes",
+    )
 
     # Data Configuration
     market_data_cache_ttl: int = Field(default=300, description="Market data cache TTL in seconds")
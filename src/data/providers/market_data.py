@@ -5,20 +5,41 @@ from typing import Any, Optional
 import pandas as pd
 import yfinance as yf
 
+from src.config.settings import settings
+from src.utils.cache import TTLCache
 from src.utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+MARKET_DATA_CACHE_SIZE = 512  # Price histories and prices kept across all symbols
+
 
 class MarketDataProvider:
     """Provider for market data using yfinance."""
 
+    _shared: Optional["MarketDataProvider"] = None
+
     def __init__(self):
         """Initialize the market data provider."""
-        self._cache: dict[str, Any] = {}
+        self._cache = TTLCache(maxsize=MARKET_DATA_CACHE_SIZE, ttl=settings.market_data_cache_ttl)
         logger.info("MarketDataProvider initialized")
 
+    @classmethod
+    def shared(cls) -> "MarketDataProvider":
+        """
+        Return the process-wide provider, creating it on first use.
+
+        Agents and workflow steps share this instance so they reuse one
+        response cache and yfinance session instead of one per agent.
+
+        Returns:
+            Shared MarketDataProvider
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
     def get_price_history(
         self, symbol: str, period: str = "1y", interval: str = "1d"
     ) -> pd.DataFrame:
@@ -33,6 +54,12 @@ class MarketDataProvider:
         Returns:
             DataFrame with OHLCV data
         """
+        cache_key = f"history:{symbol}:{period}:{interval}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            # Callers may add indicator columns, so never hand out the cached frame
+            return cached.copy()
+
         try:
             ticker = yf.Ticker(symbol)
             history = ticker.history(period=period, interval=interval)
@@ -42,6 +69,8 @@ class MarketDataProvider:
                 period=period,
                 rows=len(history),
             )
+            if not history.empty:
+                self._cache[cache_key] = history.copy()
             return history
         except Exception as e:
             logger.error("Failed to get price history", symbol=symbol, error=str(e))
@@ -57,6 +86,11 @@ class MarketDataProvider:
         Returns:
             Current price or None if unavailable
         """
+        cache_key = f"price:{symbol}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.info
@@ -66,6 +100,7 @@ class MarketDataProvider:
 
             if price:
                 logger.info("Retrieved current price", symbol=symbol, price=price)
+                self._cache[cache_key] = float(price)
                 return float(price)
 
             logger.warning("No price found", symbol=symbol)
@@ -75,6 +110,46 @@ class MarketDataProvider:
             logger.error("Failed to get current price", symbol=symbol, error=str(e))
             return None
 
+    def get_quote(self, symbol: str) -> dict[str, Optional[float]]:
+        """
+        Get the current price, bid/ask and volume for a symbol.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Dictionary with price, bid, ask and volume (None where unavailable)
+        """
+        cache_key = f"quote:{symbol}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        try:
+            ticker = yf.Ticker(symbol)
+            info = ticker.info
+
+            price = info.get("currentPrice") or info.get("regularMarketPrice")
+            quote = {
+                "price": float(price) if price else None,
+                "bid": float(info["bid"]) if info.get("bid") else None,
+                "ask": float(info["ask"]) if info.get("ask") else None,
+                "volume": info.get("volume") or info.get("regularMarketVolume"),
+            }
+
+            if quote["price"] is not None:
+                logger.info("Retrieved quote", symbol=symbol, price=quote["price"])
+                # Same info fields as get_current_price, so it shares the price entry
+                self._cache[cache_key] = quote
+                self._cache[f"price:{symbol}"] = quote["price"]
+            else:
+                logger.warning("No quote found", symbol=symbol)
+            return dict(quote)
+
+        except Exception as e:
+            logger.error("Failed to get quote", symbol=symbol, error=str(e))
+            return {"price": None, "bid": None, "ask": None, "volume": None}
+
     def get_fundamentals(self, symbol: str) -> dict[str, Any]:
         """
         Get fundamental data for a symbol.
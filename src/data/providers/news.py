@@ -1,19 +1,25 @@
 """News provider using yfinance and keyword-based sentiment analysis."""
 
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Optional
 
 import yfinance as yf
 
+from src.config.settings import settings
+from src.utils.cache import TTLCache
 from src.utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+NEWS_CACHE_SIZE = 256  # Company and market news lists kept across all symbols
+
 
 class NewsProvider:
     """Provider for news and sentiment analysis."""
 
+    _shared: Optional["NewsProvider"] = None
+
     # Keyword lists for sentiment analysis
     POSITIVE_KEYWORDS = [
         "surge",
@@ -61,9 +67,24 @@ class NewsProvider:
 
     def __init__(self):
         """Initialize the news provider."""
-        self._cache: dict[str, Any] = {}
+        self._cache = TTLCache(maxsize=NEWS_CACHE_SIZE, ttl=settings.market_data_cache_ttl)
         logger.info("NewsProvider initialized")
 
+    @classmethod
+    def shared(cls) -> "NewsProvider":
+        """
+        Return the process-wide provider, creating it on first use.
+
+        Agents and workflow steps share this instance so they reuse one
+        response cache and yfinance session instead of one per agent.
+
+        Returns:
+            Shared NewsProvider
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
     def _analyze_sentiment(self, text: str) -> str:
         """
         Analyze sentiment of text using keyword matching.
@@ -105,6 +126,11 @@ class NewsProvider:
         Returns:
             List of news articles with sentiment
         """
+        cache_key = f"company_news:{symbol}:{days_back}:{max_articles}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return [dict(article) for article in cached]
+
         try:
             ticker = yf.Ticker(symbol)
             news = ticker.news
@@ -127,11 +153,13 @@ class NewsProvider:
                     summary = article.get("summary", "")
                     combined_text = f"{title} {summary}"
 
+                    published = datetime.fromtimestamp(publish_time)
                     processed_article = {
                         "title": title,
                         "publisher": article.get("publisher", "Unknown"),
                         "link": article.get("link", ""),
-                        "published": datetime.fromtimestamp(publish_time),
+                        "published": published,
+                        "published_iso": published.date().isoformat(),
                         "summary": summary,
                         "sentiment": self._analyze_sentiment(combined_text),
                     }
@@ -143,6 +171,8 @@ class NewsProvider:
                 articles=len(articles),
                 days_back=days_back,
             )
+            # The shared provider hands out copies, so callers cannot edit the cache
+            self._cache[cache_key] = [dict(article) for article in articles]
             return articles
 
         except Exception as e:
@@ -160,6 +190,11 @@ class NewsProvider:
         Returns:
             List of news articles with sentiment
         """
+        cache_key = f"market_news:{days_back}:{max_articles}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return [dict(article) for article in cached]
+
         try:
             # Get news from major indices
             indices = ["^GSPC", "^DJI", "^IXIC"]
@@ -188,11 +223,13 @@ class NewsProvider:
                             summary = article.get("summary", "")
                             combined_text = f"{title} {summary}"
 
+                            published = datetime.fromtimestamp(publish_time)
                             processed_article = {
                                 "title": title,
                                 "publisher": article.get("publisher", "Unknown"),
                                 "link": article.get("link", ""),
-                                "published": datetime.fromtimestamp(publish_time),
+                                "published": published,
+                                "published_iso": published.date().isoformat(),
                                 "summary": summary,
                                 "sentiment": self._analyze_sentiment(combined_text),
                             }
@@ -210,6 +247,8 @@ class NewsProvider:
                 articles=len(articles),
                 days_back=days_back,
             )
+            # The shared provider hands out copies, so callers cannot edit the cache
+            self._cache[cache_key] = [dict(article) for article in articles]
             return articles
 
         except Exception as e:
@@ -172,6 +172,12 @@ async def main():
         print(f"\nError: {e}")
         return 1
 
+    finally:
+        from agents._http import close_llm_http_client
+
+        # Release pooled LLM connections before the event loop shuts down
+        await close_llm_http_client()
+
 
 if __name__ == "__main__":
     sys.exit(asyncio.run(main()))
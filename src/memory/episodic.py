@@ -83,6 +83,55 @@ class EpisodicMemory:
         """Get a new database session."""
         return self.SessionLocal()
 
+    @staticmethod
+    def _trade_record(trade: TradeOutcome) -> TradeRecord:
+        """Build the database row for a trade outcome."""
+        # Handle both string and enum types for strategy_type
+        # Pydantic's use_enum_values=True converts enums to strings
+        strategy_type_value = (
+            trade.strategy_type
+            if isinstance(trade.strategy_type, str)
+            else trade.strategy_type.value
+        )
+
+        return TradeRecord(
+            trade_id=trade.trade_id,
+            symbol=trade.symbol,
+            strategy_type=strategy_type_value,
+            entry_date=trade.entry_date,
+            exit_date=trade.exit_date,
+            entry_price=trade.entry_price,
+            exit_price=trade.exit_price,
+            quantity=trade.quantity,
+            realized_pnl=trade.realized_pnl,
+            return_pct=trade.return_pct,
+            outcome=trade.outcome,
+            notes=trade.notes,
+        )
+
+    @staticmethod
+    def _reflection_record(reflection: Reflection) -> ReflectionRecord:
+        """Build the database row for a reflection."""
+        return ReflectionRecord(
+            reflection_id=f"refl_{reflection.trade_id}_{int(datetime.now().timestamp() * 1000000)}",
+            trade_id=reflection.trade_id,
+            symbol=reflection.symbol,
+            analysis_summary=reflection.analysis_summary,
+            what_worked=reflection.what_worked,
+            what_failed=reflection.what_failed,
+            lessons_learned=reflection.lessons_learned,
+            strategic_recommendations=reflection.strategic_recommendations,
+        )
+
+    def _store(self, *records: Base) -> None:
+        """Write records in a single transaction."""
+        session = self._get_session()
+        try:
+            session.add_all(records)
+            session.commit()
+        finally:
+            session.close()
+
     def store_trade(self, trade: TradeOutcome) -> None:
         """
         Store a trade outcome in episodic memory.
@@ -90,34 +139,7 @@ class EpisodicMemory:
         Args:
             trade: TradeOutcome object
         """
-        session = self._get_session()
-        try:
-            # Handle both string and enum types for strategy_type
-            # Pydantic's use_enum_values=True converts enums to strings
-            strategy_type_value = (
-                trade.strategy_type
-                if isinstance(trade.strategy_type, str)
-                else trade.strategy_type.value
-            )
-
-            record = TradeRecord(
-                trade_id=trade.trade_id,
-                symbol=trade.symbol,
-                strategy_type=strategy_type_value,
-                entry_date=trade.entry_date,
-                exit_date=trade.exit_date,
-                entry_price=trade.entry_price,
-                exit_price=trade.exit_price,
-                quantity=trade.quantity,
-                realized_pnl=trade.realized_pnl,
-                return_pct=trade.return_pct,
-                outcome=trade.outcome,
-                notes=trade.notes,
-            )
-            session.add(record)
-            session.commit()
-        finally:
-            session.close()
+        self._store(self._trade_record(trade))
 
     def store_reflection(self, reflection: Reflection) -> None:
         """
@@ -126,22 +148,17 @@ class EpisodicMemory:
         Args:
             reflection: Reflection object
         """
-        session = self._get_session()
-        try:
-            record = ReflectionRecord(
-                reflection_id=f"refl_{reflection.trade_id}_{int(datetime.now().timestamp() * 1000000)}",
-                trade_id=reflection.trade_id,
-                symbol=reflection.symbol,
-                analysis_summary=reflection.analysis_summary,
-                what_worked=reflection.what_worked,
-                what_failed=reflection.what_failed,
-                lessons_learned=reflection.lessons_learned,
-                strategic_recommendations=reflection.strategic_recommendations,
-            )
-            session.add(record)
-            session.commit()
-        finally:
-            session.close()
+        self._store(self._reflection_record(reflection))
+
+    def store_trade_and_reflection(self, trade: TradeOutcome, reflection: Reflection) -> None:
+        """
+        Store a trade outcome and its reflection in one transaction.
+
+        Args:
+            trade: TradeOutcome object
+            reflection: Reflection on the trade
+        """
+        self._store(self._trade_record(trade), self._reflection_record(reflection))
 
     def get_trade(self, trade_id: str) -> Optional[TradeOutcome]:
         """
@@ -4,6 +4,7 @@ LangGraph workflow orchestration for Project Shri Sudarshan.
 This module defines the multi-agent workflow using LangGraph.
 """
 
+import asyncio
 from typing import Any
 
 from langgraph.graph import END, StateGraph
@@ -108,8 +109,8 @@ class TradingWorkflow:
         fingpt_analyst = FinGPTGenerativeAnalyst()
 
         # Initialize data providers (shared across analysts)
-        market_data_provider = MarketDataProvider()
-        news_provider = NewsProvider()
+        market_data_provider = MarketDataProvider.shared()
+        news_provider = NewsProvider.shared()
 
         # Prepare context
         context = {
@@ -122,7 +123,9 @@ class TradingWorkflow:
 
         try:
             # Fetch news for specialized analysts (done once, outside conditional)
-            news_items = news_provider.get_news(state["symbol"], limit=10)
+            news_items = await asyncio.to_thread(
+                news_provider.get_company_news, state["symbol"], max_articles=10
+            )
             news_texts = [item["title"] + ". " + item.get("summary", "") for item in news_items]
 
             # Prepare contexts for specialized analysts
@@ -131,8 +134,6 @@ class TradingWorkflow:
 
             # Run all analysts concurrently if enabled
             if settings.enable_concurrent_analysis:
-                import asyncio
-
                 logger.info("Running analysts concurrently")
 
                 results = await asyncio.gather(
@@ -246,7 +247,11 @@ class TradingWorkflow:
         """
         print(f"[Debate Phase] Debating strategy for {state['symbol']}")
 
-        from ..agents.strategy_research import BearishResearcher, BullishResearcher
+        from ..agents.strategy_research import (
+            BearishResearcher,
+            BullishResearcher,
+            debate_pair,
+        )
 
         # Initialize researchers
         bullish_researcher = BullishResearcher()
@@ -267,22 +272,16 @@ class TradingWorkflow:
             for round_num in range(1, max_rounds + 1):
                 print(f"  Round {round_num}/{max_rounds}")
 
-                # Bullish researcher argues first
-                bullish_arg = await bullish_researcher.debate(
+                # Both researchers answer the previous rounds concurrently
+                bullish_arg, bearish_arg = await debate_pair(
+                    bullish_researcher,
+                    bearish_researcher,
                     context,
                     round_number=round_num,
                     previous_arguments=debate_arguments,
                 )
-                debate_arguments.append(bullish_arg)
+                debate_arguments.extend((bullish_arg, bearish_arg))
                 print(f"    ✓ Bullish: {bullish_arg.argument[:100]}...")
-
-                # Bearish researcher responds
-                bearish_arg = await bearish_researcher.debate(
-                    context,
-                    round_number=round_num,
-                    previous_arguments=debate_arguments,
-                )
-                debate_arguments.append(bearish_arg)
                 print(f"    ✓ Bearish: {bearish_arg.argument[:100]}...")
 
             state["debate_arguments"] = debate_arguments
@@ -311,7 +310,7 @@ class TradingWorkflow:
 
         # Initialize strategist
         derivatives_strategist = DerivativesStrategist()
-        market_data_provider = MarketDataProvider()
+        market_data_provider = MarketDataProvider.shared()
 
         # Prepare context
         context = {
@@ -389,7 +388,7 @@ class TradingWorkflow:
         print(f"  Using {trader_type} Trader for {strategy_type.value}")
 
         # Prepare context
-        market_data_provider = MarketDataProvider()
+        market_data_provider = MarketDataProvider.shared()
         context = {
             "symbol": state["symbol"],
             "strategy_proposal": strategy_proposal,
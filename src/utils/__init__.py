@@ -1,6 +1,28 @@
 """Utilities package for Project Shri Sudarshan."""
 
+from .batching import BatchingExecutor
+from .cache import TTLCache, hash_key
+from .json_utils import (
+    IncrementalJsonParser,
+    JSONDecodeError,
+    extract_json,
+    json_dumps,
+    json_loads,
+    parse_json_response,
+)
 from .logger import get_logger, setup_logging
 
 
-__all__ = ["setup_logging", "get_logger"]
+__all__ = [
+    "setup_logging",
+    "get_logger",
+    "BatchingExecutor",
+    "TTLCache",
+    "hash_key",
+    "JSONDecodeError",
+    "IncrementalJsonParser",
+    "extract_json",
+    "json_dumps",
+    "json_loads",
+    "parse_json_response",
+]
@@ -0,0 +1,101 @@
+"""
+Micro-batching utilities for Project Shri Sudarshan.
+"""
+
+import asyncio
+from typing import Any, Callable, Optional
+
+
+class BatchingExecutor:
+    """
+    Coalesce concurrent requests into a single batched call.
+
+    Items submitted within ``max_wait`` seconds of each other (up to
+    ``max_batch`` items) are handed to ``batch_fn`` together. ``batch_fn``
+    is a blocking callable taking a list of items and returning a list of
+    results in the same order; it runs in a worker thread so the event loop
+    stays responsive.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[Any]], list[Any]],
+        max_batch: int = 16,
+        max_wait: float = 0.02,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            batch_fn: Blocking function processing a list of items
+            max_batch: Maximum number of items per batch
+            max_wait: Seconds to wait for more items after the first arrives
+        """
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_worker(self):
+        """Start the background drain task on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Submit an item and wait for its batched result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            The result produced for this item by ``batch_fn``
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self):
+        """Drain the queue into batches forever."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            items = [item for item, _ in batch]
+            try:
+                results = await asyncio.to_thread(self.batch_fn, items)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self):
+        """Cancel the background drain task."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
@@ -0,0 +1,183 @@
+"""
+JSON helpers for parsing LLM responses.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+import re
+from typing import Any, Optional, Union
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+# Fenced ```json block first, otherwise the outermost {...} span in the text
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.S)
+
+# Characters that change IncrementalJsonParser state: escape pairs (or a
+# backslash ending the chunk), quotes, brackets and member separators
+_JSON_TOKEN_RE = re.compile(r'\\.|\\$|["{}\[\],]', re.S)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON text.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy scalars and arrays for the standard-library encoder."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to JSON text.
+
+    Args:
+        obj: Object to serialize (NumPy scalars and arrays, and non-str dict
+            keys such as ints, are supported)
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        The JSON document as str
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default)
+
+
+def extract_json(text: str) -> str:
+    """
+    Extract the JSON object embedded in an LLM response.
+
+    Args:
+        text: Raw model output, optionally wrapping JSON in a markdown fence
+
+    Returns:
+        The JSON substring, or the stripped text if no object is found
+    """
+    match = _JSON_BLOCK_RE.search(text)
+    if match is None:
+        return text.strip()
+    return match.group(1) or match.group(2)
+
+
+def parse_json_response(text: str) -> Any:
+    """
+    Extract and decode the JSON object embedded in an LLM response.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        JSONDecodeError: If no valid JSON could be decoded
+    """
+    return json_loads(extract_json(text))
+
+
+class IncrementalJsonParser:
+    """
+    Decode the top-level members of a JSON object while its text streams in.
+
+    Prose or a markdown fence before the opening brace is skipped. Each
+    ``"key": value`` member is decoded as soon as the separator after it
+    arrives, so the object is already parsed when the closing brace does.
+    """
+
+    def __init__(self):
+        """Initialize an empty parser."""
+        self.fields: dict[str, Any] = {}
+        self.complete = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member: list[str] = []
+
+    def feed(self, chunk: str):
+        """
+        Consume the next piece of streamed text.
+
+        Args:
+            chunk: Text following everything fed so far
+
+        Raises:
+            JSONDecodeError: If a completed member is not valid JSON
+        """
+        if self.complete:
+            return
+
+        member_start = scan_start = 0
+        if self._depth == 0:
+            brace = chunk.find("{")
+            if brace < 0:
+                return
+            self._depth = 1
+            member_start = scan_start = brace + 1
+        elif self._escape:
+            # The previous chunk ended in a backslash escaping this character
+            self._escape = False
+            scan_start = 1
+
+        for match in _JSON_TOKEN_RE.finditer(chunk, scan_start):
+            token = match.group()
+            if token[0] == "\\":
+                self._escape = len(token) == 1
+            elif token == '"':
+                self._in_string = not self._in_string
+            elif self._in_string:
+                continue
+            elif token in "{[":
+                self._depth += 1
+            elif token in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._flush(chunk[member_start : match.start()])
+                    self.complete = True
+                    return
+            elif self._depth == 1:  # Top-level ","
+                self._flush(chunk[member_start : match.start()])
+                member_start = match.end()
+
+        self._member.append(chunk[member_start:])
+
+    def _flush(self, tail: str):
+        """Decode the buffered member ending with tail."""
+        self._member.append(tail)
+        text = "".join(self._member).strip()
+        self._member.clear()
+        if text:
+            self.fields.update(json_loads("{" + text + "}"))
+
+    def result(self) -> Optional[dict[str, Any]]:
+        """
+        Return the decoded object once its closing brace has been fed.
+
+        Returns:
+            The decoded members, or None if the object is still incomplete
+        """
+        return self.fields if self.complete else None
@@ -2,6 +2,8 @@
 Logging utilities for Project Shri Sudarshan.
 """
 
+import logging
+
 import structlog
 from structlog.stdlib import LoggerFactory
 
@@ -11,7 +13,14 @@ from ..config import settings
 def setup_logging():
     """
     Configure structured logging for the application.
+
+    Calls below settings.log_level return immediately from the bound logger,
+    before an event dict is built or any processor runs.
     """
+    level = logging.getLevelName(settings.log_level.upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
@@ -29,6 +38,7 @@ def setup_logging():
             ),
         ],
         context_class=dict,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         logger_factory=LoggerFactory(),
         cache_logger_on_first_use=True,
     )
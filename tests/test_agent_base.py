@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
 from pydantic import ValidationError
 
@@ -32,6 +33,44 @@ def test_create_llm_openai_default():
         assert llm.temperature == 0.7
 
 
+def test_create_llm_openai_clients_share_connection_pool():
+    """Test OpenAI-compatible clients reuse one async HTTP connection pool."""
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.openai_api_key = "test-key"
+        mock_settings.deepseek_api_key = "test-deepseek-key"
+        mock_settings.deepseek_base_url = "https://api.deepseek.com"
+
+        first = create_llm(model_name="gpt-4o-mini")
+        second = create_llm(model_name="gpt-4o", temperature=0.2)
+        deepseek = create_llm(model_name="deepseek-chat", provider="deepseek")
+
+        assert first.http_async_client is second.http_async_client
+        assert deepseek.http_async_client is first.http_async_client
+
+
+def test_llm_http_pool_follows_running_loop():
+    """Test each event loop gets its own pool and closing keeps the client usable."""
+    import asyncio
+
+    from src.agents import _http
+
+    async def pools():
+        client = _http.get_llm_http_client()
+        first = _http._transport._get_pool()
+        second = _http._transport._get_pool()
+        await _http.close_llm_http_client()
+        return client, first, second, _http._transport._get_pool()
+
+    client_a, pool_a, pool_a_again, reopened = asyncio.run(pools())
+    client_b, pool_b, _, _ = asyncio.run(pools())
+
+    assert client_a is client_b and not client_a.is_closed
+    assert pool_a is pool_a_again
+    assert reopened is not pool_a
+    assert pool_b is not pool_a
+
+
 def test_create_llm_openai_custom_model():
     """Test creating OpenAI LLM with custom model."""
     with patch("src.agents.base.settings") as mock_settings:
@@ -244,6 +283,144 @@ async def test_base_agent_generate_response():
             mock_llm.ainvoke.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_base_agent_reuses_cached_response():
+    """Test an identical prompt is answered from the response cache when enabled."""
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+        mock_settings.llm_response_cache = True
+
+        agent = MockAgent(role=AgentRole.FUNDAMENTALS_ANALYST, system_prompt="Cache prompt")
+        mock_llm = Mock(model_name="cache-test-model")
+        mock_llm.ainvoke = AsyncMock(side_effect=lambda msgs: Mock(content=msgs[1].content))
+
+        with patch.object(agent, "llm", new=mock_llm):
+            first = await agent._generate_response("same input")
+            second = await agent._generate_response("same input")
+            other = await agent._generate_response("other input")
+
+        assert first == second == "same input"
+        assert other == "other input"
+        assert mock_llm.ainvoke.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_base_agent_stops_stream_at_closing_brace():
+    """Test a streamed JSON reply is decoded and the stream closed at its last brace."""
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+
+        agent = MockAgent(role=AgentRole.FUNDAMENTALS_ANALYST, system_prompt="Test prompt")
+
+    pieces = []
+
+    async def stream(_input_text):
+        for piece in ('```json\n{"score": ', "0.4, ", '"label": "x"}', "\n```", " trailing"):
+            pieces.append(piece)
+            yield piece
+
+    agent._stream_response = stream
+    agent._generate_response = AsyncMock()
+
+    response, parsed = await agent._generate_json("input", stream=True)
+
+    assert parsed == {"score": 0.4, "label": "x"}
+    assert response.endswith("}")
+    assert len(pieces) == 3
+    agent._generate_response.assert_not_called()
+
+    # Buffered generation is used when streaming is disabled
+    agent._generate_response = AsyncMock(return_value="plain")
+    assert await agent._generate_json("input") == ("plain", None)
+
+
+@pytest.mark.asyncio
+async def test_base_agent_generate_structured():
+    """Test structured generation binds each reply schema once."""
+    from pydantic import BaseModel
+
+    class Reply(BaseModel):
+        approved: bool
+
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+
+        agent = MockAgent(role=AgentRole.FUNDAMENTALS_ANALYST, system_prompt="Test prompt")
+
+        structured = Mock()
+        structured.ainvoke = AsyncMock(return_value=Reply(approved=True))
+        mock_llm = Mock()
+        mock_llm.with_structured_output.return_value = structured
+
+        with patch.object(agent, "llm", new=mock_llm):
+            first = await agent._generate_structured("test input", Reply)
+            await agent._generate_structured("again", Reply)
+
+        assert first == Reply(approved=True)
+        mock_llm.with_structured_output.assert_called_once_with(Reply, method="json_schema")
+        assert structured.ainvoke.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_base_agent_reuses_cached_structured_reply():
+    """Test an identical prompt and schema reuse the cached structured reply."""
+    from pydantic import BaseModel
+
+    class Reply(BaseModel):
+        score: float
+
+    class OtherReply(BaseModel):
+        score: float
+
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+        mock_settings.llm_response_cache = True
+
+        agent = MockAgent(role=AgentRole.FUNDAMENTALS_ANALYST, system_prompt="Structured cache")
+
+        structured = Mock()
+        structured.ainvoke = AsyncMock(side_effect=lambda msgs: Reply(score=0.5))
+        mock_llm = Mock(model_name="structured-cache-model")
+        mock_llm.with_structured_output.return_value = structured
+
+        with patch.object(agent, "llm", new=mock_llm):
+            first = await agent._generate_structured("same input", Reply)
+            first.score = 2.0
+            second = await agent._generate_structured("same input", Reply)
+            await agent._generate_structured("same input", OtherReply)
+
+        assert second == Reply(score=0.5)
+        assert structured.ainvoke.await_count == 2
+
+
+def test_base_agent_flags_anthropic_system_prompt_for_caching():
+    """Test the system prompt is marked cacheable for Anthropic and sent plain otherwise."""
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "anthropic"
+        mock_settings.anthropic_standard_model = "claude-3-5-sonnet-20241022"
+        mock_settings.anthropic_api_key = "test-anthropic-key"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+
+        anthropic = MockAgent(role=AgentRole.FUNDAMENTALS_ANALYST, system_prompt="Static {x}")
+        openai = MockAgent(
+            role=AgentRole.FUNDAMENTALS_ANALYST, system_prompt="Static {x}", provider="openai"
+        )
+
+    [block] = anthropic._system_message().content
+    assert block["text"] == "Static {x}"
+    assert block["cache_control"] == {"type": "ephemeral"}
+    assert openai._system_message().content == "Static {x}"
+
+
 def test_base_agent_get_metadata():
     """Test agent metadata."""
     with patch("src.agents.base.settings") as mock_settings:
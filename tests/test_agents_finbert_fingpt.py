@@ -242,6 +242,9 @@ Opportunities:
     assert isinstance(report.risks_identified, list)
     assert isinstance(report.opportunities_identified, list)
     assert len(report.key_insights) > 0
+    # Stored as the plain value, like every other report's agent_role
+    assert type(report.agent_role) is str
+    assert report.agent_role == AgentRole.FINGPT_GENERATIVE_ANALYST.value
 
 
 @pytest.mark.asyncio
@@ -343,3 +346,307 @@ Opportunities:
     report = await agent.analyze(context)
 
     assert report.confidence >= 0.7  # Should have high confidence with rich output
+
+
+def test_fingpt_analyst_quant_bits():
+    """Test FinGPT analyst defaults to 4-bit weights and validates quant_bits."""
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    assert FinGPTGenerativeAnalyst(use_local=False).quant_bits == 4
+    assert FinGPTGenerativeAnalyst(use_local=False, quant_bits=8).quant_bits == 8
+
+    with pytest.raises(ValueError):
+        FinGPTGenerativeAnalyst(use_local=False, quant_bits=2)
+
+
+def test_fingpt_analyst_llama_cpp_backend():
+    """Test FinGPT analyst routes generation through a llama.cpp model."""
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    agent = FinGPTGenerativeAnalyst(model_name="fingpt.Q4_K_M.gguf", backend="llama_cpp")
+    calls = []
+
+    def fake_llama(prompt, max_tokens, temperature, top_p):
+        calls.append(max_tokens)
+        return {"choices": [{"text": " Insights:\n1. Strong margins\n"}]}
+
+    agent._model = fake_llama
+
+    response = agent._generate_response("prompt", max_length=128)
+
+    assert response == "Insights:\n1. Strong margins"
+    assert calls == [128]
+
+    with pytest.raises(ValueError):
+        FinGPTGenerativeAnalyst(backend="unknown")
+
+
+@pytest.mark.asyncio
+async def test_fingpt_analyst_llama_cpp_generates_off_event_loop():
+    """Test llama.cpp generation runs in a worker thread, not on the event loop."""
+    import threading
+
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    agent = FinGPTGenerativeAnalyst(model_name="fingpt.Q4_K_M.gguf", backend="llama_cpp")
+    threads = []
+
+    def fake_llama(prompt, max_tokens, temperature, top_p):
+        threads.append(threading.get_ident())
+        return {"choices": [{"text": "Insights:\n1. Strong margins"}]}
+
+    agent._model = fake_llama
+
+    response = await agent._generate("general_analysis", "AAPL", "Some news")
+
+    assert response == "Insights:\n1. Strong margins"
+    assert threads and threads[0] != threading.get_ident()
+
+
+def test_fingpt_analyst_decoding_kwargs():
+    """Test FinGPT analyst decodes greedily by default and can enable sampling."""
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    greedy = FinGPTGenerativeAnalyst(use_local=False)
+    assert greedy._decoding_kwargs() == {"do_sample": False}
+    assert greedy._sampling_params() == (0.0, 1.0)
+
+    sampled = FinGPTGenerativeAnalyst(use_local=False, do_sample=True)
+    assert sampled._decoding_kwargs()["do_sample"] is True
+    assert sampled._sampling_params() == (0.7, 0.9)
+
+    # Draft model is only attached to single-sequence (assisted) calls
+    draft = object()
+    greedy._draft_model = draft
+    assert greedy._decoding_kwargs(assisted=True)["assistant_model"] is draft
+    assert "assistant_model" not in greedy._decoding_kwargs()
+
+
+def test_fingpt_analyst_prompt_prefix_split():
+    """Test every FinGPT template splits into a static prefix and {text} tail."""
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    agent = FinGPTGenerativeAnalyst(use_local=False)
+
+    for analysis_type in agent.prompts:
+        prefix, tail = agent._split_template(analysis_type)
+        assert "{text}" not in prefix
+        assert tail.startswith("{text}")
+        rendered = prefix.format(symbol="AAPL") + tail.format(symbol="AAPL", text="body")
+        assert rendered == agent._build_prompt(analysis_type, "AAPL", "body")
+
+
+def test_fingpt_analysts_share_model_registry():
+    """Test FinGPT analysts with the same config share one loaded model."""
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+    from src.agents.market_intelligence._model_registry import ModelRegistry
+
+    loads = []
+
+    def fake_loader(self):
+        loads.append(self.model_name)
+        return object(), object()
+
+    first = FinGPTGenerativeAnalyst(model_name="shared-test-model")
+    second = FinGPTGenerativeAnalyst(model_name="shared-test-model")
+    for agent in (first, second):
+        agent._load_transformers_model = fake_loader.__get__(agent)
+        agent._load_model()
+
+    assert loads == ["shared-test-model"]
+    assert first._model is second._model
+    assert ModelRegistry.refcount(first._registry_key) == 2
+
+    first.release_model()
+    second.release_model()
+    assert ModelRegistry.refcount(first._registry_key) == 0
+
+
+@pytest.mark.asyncio
+async def test_fingpt_analyst_vllm_backend(sample_context):
+    """Test FinGPT analyst routes generation to the vLLM server."""
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    agent = FinGPTGenerativeAnalyst(backend="vllm", vllm_url="http://vllm:8000/")
+    prompts = []
+
+    async def fake_vllm(prompt, max_length):
+        prompts.append(prompt)
+        return "Key insights:\n1. Revenue growth\nRisks:\n- Competition"
+
+    agent._generate_vllm = fake_vllm
+
+    report = await agent.analyze({**sample_context, "text": "Quarterly results"})
+
+    assert agent.vllm_url == "http://vllm:8000"
+    assert len(prompts) == 1 and "Quarterly results" in prompts[0]
+    assert report.key_insights == ["Revenue growth"]
+    assert report.risks_identified == ["Competition"]
+
+
+@pytest.mark.asyncio
+async def test_fingpt_analyst_response_cache(sample_context):
+    """Test identical prompts are generated once when caching is enabled."""
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    agent = FinGPTGenerativeAnalyst(use_local=False, cache_responses=True)
+    calls = []
+
+    def mock_generate(prompt, max_length):
+        calls.append(prompt)
+        return "Insights:\n1. Cached point"
+
+    agent._generate_response = mock_generate
+    context = {**sample_context, "text": "Same filing text"}
+
+    first = await agent.analyze(context)
+    second = await agent.analyze(context)
+    await agent.analyze({**context, "text": "Different text"})
+
+    assert len(calls) == 2
+    assert first.key_insights == second.key_insights == ["Cached point"]
+
+
+def test_fingpt_analyst_token_budget_truncation():
+    """Test FinGPT truncates input text to the model's token budget."""
+    from types import SimpleNamespace
+
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+    from src.agents.market_intelligence.fingpt_analyst import MAX_INPUT_LENGTH, MAX_NEW_TOKENS
+
+    class WordTokenizer:
+        def __call__(self, text, add_special_tokens=True, truncation=False, max_length=None):
+            ids = text.split()
+            if truncation:
+                ids = ids[:max_length]
+            return SimpleNamespace(input_ids=ids)
+
+        def decode(self, ids, skip_special_tokens=True):
+            return " ".join(ids)
+
+    agent = FinGPTGenerativeAnalyst(use_local=False)
+    long_text = " ".join(f"w{i}" for i in range(5000))
+
+    # Without a tokenizer the character cap applies
+    assert agent._truncate_text(long_text) == long_text[:MAX_INPUT_LENGTH]
+
+    agent._tokenizer = WordTokenizer()
+    agent._model = SimpleNamespace(config=SimpleNamespace(max_position_embeddings=1024))
+
+    budget = agent._input_token_budget()
+    truncated = agent._truncate_text(long_text)
+
+    assert 0 < budget < 1024 - MAX_NEW_TOKENS
+    assert len(truncated.split()) == budget
+    assert agent._truncate_text("short text") == "short text"
+
+
+def test_fingpt_analyst_onnx_backend_loader():
+    """Test the onnx backend loads through the ONNX Runtime loader."""
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    agent = FinGPTGenerativeAnalyst(model_name="onnx-test-model", backend="onnx")
+    model, tokenizer = object(), object()
+    agent._load_onnx_model = lambda: (model, tokenizer)
+
+    agent._load_model()
+
+    assert agent._model is model
+    assert agent._tokenizer is tokenizer
+    agent.release_model()
+
+
+def test_fingpt_analyst_streams_and_stops_early(monkeypatch):
+    """Test HF generation streams new tokens and stops once all sections are full."""
+    import queue
+    import sys
+    import threading
+    from types import SimpleNamespace
+
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    class FakeStreamer:
+        def __init__(self, tokenizer, skip_prompt=False, skip_special_tokens=False):
+            self.queue = queue.Queue()
+            self.consumed = threading.Event()
+
+        def put(self, text):
+            self.consumed.clear()
+            self.queue.put(text)
+
+        def end(self):
+            self.queue.put(None)
+
+        def __iter__(self):
+            while (chunk := self.queue.get()) is not None:
+                yield chunk
+                self.consumed.set()
+
+    monkeypatch.setitem(
+        sys.modules,
+        "transformers",
+        SimpleNamespace(
+            StoppingCriteria=object,
+            StoppingCriteriaList=list,
+            TextIteratorStreamer=FakeStreamer,
+        ),
+    )
+
+    lines = (
+        ["Insights:"]
+        + [f"- strength {i}" for i in range(6)]
+        + ["Risks:"]
+        + [f"- threat {i}" for i in range(3)]
+        + ["Opportunities:"]
+        + [f"- upside {i}" for i in range(3)]
+        + [f"- filler {i}" for i in range(20)]
+    )
+
+    class Encoded(dict):
+        def to(self, device):
+            return self
+
+    class FakeModel:
+        device = "cpu"
+
+        def generate(self, input_ids, streamer, stopping_criteria, **kwargs):
+            self.kwargs = kwargs
+            self.emitted = 0
+            stopped = lambda: any(c(input_ids, None) for c in stopping_criteria)  # noqa: E731
+            for line in lines:
+                if stopped():
+                    break
+                streamer.put(line + "\n")
+                self.emitted += 1
+                while not (streamer.consumed.wait(0.005) or stopped()):
+                    pass
+            streamer.end()
+
+    agent = FinGPTGenerativeAnalyst(model_name="hf-test-model")
+    agent._model = FakeModel()
+    agent._tokenizer = lambda prompt, return_tensors=None: Encoded(input_ids=[[1, 2, 3]])
+    agent._load_model = lambda: None
+
+    response = agent._generate_response("prompt", max_length=64)
+    parsed = agent._parse_analysis(response)
+
+    assert agent._model.kwargs["max_new_tokens"] == 64
+    assert "max_length" not in agent._model.kwargs
+    assert agent._model.emitted == 15
+    assert len(parsed["insights"]) == 5
+    assert parsed["opportunities"][-1] == "upside 2"
+    assert "filler" not in response
+
+
+def test_fingpt_analyst_attention_implementation(monkeypatch):
+    """Test FlashAttention-2 is only selected on CUDA with flash-attn installed."""
+    import importlib.util
+
+    from src.agents.market_intelligence import FinGPTGenerativeAnalyst
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+    assert FinGPTGenerativeAnalyst._attention_implementation(True) == "flash_attention_2"
+    assert FinGPTGenerativeAnalyst._attention_implementation(False) == "sdpa"
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert FinGPTGenerativeAnalyst._attention_implementation(True) == "sdpa"
@@ -8,8 +8,11 @@ Tests all four Market Intelligence agents:
 - MacroNewsAnalyst
 """
 
+from unittest.mock import AsyncMock, Mock, patch
+
 import pytest
 
+from src.data.providers import NewsProvider
 from src.data.schemas import (
     AgentRole,
     FundamentalsReport,
@@ -94,6 +97,39 @@ async def test_fundamentals_analyst_metadata():
     assert "timestamp" in metadata
 
 
+@pytest.mark.asyncio
+async def test_fundamentals_analyst_populates_metrics(sample_context, sample_fundamentals):
+    """Test the real fundamentals analyst fills report metrics from provider data."""
+    from src.agents.market_intelligence import FundamentalsAnalyst
+
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+        agent = FundamentalsAnalyst()
+
+    agent._generate_response = AsyncMock(
+        return_value='```json\n{"investment_thesis": "bullish", "confidence_level": 8, '
+        '"intrinsic_value_estimate": 210.0, "analysis_summary": "Solid"}\n```'
+    )
+
+    report = await agent.analyze(sample_context)
+
+    assert isinstance(report, FundamentalsReport)
+    assert report.summary == "Solid"
+    assert report.investment_thesis == Sentiment.BULLISH
+    assert report.revenue == sample_fundamentals["revenue"]
+    assert report.pe_ratio == sample_fundamentals["pe_ratio"]
+    assert report.roe == sample_fundamentals["roe"]
+    assert report.current_price == 195.50
+    assert report.intrinsic_value == 210.0
+    assert report.metadata["financial_metrics"] == sample_fundamentals
+
+    prompt = agent._generate_response.call_args.args[0]
+    assert "Name: Apple Inc." in prompt
+    assert "P/E Ratio (Trailing): 28.5" in prompt
+
+
 # =============================================================================
 # Technical Analyst Tests
 # =============================================================================
@@ -239,11 +275,144 @@ async def test_sentiment_analyst_interest_metrics(sample_context):
     assert report.institutional_activity is not None
 
 
+@pytest.mark.asyncio
+async def test_sentiment_analyst_trending_topics():
+    """Test the real sentiment analyst counts leading headline words as topics."""
+    from src.agents.market_intelligence import SentimentAnalyst
+
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+        agent = SentimentAnalyst()
+
+    news_provider = Mock(spec=NewsProvider)
+    news_provider.aggregate_sentiment.return_value = {
+        "sentiment_label": "bullish",
+        "sentiment_score": 0.4,
+        "article_count": 3,
+    }
+    news_provider.get_company_news.return_value = [
+        {"title": "Apple earnings: record iPhone sales"},
+        {"title": "After earnings, analysts raise Apple targets"},
+        {"title": "Supply chain risks about iPhone"},
+    ]
+    agent._generate_response = AsyncMock(return_value="not json")
+
+    await agent.analyze({"symbol": "AAPL", "news_provider": news_provider})
+
+    news_provider.aggregate_sentiment.assert_called_once_with("AAPL", days_back=7)
+    news_provider.get_company_news.assert_called_once_with("AAPL", max_articles=15)
+    # Two leading words per headline, skipping stopwords and punctuation
+    prompt = agent._generate_response.call_args.args[0]
+    assert "TRENDING TOPICS:\nearnings, apple, analysts, supply, chain\n" in prompt
+
+
+@pytest.mark.asyncio
+async def test_sentiment_analyst_error_reports_are_independent():
+    """Test error-path reports copied from the template do not share state."""
+    from src.agents.market_intelligence import SentimentAnalyst
+
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+        agent = SentimentAnalyst()
+
+    news_provider = Mock(spec=NewsProvider)
+    news_provider.aggregate_sentiment.side_effect = RuntimeError("provider down")
+
+    first = await agent.analyze({"symbol": "AAPL", "news_provider": news_provider})
+    second = await agent.analyze({"symbol": "MSFT", "news_provider": news_provider})
+
+    assert first.symbol == "AAPL"
+    assert second.symbol == "MSFT"
+    assert first.summary == "Analysis failed: provider down"
+    assert first.confidence == 0.1
+    first.metadata["extra"] = True
+    assert "extra" not in second.metadata
+
+
+@pytest.mark.asyncio
+async def test_sentiment_analyst_streams_json_response():
+    """Test streamed responses are decoded without the buffered call."""
+    from src.agents.market_intelligence import SentimentAnalyst
+
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+        agent = SentimentAnalyst()
+
+    news_provider = Mock(spec=NewsProvider)
+    news_provider.aggregate_sentiment.return_value = {
+        "sentiment_label": "neutral",
+        "sentiment_score": 0.0,
+        "article_count": 1,
+    }
+    news_provider.get_company_news.return_value = [{"title": "Quiet trading session"}]
+
+    async def stream(_input_text):
+        for chunk in [
+            '```json\n{"social_sentiment": "bull',
+            'ish", "sentiment_',
+            'score": 0.6}\n```',
+        ]:
+            yield chunk
+
+    agent._stream_response = stream
+    agent._generate_response = AsyncMock(return_value="not json")
+
+    with patch("src.agents.market_intelligence.sentiment.settings") as mock_settings:
+        mock_settings.llm_streaming = True
+        report = await agent.analyze({"symbol": "AAPL", "news_provider": news_provider})
+
+    agent._generate_response.assert_not_called()
+    assert report.social_sentiment == Sentiment.BULLISH
+    assert report.sentiment_score == 0.6
+
+
 # =============================================================================
 # Macro/News Analyst Tests
 # =============================================================================
 
 
+@pytest.mark.asyncio
+async def test_macro_news_analyst_uses_news_provider_interface():
+    """Test the real macro analyst calls NewsProvider's actual methods."""
+    from src.agents.market_intelligence import MacroNewsAnalyst
+
+    with patch("src.agents.base.settings") as mock_settings:
+        mock_settings.llm_provider = "openai"
+        mock_settings.standard_model = "gpt-4o-mini"
+        mock_settings.openai_api_key = "test-key"
+        agent = MacroNewsAnalyst()
+
+    news_provider = Mock(spec=NewsProvider)
+    news_provider.get_company_news.return_value = [
+        {"title": "Fed holds rates", "publisher": "Reuters", "published_iso": "2024-01-02"},
+        {"title": "Cached item without date"},
+    ]
+    news_provider.aggregate_sentiment.return_value = {
+        "sentiment_score": 0.4,
+        "sentiment_label": "bullish",
+        "positive_count": 2,
+        "negative_count": 0,
+        "neutral_count": 0,
+    }
+    agent._generate_response = AsyncMock(return_value='{"market_sentiment": "bullish"}')
+
+    report = await agent.analyze({"symbol": "AAPL", "news_provider": news_provider})
+
+    news_provider.get_company_news.assert_called_once_with("AAPL", max_articles=20)
+    news_provider.aggregate_sentiment.assert_called_once_with("AAPL", days_back=7)
+    prompt = agent._generate_response.call_args.args[0]
+    assert "- [2024-01-02] Fed holds rates (Reuters)" in prompt
+    assert "- [N/A] Cached item without date (Unknown)" in prompt
+    assert "- Overall Sentiment: bullish" in prompt
+    assert report.market_sentiment == Sentiment.BULLISH
+
+
 @pytest.mark.asyncio
 async def test_macro_news_analyst_basic_analysis(sample_context):
     """Test macro/news analyst produces valid report."""
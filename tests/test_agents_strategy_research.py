@@ -184,6 +184,86 @@ async def test_bull_bear_debate_interaction(sample_context):
     assert arguments[3].agent_role == AgentRole.BEARISH_RESEARCHER
 
 
+@pytest.mark.asyncio
+async def test_debate_pair_runs_both_sides(sample_context):
+    """Test debate_pair gives both sides the same earlier rounds."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.agents.strategy_research import debate_pair
+
+    bullish_agent = MagicMock(debate=AsyncMock(return_value="bull"))
+    bearish_agent = MagicMock(debate=AsyncMock(return_value="bear"))
+    previous = ["round-1 bull", "round-1 bear"]
+
+    result = await debate_pair(
+        bullish_agent, bearish_agent, sample_context, round_number=2, previous_arguments=previous
+    )
+
+    assert result == ("bull", "bear")
+    for agent in (bullish_agent, bearish_agent):
+        agent.debate.assert_awaited_once_with(
+            sample_context, round_number=2, previous_arguments=previous
+        )
+
+
+def test_strategy_research_lazy_exports():
+    """Test lazily imported agents resolve from the package like eager ones."""
+    import src.agents.strategy_research as strategy_research
+    from src.agents.strategy_research.derivatives import DerivativesStrategist
+
+    assert strategy_research.DerivativesStrategist is DerivativesStrategist
+    for name in strategy_research.__all__:
+        assert getattr(strategy_research, name) is not None
+    missing = "NotAnAgent"
+    with pytest.raises(AttributeError):
+        getattr(strategy_research, missing)
+
+
+def test_extract_report_fields_formats_reports():
+    """Test analyst reports are flattened into prompt fields, with N/A for gaps."""
+    from types import SimpleNamespace
+
+    from src.agents.strategy_research._reports import extract_report_fields
+    from src.data.schemas import Sentiment, TrendDirection
+
+    technical = SimpleNamespace(
+        trend_direction=TrendDirection.UPTREND,
+        support_levels=[100.0, 95.5],
+        resistance_levels=[110.0],
+        chart_patterns=["flag"],
+        confidence_level=7,
+    )
+    sentiment = SimpleNamespace(
+        social_sentiment=Sentiment.BULLISH,
+        sentiment_score=0.456,
+        trending_topics=["earnings"],
+        retail_positioning="long",
+        confidence_level=6,
+    )
+
+    fields = extract_report_fields({"technical": technical, "sentiment": sentiment})
+
+    assert fields["support"] == "$100.00, $95.50"
+    assert fields["trend"] == TrendDirection.UPTREND.value
+    assert fields["sentiment_score"] == "0.46"
+    assert fields["trending_topics"] == "earnings"
+    assert fields["investment_thesis"] == "N/A"
+    assert fields["macro_confidence"] == 0
+
+
+def test_debate_context_bounds_opposing_argument():
+    """Test long opposing arguments are cut at a sentence end for the next round."""
+    from src.agents.strategy_research._reports import DEBATE_CONTEXT_CHARS, debate_context
+
+    short = "Margins are expanding."
+    assert debate_context(short) == short
+
+    long = "Demand is strong. " * 200
+    bounded = debate_context(long)
+    assert len(bounded) <= DEBATE_CONTEXT_CHARS + len(" [...]")
+    assert bounded.endswith("strong. [...]")
+
+
 @pytest.mark.asyncio
 async def test_debate_argument_timestamps(sample_context):
     """Test debate arguments have valid timestamps."""
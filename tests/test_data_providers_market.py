@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 import pandas as pd
 import pytest
 
-from src.data.providers.market_data import MarketDataProvider
+from src.data.providers.market_data import MARKET_DATA_CACHE_SIZE, MarketDataProvider
 
 
 class TestMarketDataProvider:
@@ -15,7 +15,15 @@ class TestMarketDataProvider:
     def test_initialization(self):
         """Test provider initialization."""
         provider = MarketDataProvider()
-        assert provider._cache == {}
+        assert len(provider._cache) == 0
+
+    def test_shared_instance(self):
+        """Test shared() returns one process-wide provider."""
+        shared = MarketDataProvider.shared()
+
+        assert isinstance(shared, MarketDataProvider)
+        assert MarketDataProvider.shared() is shared
+        assert MarketDataProvider() is not shared
 
     @patch("src.data.providers.market_data.yf.Ticker")
     def test_get_price_history(self, mock_ticker):
@@ -44,6 +52,24 @@ class TestMarketDataProvider:
         assert "Close" in history.columns
         mock_instance.history.assert_called_once_with(period="1mo", interval="1d")
 
+    @patch("src.data.providers.market_data.yf.Ticker")
+    def test_get_price_history_cached(self, mock_ticker):
+        """Test repeated price history requests are served from the TTL cache."""
+        mock_instance = Mock()
+        mock_instance.history.return_value = pd.DataFrame({"Close": [151.0, 152.0]})
+        mock_ticker.return_value = mock_instance
+
+        provider = MarketDataProvider()
+        first = provider.get_price_history("AAPL", period="6mo", interval="1d")
+        first["SMA_20"] = 0.0
+        second = provider.get_price_history("AAPL", period="6mo", interval="1d")
+
+        mock_instance.history.assert_called_once_with(period="6mo", interval="1d")
+        assert list(second.columns) == ["Close"]
+
+        provider.get_price_history("AAPL", period="1y", interval="1d")
+        assert mock_instance.history.call_count == 2
+
     @patch("src.data.providers.market_data.yf.Ticker")
     def test_get_price_history_error(self, mock_ticker):
         """Test price history with error handling."""
@@ -88,6 +114,48 @@ class TestMarketDataProvider:
 
         assert price is None
 
+    @patch("src.data.providers.market_data.yf.Ticker")
+    def test_get_current_price_cached(self, mock_ticker):
+        """Test repeated price requests are served from the bounded TTL cache."""
+        mock_instance = Mock()
+        mock_instance.info = {"currentPrice": 195.50}
+        mock_ticker.return_value = mock_instance
+
+        provider = MarketDataProvider()
+
+        assert provider.get_current_price("AAPL") == 195.50
+        assert provider.get_current_price("AAPL") == 195.50
+        mock_ticker.assert_called_once_with("AAPL")
+        assert provider._cache.maxsize == MARKET_DATA_CACHE_SIZE
+
+    @patch("src.data.providers.market_data.yf.Ticker")
+    def test_get_quote(self, mock_ticker):
+        """Test a quote carries price, bid/ask and volume and primes the price cache."""
+        mock_instance = Mock()
+        mock_instance.info = {"currentPrice": 195.5, "bid": 195.4, "ask": 195.6, "volume": 1000}
+        mock_ticker.return_value = mock_instance
+
+        provider = MarketDataProvider()
+        quote = provider.get_quote("AAPL")
+
+        assert quote == {"price": 195.5, "bid": 195.4, "ask": 195.6, "volume": 1000}
+        assert provider.get_current_price("AAPL") == 195.5
+        mock_ticker.assert_called_once_with("AAPL")
+
+    @patch("src.data.providers.market_data.yf.Ticker")
+    def test_get_quote_error(self, mock_ticker):
+        """Test quote error handling."""
+        mock_ticker.side_effect = Exception("API Error")
+
+        provider = MarketDataProvider()
+
+        assert provider.get_quote("INVALID") == {
+            "price": None,
+            "bid": None,
+            "ask": None,
+            "volume": None,
+        }
+
     @patch("src.data.providers.market_data.yf.Ticker")
     def test_get_fundamentals(self, mock_ticker):
         """Test getting fundamental data."""
@@ -14,7 +14,7 @@ class TestNewsProvider:
     def test_initialization(self):
         """Test provider initialization."""
         provider = NewsProvider()
-        assert provider._cache == {}
+        assert len(provider._cache) == 0
 
     def test_analyze_sentiment_positive(self):
         """Test sentiment analysis for positive text."""
@@ -91,6 +91,31 @@ class TestNewsProvider:
         assert len(articles) == 2
         assert articles[0]["title"] == "Company Reports Strong Earnings"
         assert "sentiment" in articles[0]
+        assert articles[0]["published_iso"] == articles[0]["published"].strftime("%Y-%m-%d")
+
+    @patch("src.data.providers.news.yf.Ticker")
+    def test_get_company_news_cached_copies(self, mock_ticker):
+        """Test repeated requests hit the bounded cache and cannot edit it."""
+        from src.data.providers.news import NEWS_CACHE_SIZE
+
+        mock_instance = Mock()
+        mock_instance.news = [
+            {
+                "title": "Company Reports Strong Earnings",
+                "providerPublishTime": int(datetime.now().timestamp()),
+            }
+        ]
+        mock_ticker.return_value = mock_instance
+
+        provider = NewsProvider()
+        first = provider.get_company_news("AAPL")
+        first[0]["title"] = "Edited"
+        first.clear()
+        second = provider.get_company_news("AAPL")
+
+        assert mock_ticker.call_count == 1
+        assert second[0]["title"] == "Company Reports Strong Earnings"
+        assert provider._cache.maxsize == NEWS_CACHE_SIZE
 
     @patch("src.data.providers.news.yf.Ticker")
     def test_get_company_news_error(self, mock_ticker):
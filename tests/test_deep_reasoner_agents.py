@@ -95,6 +95,58 @@ class TestDeepSeekReasoningAgent:
         assert result.strategy_validated is False
         assert result.approval_status == "rejected"
 
+    def test_reasoning_llm_shared_across_instances(self, agent):
+        """Test agent instances reuse one R1 client for the same configuration."""
+        other = DeepSeekReasoningAgent()
+
+        assert agent._get_reasoning_llm() is other._get_reasoning_llm()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("confidence", "trace", "corrected"),
+        [(0.5, "r1 reasoning", True), (0.5, "", False), (0.68, "r1 reasoning", False)],
+    )
+    async def test_self_correction_only_for_clearly_low_r1_confidence(
+        self, agent, sample_context, confidence, trace, corrected
+    ):
+        """Test self-correction is skipped on fallback responses and marginal confidence."""
+        response = f'{{"strategy_validated": false, "confidence_score": {confidence}}}'
+        agent._generate_reasoning_response = AsyncMock(return_value=(response, trace, None))
+        agent._self_correct = AsyncMock(side_effect=lambda context, report: report)
+
+        await agent.analyze(sample_context)
+
+        assert agent._self_correct.await_count == int(corrected)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("trace", "corrected"), [("Check the stop loss.", True), ("", False)])
+    async def test_self_correction_uses_streamed_r1_trace(
+        self, agent, sample_context, trace, corrected
+    ):
+        """Test the self-correction gate sees the trace captured from the R1 stream."""
+        from src.agents.strategy_research import reasoning
+
+        reasoning._VALIDATION_CACHE.clear()
+
+        async def astream(messages):
+            yield MagicMock(content="", additional_kwargs={"reasoning_content": trace})
+            yield MagicMock(
+                content='{"strategy_validated": false, "confidence_score": 0.5}',
+                additional_kwargs={},
+            )
+
+        reasoning_llm = MagicMock()
+        reasoning_llm.astream = astream
+        agent._reasoning_llm = reasoning_llm
+        agent._self_correct = AsyncMock(side_effect=lambda context, report: report)
+
+        result = await agent.analyze(sample_context)
+
+        assert agent._self_correct.await_count == int(corrected)
+        if corrected:
+            assert agent._self_correct.await_args.args[1].reasoning_trace == trace
+        assert result.confidence == 0.5
+
     @pytest.mark.asyncio
     async def test_build_validation_prompt(self, agent, sample_context):
         """Test validation prompt is built correctly."""
@@ -103,7 +155,152 @@ class TestDeepSeekReasoningAgent:
         assert "AAPL" in prompt
         assert "LONG_EQUITY" in prompt
         assert "12.0%" in prompt
-        assert "VALIDATION TASKS" in prompt
+        # Static instructions live in the cacheable system prompt
+        assert "VALIDATION TASKS" not in prompt
+        assert "VALIDATION TASKS" in agent.system_prompt
+
+    @pytest.mark.asyncio
+    async def test_equivalent_proposals_reuse_cached_validation(self, agent, sample_context):
+        """Test proposals differing only in free text or rounding share one R1 call."""
+        from src.agents.strategy_research import reasoning
+
+        reasoning._VALIDATION_CACHE.clear()
+        calls = []
+
+        async def astream(messages):
+            calls.append(messages)
+            yield MagicMock(content="{}", additional_kwargs={"reasoning_content": "r"})
+
+        reasoning_llm = MagicMock()
+        reasoning_llm.astream = astream
+        agent._reasoning_llm = reasoning_llm
+
+        strategy = sample_context["strategy_proposal"]
+        variant = strategy.model_copy(
+            update={"rationale": "Reworded rationale", "expected_return": 12.001}
+        )
+        changed = strategy.model_copy(update={"max_loss": -6.0})
+
+        with patch.object(reasoning, "settings") as mock_settings:
+            mock_settings.llm_response_cache = True
+            mock_settings.deepseek_reasoner_model = "deepseek-reasoner"
+
+            first = await agent._generate_reasoning_response(
+                "prompt", cache_key=agent._validation_key(sample_context)
+            )
+            for proposal in (variant, changed):
+                await agent._generate_reasoning_response(
+                    "prompt",
+                    cache_key=agent._validation_key(
+                        {**sample_context, "strategy_proposal": proposal}
+                    ),
+                )
+
+        assert first == ("{}", "r", {})
+        assert len(calls) == 2
+
+    def test_validation_key_covers_trade_rules_and_tech_confidence(self, agent, sample_context):
+        """Test proposals with different trade rules or technical confidence get their own key."""
+        strategy = sample_context["strategy_proposal"]
+        technical = sample_context["analyst_reports"]["technical"]
+        base_key = agent._validation_key(sample_context)
+
+        variants = [
+            {**sample_context, "strategy_proposal": strategy.model_copy(update=update)}
+            for update in (
+                {"entry_conditions": ["Price above 200"]},
+                {"exit_conditions": ["Trailing stop hit"]},
+            )
+        ]
+        variants.append(
+            {
+                **sample_context,
+                "analyst_reports": {
+                    **sample_context["analyst_reports"],
+                    "technical": technical.model_copy(update={"confidence": 0.4}),
+                },
+            }
+        )
+
+        keys = {agent._validation_key(context) for context in variants}
+        assert base_key not in keys
+        assert len(keys) == len(variants)
+
+    @pytest.mark.asyncio
+    async def test_self_correction_cache_key_includes_proposal(self, agent, sample_context):
+        """Test the correction request is cached per proposal, not just per prompt."""
+        from src.utils import hash_key
+
+        report = DeepSeekReasoningReport(
+            symbol="AAPL", summary="Unsure", confidence=0.5, reasoning_trace="r1"
+        )
+        agent._generate_reasoning_response = AsyncMock(return_value=("{}", "", {}))
+
+        await agent._self_correct(sample_context, report)
+        cache_key = agent._generate_reasoning_response.call_args.kwargs["cache_key"]
+        prompt = agent._generate_reasoning_response.call_args.args[0]
+
+        assert cache_key == hash_key(agent._validation_key(sample_context), prompt)
+
+    @pytest.mark.asyncio
+    async def test_reasoning_stream_stops_after_json_object(self, agent):
+        """Test the R1 stream is closed once its JSON object is complete."""
+        chunks = [
+            MagicMock(content="", additional_kwargs={"reasoning_content": "Check the "}),
+            MagicMock(content="", additional_kwargs={"reasoning_content": "stop loss."}),
+            MagicMock(content='{"strategy_validated": ', additional_kwargs={}),
+            MagicMock(content="true}", additional_kwargs={}),
+            MagicMock(content="\nTrailing commentary", additional_kwargs={}),
+        ]
+        consumed = []
+
+        async def astream(messages):
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        reasoning_llm = MagicMock()
+        reasoning_llm.astream = astream
+        agent._reasoning_llm = reasoning_llm
+
+        content, reasoning, parsed = await agent._generate_reasoning_response("prompt")
+
+        assert content == '{"strategy_validated": true}'
+        assert reasoning == "Check the stop loss."
+        assert parsed == {"strategy_validated": True}
+        assert len(consumed) == 4
+
+    def test_reasoning_llm_keeps_reasoning_delta(self, agent):
+        """Test R1's reasoning_content delta survives chunk conversion."""
+        from langchain_core.messages import AIMessageChunk
+
+        raw_chunk = {
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {
+                        "role": "assistant",
+                        "content": "",
+                        "reasoning_content": "Check the stop loss.",
+                    },
+                }
+            ]
+        }
+
+        generation_chunk = agent._get_reasoning_llm()._convert_chunk_to_generation_chunk(
+            raw_chunk, AIMessageChunk, {}
+        )
+
+        assert generation_chunk.message.additional_kwargs["reasoning_content"] == (
+            "Check the stop loss."
+        )
+
+    def test_build_validation_prompt_reuses_rendered_prompt(self, agent, sample_context):
+        """Test an identical proposal reuses the rendered prompt."""
+        first = agent._build_validation_prompt(sample_context)
+        second = agent._build_validation_prompt(dict(sample_context))
+
+        assert second is first
 
     def test_parse_validation_response_valid_json(self, agent):
         """Test parsing valid JSON response."""
@@ -126,6 +323,15 @@ class TestDeepSeekReasoningAgent:
         assert result.approval_status == "approved"
         assert result.confidence == 0.8
 
+    def test_parse_validation_response_json_in_prose(self, agent):
+        """Test an unfenced JSON object surrounded by prose is still parsed."""
+        response = 'Here is my validation: {"strategy_validated": true, "confidence_score": 0.9} Done.'
+
+        result = agent._parse_validation_response("AAPL", response, "")
+
+        assert result.strategy_validated is True
+        assert result.confidence == 0.9
+
     def test_parse_validation_response_invalid_json(self, agent):
         """Test parsing invalid JSON falls back gracefully."""
         response = "This is not valid JSON"
@@ -170,6 +376,32 @@ class TestJanusVisualAnalyst:
         assert result.confidence == 0.0
         assert "No chart image" in result.summary
 
+    @pytest.mark.asyncio
+    async def test_analyze_batch_bounds_concurrency(self, agent, monkeypatch):
+        """Test batch analysis keeps order and caps analyses in flight."""
+        import asyncio
+
+        from src.agents.market_intelligence import vision
+
+        monkeypatch.setattr(vision.settings, "janus_pro_max_concurrent", 2)
+        in_flight = []
+        peak = []
+
+        async def fake_analyze(context):
+            in_flight.append(context["symbol"])
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(context["symbol"])
+            return JanusVisualReport(symbol=context["symbol"], summary="ok", confidence=0.5)
+
+        agent.analyze = fake_analyze
+        symbols = ["AAPL", "MSFT", "NVDA", "AMZN", "META"]
+
+        reports = await agent.analyze_batch([{"symbol": s} for s in symbols])
+
+        assert [r.symbol for r in reports] == symbols
+        assert max(peak) == 2
+
     @pytest.mark.asyncio
     async def test_get_chart_image_none(self, agent):
         """Test _get_chart_image returns None when no source available."""
@@ -182,6 +414,157 @@ class TestJanusVisualAnalyst:
         result = await agent._get_chart_image({"chart_image": "base64data"})
         assert result == "base64data"
 
+    @pytest.mark.asyncio
+    async def test_get_chart_image_from_path(self, agent, tmp_path):
+        """Test _get_chart_image base64-encodes a chart file."""
+        chart = tmp_path / "chart.png"
+        chart.write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        result = await agent._get_chart_image({"chart_path": str(chart)})
+        assert result == "iVBORw0KGgo="
+
+    @pytest.mark.asyncio
+    async def test_generate_chart_image_cached_per_bar(self, agent, monkeypatch):
+        """Test a chart is rendered once per symbol and last bar."""
+        import pandas as pd
+
+        from src.agents.market_intelligence import vision
+
+        renders = []
+
+        def fake_render(data):
+            assert list(data.columns) == ["Close"]
+            renders.append(len(data))
+            return b"png"
+
+        monkeypatch.setattr(vision, "render_chart", fake_render)
+        monkeypatch.setattr(vision, "_CHART_CACHE", vision.TTLCache(maxsize=4, ttl=60))
+
+        index = pd.date_range("2024-01-01", periods=80, freq="D")
+        df = pd.DataFrame({"close": range(80)}, index=index)
+
+        first = await agent._generate_chart_image({"symbol": "AAPL", "chart_data": df})
+        again = await agent._generate_chart_image({"symbol": "AAPL", "price_history": df})
+        await agent._generate_chart_image({"symbol": "MSFT", "chart_data": df})
+
+        assert first == again == "cG5n"
+        assert renders == [60, 60]
+        assert list(df.columns) == ["close"]
+
+    def test_render_chart_image(self):
+        """Test candlestick rendering produces a chart at the Janus input size."""
+        from io import BytesIO
+
+        import numpy as np
+        import pandas as pd
+        from PIL import Image
+
+        from src.agents.market_intelligence._charts import CHART_SIZE, render_chart
+
+        closes = 100 + np.sin(np.arange(60) / 5)
+        df = pd.DataFrame({
+            "Open": closes - 0.5,
+            "High": closes + 1,
+            "Low": closes - 1,
+            "Close": closes,
+            "Volume": np.arange(60),
+        })
+
+        image = Image.open(BytesIO(render_chart(df)))
+
+        assert image.format == "WEBP"
+        assert image.size == CHART_SIZE
+
+    @pytest.mark.asyncio
+    async def test_llm_fallback_maps_structured_reply(self, agent):
+        """Test the fallback builds its report from the schema-bound reply."""
+        from src.agents.market_intelligence import vision
+
+        agent._generate_structured = AsyncMock(
+            return_value=vision._FallbackReply(
+                summary="Bull flag",
+                confidence_score=0.7,
+                patterns_detected=[{"name": "Flag", "confidence": 0.6, "stage": "forming"}],
+                support_resistance={"support": [95.0]},
+            )
+        )
+
+        report = await agent._analyze_with_llm_fallback("AAPL", {})
+
+        assert agent._generate_structured.call_args.args[1] is vision._FallbackReply
+        assert report.summary == "Bull flag"
+        assert report.confidence == 0.7
+        assert report.patterns_detected == [
+            {"name": "Flag", "confidence": 0.6, "stage": "forming"}
+        ]
+        assert report.support_resistance_visual == {"support": [95.0], "resistance": []}
+
+    @pytest.mark.asyncio
+    async def test_llm_fallback_invalid_reply(self, agent):
+        """Test a reply that does not match the schema yields a low-confidence report."""
+        agent._generate_structured = AsyncMock(side_effect=ValueError("bad reply"))
+
+        report = await agent._analyze_with_llm_fallback("AAPL", {})
+
+        assert report.confidence == 0.3
+
+    @pytest.mark.asyncio
+    async def test_llm_fallback_summarizes_recent_bars(self, agent):
+        """Test the fallback prompt summarizes the last 20 bars of price data."""
+        import pandas as pd
+
+        from src.agents.market_intelligence import vision
+
+        agent._generate_structured = AsyncMock(return_value=vision._FallbackReply(summary="ok"))
+        df = pd.DataFrame({
+            "High": [500.0] + [110.0] * 20,
+            "Low": [1.0] + [90.0] * 20,
+            "Close": [100.0] * 21,
+        })
+
+        await agent._analyze_with_llm_fallback("AAPL", {"price_history": df})
+
+        prompt = agent._generate_structured.call_args.args[0]
+        assert "- High: $110.00" in prompt
+        assert "- Low: $90.00" in prompt
+        assert "- Range: 20.0%" in prompt
+
+    @pytest.mark.asyncio
+    async def test_analyze_with_janus_payload(self, agent):
+        """Test the Janus-Pro request carries the image and a symbol-specific prompt."""
+        response = MagicMock(status=200)
+        response.json = AsyncMock(return_value={"summary": "Flag", "confidence": 0.6})
+        post = MagicMock()
+        post.return_value.__aenter__ = AsyncMock(return_value=response)
+        post.return_value.__aexit__ = AsyncMock(return_value=False)
+        agent._get_session = AsyncMock(return_value=MagicMock(post=post))
+
+        report = await agent._analyze_with_janus("AAPL", "base64data", {})
+
+        payload = post.call_args.kwargs["json"]
+        assert payload["image"] == "base64data"
+        assert payload["prompt"].startswith("Analyze this AAPL candlestick chart")
+        assert report.summary == "Flag"
+
+    @pytest.mark.asyncio
+    async def test_analyze_with_janus_error_falls_back_with_context(self, agent):
+        """Test a Janus-Pro error hands the original context to the LLM fallback."""
+        response = MagicMock(status=503)
+        response.text = AsyncMock(return_value="unavailable")
+        post = MagicMock()
+        post.return_value.__aenter__ = AsyncMock(return_value=response)
+        post.return_value.__aexit__ = AsyncMock(return_value=False)
+        agent._get_session = AsyncMock(return_value=MagicMock(post=post))
+        agent._analyze_with_llm_fallback = AsyncMock(
+            return_value=JanusVisualReport(symbol="AAPL", summary="fallback", confidence=0.3)
+        )
+        context = {"symbol": "AAPL", "technical_indicators": {"rsi": 55}}
+
+        report = await agent._analyze_with_janus("AAPL", "base64data", context)
+
+        agent._analyze_with_llm_fallback.assert_awaited_once_with("AAPL", context)
+        assert report.summary == "fallback"
+
     def test_parse_janus_response(self, agent):
         """Test parsing Janus API response."""
         result = {
@@ -197,12 +580,27 @@ class TestJanusVisualAnalyst:
             "implications": "Consider short positions",
         }
 
-        report = agent._parse_janus_response("AAPL", result, "chart_data")
+        report = agent._parse_janus_response("AAPL", result)
 
         assert len(report.patterns_detected) == 1
         assert report.confidence == 0.75
         assert report.trend_analysis == "bearish"
 
+    @pytest.mark.asyncio
+    async def test_session_shared_across_agents(self, agent):
+        """Test analysts reuse one pooled HTTP session until it is closed."""
+        with patch("src.agents.base.create_llm"):
+            other = JanusVisualAnalyst()
+
+        session = await agent._get_session()
+        assert await other._get_session() is session
+
+        await agent.close()
+        assert session.closed
+        reopened = await other._get_session()
+        assert reopened is not session
+        await other.close()
+
 
 # =============================================================================
 # FinRL Execution Agent Tests
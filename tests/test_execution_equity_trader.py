@@ -100,6 +100,49 @@ async def test_equity_trader_has_create_execution_plan(sample_context, sample_st
         assert plan.symbol == "AAPL"
 
 
+@pytest.mark.asyncio
+async def test_create_execution_plan_prices_from_provider_quote(monkeypatch):
+    """Test the plan is priced from MarketDataProvider.get_quote's bid/ask."""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, Mock
+
+    from src.agents.execution import equity_trader
+    from src.agents.execution.equity_trader import EquityTrader
+    from src.data.providers import MarketDataProvider
+
+    # ExecutionPlan's schema lags the trader; capture its arguments instead
+    monkeypatch.setattr(equity_trader, "ExecutionPlan", lambda **fields: SimpleNamespace(**fields))
+
+    provider = Mock(spec=MarketDataProvider)
+    provider.get_quote.return_value = {
+        "price": 200.0,
+        "bid": 199.9,
+        "ask": 200.1,
+        "volume": 1_000_000,
+    }
+    proposal = SimpleNamespace(
+        strategy_type=StrategyType.LONG_EQUITY,
+        direction=SimpleNamespace(value="long"),
+        position_size_pct=0.05,
+    )
+
+    trader = EquityTrader()
+    trader._generate_response = AsyncMock(
+        return_value='{"order_type": "LIMIT", "limit_price": null, "slippage_tolerance": 0.1}'
+    )
+    plan = await trader.create_execution_plan(
+        {"symbol": "AAPL", "strategy_proposal": proposal, "market_data_provider": provider}
+    )
+
+    provider.get_quote.assert_called_once_with("AAPL")
+    prompt = trader._generate_response.call_args.args[0]
+    assert "- Bid: $199.9" in prompt
+    assert "- Volume: 1000000" in prompt
+    (order,) = plan.orders
+    assert order.quantity == 25
+    assert order.limit_price == 200.1
+
+
 @pytest.mark.asyncio
 async def test_build_order_payload_methods(dummy_broker):
     """Test payload builder methods if they exist."""
@@ -182,3 +182,146 @@ async def test_technical_indicators_in_report(sample_context):
             # These should be lists
             assert isinstance(report.support_levels, list)
             assert isinstance(report.resistance_levels, list)
+
+
+
+def test_support_resistance_finds_isolated_extrema():
+    """Test local extrema are found exactly at isolated peaks and troughs."""
+    from src.agents.market_intelligence.technical import TechnicalAnalyst
+
+    drift = np.arange(60) * 0.01
+    highs = 100 + drift
+    lows = 100 - drift
+    highs[[10, 30, 50]] = [120.0, 150.0, 200.0]
+    lows[[15, 35]] = [80.0, 60.0]
+    df = pd.DataFrame({"High": highs, "Low": lows})
+
+    analyst = TechnicalAnalyst()
+    support, resistance = analyst._identify_support_resistance(df, window=5)
+
+    assert resistance == [120.0, 150.0, 200.0]
+    assert support == [60.0, 80.0]
+
+
+def test_cluster_levels_merges_neighbours_within_tolerance():
+    """Test levels within 2% of their sorted neighbour are averaged together."""
+    from src.agents.market_intelligence.technical import _cluster_levels
+
+    levels = np.array([110.0, 100.0, 101.0, 150.0, 102.0])
+
+    assert _cluster_levels(levels) == pytest.approx([101.0, 110.0, 150.0])
+    assert _cluster_levels(np.array([])) == []
+    assert _cluster_levels(levels, keep=2) == pytest.approx([110.0, 150.0])
+
+
+def test_chart_pattern_detection_crossovers():
+    """Test crossovers and band breaks are read from the last two bars."""
+    from src.agents.market_intelligence.technical import TechnicalAnalyst
+
+    close = np.linspace(100, 120, 60)
+    df = pd.DataFrame(
+        {
+            "Close": close,
+            "SMA_20": np.r_[np.full(58, 99.0), 99.0, 101.0],
+            "SMA_50": np.full(60, 100.0),
+            "MACD": np.r_[np.full(59, 1.0), -1.0],
+            "MACD_Signal": np.zeros(60),
+            "RSI": np.full(60, 75.0),
+            "BB_Upper": np.full(60, 119.0),
+            "BB_Lower": np.full(60, 90.0),
+        }
+    )
+
+    patterns = TechnicalAnalyst()._detect_chart_patterns(df)
+
+    assert "Golden Cross (SMA 20/50)" in patterns
+    assert "MACD Bearish Crossover" in patterns
+    assert "RSI Overbought (>70)" in patterns
+    assert "Price Above Upper Bollinger Band" in patterns
+    assert not any(p.startswith("Strong") for p in patterns)
+
+
+def test_indicator_snapshot_from_frame(sample_price_dataframe):
+    """Test the snapshot captures available columns and their last values."""
+    from src.agents.market_intelligence.technical import IndicatorSnapshot
+
+    df = sample_price_dataframe.copy()
+    df["RSI"] = 55.0
+
+    snapshot = IndicatorSnapshot.from_frame(df)
+
+    assert snapshot.length == len(df)
+    assert snapshot.last["Close"] == float(df["Close"].iloc[-1])
+    assert snapshot.last["RSI"] == 55.0
+    assert "SMA_200" not in snapshot.columns
+    assert "Volume" not in snapshot.columns
+    np.testing.assert_array_equal(snapshot.columns["High"], df["High"].to_numpy())
+
+
+def test_sr_kernel_matches_numpy_path(sample_price_dataframe):
+    """Test the numba-compilable kernel agrees with the NumPy implementation."""
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    from src.agents.market_intelligence.technical import _cluster_levels, _sr_kernel
+
+    highs = sample_price_dataframe["High"].to_numpy(dtype=float)
+    lows = sample_price_dataframe["Low"].to_numpy(dtype=float)
+    window = 5
+
+    center_highs = highs[window:-window]
+    center_lows = lows[window:-window]
+    expected_resistance = _cluster_levels(
+        center_highs[center_highs == sliding_window_view(highs, 2 * window + 1).max(axis=1)]
+    )
+    expected_support = _cluster_levels(
+        center_lows[center_lows == sliding_window_view(lows, 2 * window + 1).min(axis=1)]
+    )
+
+    support, resistance = _sr_kernel(highs, lows, window, 0.02)
+
+    assert support.tolist() == pytest.approx(expected_support)
+    assert resistance.tolist() == pytest.approx(expected_resistance)
+
+
+@pytest.mark.asyncio
+async def test_technical_analyst_renders_missing_indicators_as_na(sample_price_dataframe):
+    """Test indicators too long for a short history render as N/A, not $nan."""
+    from unittest.mock import AsyncMock, Mock
+
+    from src.agents.market_intelligence.technical import TechnicalAnalyst
+    from src.data.providers import MarketDataProvider
+
+    provider = Mock(spec=MarketDataProvider)
+    provider.get_price_history.return_value = sample_price_dataframe
+
+    analyst = TechnicalAnalyst()
+    analyst._generate_response = AsyncMock(
+        return_value='{"trend_direction": "neutral", "confidence_level": 7, '
+        '"analysis_summary": "ok"}'
+    )
+
+    report = await analyst.analyze({"symbol": "TEST", "market_data_provider": provider})
+
+    prompt = analyst._generate_response.call_args[0][0]
+    # 100 bars: the 200-day SMA is NaN, the shorter indicators are computed
+    assert "- 200-day SMA: N/A" in prompt
+    assert "nan" not in prompt
+    assert "- 20-day SMA: $" in prompt
+    assert "- RSI (14): N/A" not in prompt
+    assert report.summary == "ok"
+    assert report.confidence == 0.7
+
+
+def test_add_indicator_columns(sample_price_dataframe):
+    """Test indicator columns match their rolling definitions."""
+    from src.agents.market_intelligence.technical import _add_indicator_columns
+
+    df = _add_indicator_columns(sample_price_dataframe)
+
+    close = sample_price_dataframe["Close"]
+    assert df["SMA_20"].iloc[-1] == pytest.approx(close.tail(20).mean())
+    assert df["SMA_200"].isna().all()
+    assert 0.0 <= df["RSI"].iloc[-1] <= 100.0
+    assert (df["ATR"].dropna() > 0).all()
+    assert (df["BB_Upper"].dropna() > df["BB_Lower"].dropna()).all()
+    assert "SMA_20" not in sample_price_dataframe.columns
@@ -221,6 +221,73 @@ class TestEpisodicMemory:
         reflections = memory.get_reflections_for_trade("TRADE-001")
         assert len(reflections) == 3
 
+    @pytest.fixture
+    def trade_row(self):
+        """Trade outcome carrying the fields EpisodicMemory persists."""
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            trade_id="TRADE-010",
+            symbol="AAPL",
+            strategy_type="long_equity",
+            entry_date=datetime.now() - timedelta(days=5),
+            exit_date=datetime.now(),
+            entry_price=150.00,
+            exit_price=160.00,
+            quantity=10,
+            realized_pnl=100.00,
+            return_pct=6.67,
+            outcome="win",
+            notes="",
+        )
+
+    @staticmethod
+    def _row_counts(memory):
+        """Number of stored trade and reflection rows."""
+        from src.memory.episodic import ReflectionRecord, TradeRecord
+
+        session = memory._get_session()
+        try:
+            return session.query(TradeRecord).count(), session.query(ReflectionRecord).count()
+        finally:
+            session.close()
+
+    def test_store_trade_and_reflection(self, memory, trade_row):
+        """Test a trade and its reflection are written together."""
+        from types import SimpleNamespace
+
+        reflection = SimpleNamespace(
+            trade_id=trade_row.trade_id,
+            symbol="AAPL",
+            analysis_summary="Clean breakout entry",
+            what_worked=["Patient entry"],
+            what_failed=[],
+            lessons_learned=["Trail the stop"],
+            strategic_recommendations=[],
+        )
+
+        memory.store_trade_and_reflection(trade_row, reflection)
+
+        assert self._row_counts(memory) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_reflection_failure_keeps_trade(self, memory, trade_row, monkeypatch):
+        """Test the trade outcome is stored even when building its reflection fails."""
+        from unittest.mock import Mock
+
+        from src.agents.oversight import reflective
+
+        class Agent(reflective.ReflectiveAgent):
+            async def analyze(self, context):  # ReflectiveAgent leaves analyze abstract
+                raise NotImplementedError
+
+        monkeypatch.setattr(reflective, "EpisodicMemory", lambda: memory)
+        monkeypatch.setattr(reflective, "Reflection", Mock(side_effect=ValueError("bad")))
+        agent = Agent()
+
+        assert await agent.reflect_on_trade({"trade_outcome": trade_row}) is None
+        assert self._row_counts(memory) == (1, 0)
+
     def test_get_reflections_nonexistent_trade(self, memory):
         """Test getting reflections for non-existent trade."""
         reflections = memory.get_reflections_for_trade("NONEXISTENT")
@@ -190,3 +190,41 @@ async def test_workflow_phases_exist():
         # Just verify structure, don't fail if naming differs
         if hasattr(workflow_obj, phase):
             assert callable(getattr(workflow_obj, phase))
+
+
+@pytest.mark.asyncio
+async def test_analysis_phase_fetches_news_through_provider_interface(monkeypatch):
+    """Test the analysis phase reads headlines via NewsProvider.get_company_news."""
+    from unittest.mock import Mock
+
+    from src.agents import market_intelligence
+    from src.data.providers import MarketDataProvider, NewsProvider
+    from src.orchestration.state import create_initial_state
+    from src.orchestration.workflow import TradingWorkflow
+
+    contexts = []
+
+    class RecordingAnalyst:
+        async def analyze(self, context):
+            contexts.append(context)
+            return None
+
+    for name in market_intelligence.__all__:
+        monkeypatch.setattr(market_intelligence, name, RecordingAnalyst)
+
+    news_provider = Mock(spec=NewsProvider)
+    news_provider.get_company_news.return_value = [
+        {"title": "Apple beats estimates", "summary": "Record services revenue"}
+    ]
+    monkeypatch.setattr(NewsProvider, "shared", classmethod(lambda cls: news_provider))
+    monkeypatch.setattr(
+        MarketDataProvider, "shared", classmethod(lambda cls: Mock(spec=MarketDataProvider))
+    )
+
+    state = await TradingWorkflow()._analysis_phase(create_initial_state("AAPL"))
+
+    news_provider.get_company_news.assert_called_once_with("AAPL", max_articles=10)
+    assert state["analysis_complete"] is True
+    assert ["Apple beats estimates. Record services revenue"] in [
+        context.get("texts") for context in contexts
+    ]
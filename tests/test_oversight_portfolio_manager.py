@@ -0,0 +1,35 @@
+# tests/test_oversight_portfolio_manager.py
+"""
+Tests for PortfolioManager oversight agent.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_portfolio_manager_skips_llm_on_risk_rejection(monkeypatch):
+    """Test a rejected risk assessment yields a no-trade decision without an LLM call."""
+    from src.agents.oversight import portfolio_manager
+
+    class Manager(portfolio_manager.PortfolioManager):
+        async def analyze(self, context):  # PortfolioManager leaves analyze abstract
+            raise NotImplementedError
+
+    # PortfolioDecision's schema lags the manager; capture its arguments instead
+    monkeypatch.setattr(
+        portfolio_manager, "PortfolioDecision", lambda **fields: SimpleNamespace(**fields)
+    )
+    manager = Manager()
+    manager._generate_structured = AsyncMock()
+
+    risk_assessment = SimpleNamespace(approved=False, risk_score=0.9, risk_warnings=["Too large"])
+    decision = await manager.make_decision(
+        {"symbol": "AAPL", "strategy_proposal": None, "risk_assessment": risk_assessment}
+    )
+
+    assert decision.approved is False
+    assert decision.decision_rationale == "Risk Manager rejected trade."
+    manager._generate_structured.assert_not_called()
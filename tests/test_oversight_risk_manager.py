@@ -56,6 +56,17 @@ def test_risk_manager_instantiation():
     assert hasattr(rm, "role")
 
 
+def test_risk_manager_uses_configured_model(monkeypatch):
+    """Test the Risk Manager can run on its own model instead of the premium one."""
+    from src.agents.oversight import risk_manager
+
+    monkeypatch.setattr(risk_manager.settings, "risk_manager_model", "gpt-4o-mini")
+    assert risk_manager.RiskManager().llm.model_name == "gpt-4o-mini"
+
+    monkeypatch.setattr(risk_manager.settings, "risk_manager_model", None)
+    assert risk_manager.RiskManager().llm.model_name == risk_manager.settings.premium_model
+
+
 @pytest.mark.asyncio
 async def test_risk_manager_has_assess_risk(sample_risk_context):
     """Test that RiskManager has assess_risk method."""
@@ -131,3 +142,155 @@ async def test_risk_manager_var_calculation(sample_risk_context):
             # VaR should be non-negative
             if assessment.var_estimate is not None:
                 assert assessment.var_estimate >= 0
+
+
+def test_hard_limits_flags_each_breach():
+    """Test the hard-limit kernel computes exposures and flags breaches."""
+    from src.agents.oversight._risk_math import hard_limits
+
+    within = hard_limits(100000.0, 0.05, -10.0, 500.0, 0.0, 0.1, 0.02, 0.3)
+    assert within[:3] == (True, True, True)
+    assert within[3] == pytest.approx(5000.0)  # position_value
+    assert within[5] == pytest.approx(500.0)  # estimated_var
+    assert within[8] == pytest.approx(0.05)  # sector_concentration
+
+    breached = hard_limits(100000.0, 0.4, -10.0, 500.0, 0.0, 0.1, 0.02, 0.3)
+    assert breached[:3] == (False, False, False)
+
+
+def test_hard_limits_batch_matches_scalar_kernel():
+    """Test the batch check agrees row by row with the scalar kernel."""
+    import numpy as np
+
+    from src.agents.oversight._risk_math import _hard_limits_rows, hard_limits, hard_limits_batch
+
+    pcts = np.array([0.01, 0.05, 0.2, 0.4])
+    losses = np.array([-5.0, -10.0, -25.0, -3.0])
+    args = (100000.0, pcts, losses, 500.0, 20000.0, 0.1, 0.02, 0.3)
+
+    checks, values = hard_limits_batch(*args)
+
+    # Loop form used by the compiled kernel
+    loop_checks = np.empty((4, 3), dtype=np.bool_)
+    loop_values = np.empty((4, 6))
+    _hard_limits_rows(*args, loop_checks, loop_values)
+
+    for i in range(4):
+        expected = hard_limits(100000.0, pcts[i], losses[i], 500.0, 20000.0, 0.1, 0.02, 0.3)
+        assert tuple(checks[i]) == tuple(loop_checks[i]) == expected[:3]
+        np.testing.assert_allclose(values[i], expected[3:])
+        np.testing.assert_allclose(loop_values[i], expected[3:])
+
+
+def test_check_hard_limits_batch_matches_single():
+    """Test batch limit checks return the same report as per-proposal checks."""
+    from types import SimpleNamespace
+
+    from src.agents.oversight.risk_manager import check_hard_limits, check_hard_limits_batch
+
+    proposals = [
+        SimpleNamespace(position_size_pct=pct, max_loss=loss, confidence_score=conf)
+        for pct, loss, conf in [(0.02, -5.0, 0.8), (0.5, -20.0, 0.3)]
+    ]
+    portfolio_state = {"total_value": 100000.0, "var": 500.0}
+
+    batch = check_hard_limits_batch(proposals, portfolio_state)
+
+    assert batch == [check_hard_limits(p, portfolio_state) for p in proposals]
+    assert batch[0]["risk_warnings"] == []
+    assert batch[1]["position_size_ok"] is False
+
+
+@pytest.mark.asyncio
+async def test_risk_manager_skips_llm_when_hard_limits_fail():
+    """Test a hard-limit breach rejects without consulting the LLM."""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, patch
+
+    from src.agents.oversight.risk_manager import RiskManager, check_hard_limits
+
+    proposal = SimpleNamespace(position_size_pct=0.5, max_loss=-5.0, confidence_score=0.8)
+    limits = check_hard_limits(proposal, {"total_value": 100000.0})
+
+    rm = RiskManager()
+    with (
+        patch.object(rm, "_generate_structured", AsyncMock()) as generate,
+        patch("src.agents.oversight.risk_manager.RiskAssessment", SimpleNamespace),
+    ):
+        assessment = await rm.assess_risk(
+            {"symbol": "AAPL", "strategy_proposal": proposal}, limits=limits
+        )
+
+    generate.assert_not_awaited()
+    assert assessment.approved is False
+    assert assessment.risk_score == 1.0
+    assert assessment.recommendation == "reject: Hard risk limits violated"
+
+
+@pytest.mark.asyncio
+async def test_risk_manager_review_uses_structured_reply():
+    """Test the LLM review is read from the schema reply and rejects if it fails to parse."""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, patch
+
+    from src.agents.oversight.risk_manager import RiskManager, _ReviewReply, check_hard_limits
+
+    proposal = SimpleNamespace(
+        strategy_type=SimpleNamespace(value="long_equity"),
+        direction=SimpleNamespace(value="long"),
+        position_size_pct=0.02,
+        expected_return=12.0,
+        max_loss=-5.0,
+        confidence_score=0.8,
+    )
+    rm = RiskManager()
+
+    limits = check_hard_limits(proposal, {"total_value": 100000.0})
+    reply = _ReviewReply(
+        approved=True,
+        risk_score=0.3,
+        recommendation="approve",
+        rationale="Within limits",
+        additional_warnings=["Earnings next week"],
+    )
+    with patch.object(rm, "_generate_structured", AsyncMock(return_value=reply)):
+        review = await rm._review("AAPL", proposal, limits)
+
+    assert review == (True, 0.3, "approve", "Within limits")
+    assert limits["risk_warnings"] == ["Earnings next week"]
+
+    limits = check_hard_limits(proposal, {"total_value": 100000.0})
+    with patch.object(rm, "_generate_structured", AsyncMock(side_effect=ValueError("bad"))):
+        approved, risk_score, recommendation, _ = await rm._review("AAPL", proposal, limits)
+
+    assert (approved, risk_score, recommendation) == (False, 1.0, "reject")
+
+    limits = check_hard_limits(proposal, {"total_value": 100000.0})
+    off_scale = reply.model_copy(update={"risk_score": 7.0})
+    with patch.object(rm, "_generate_structured", AsyncMock(return_value=off_scale)):
+        _, risk_score, _, _ = await rm._review("AAPL", proposal, limits)
+
+    assert risk_score == 1.0
+
+
+@pytest.mark.asyncio
+async def test_risk_manager_analyze_builds_report():
+    """Test analyze wraps the assessment in a report matching a validated one."""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, patch
+
+    from src.agents.oversight.risk_manager import RiskManager
+    from src.data.schemas import AgentReport, AgentRole
+
+    rm = RiskManager()
+    assessment = SimpleNamespace(approved=True)
+    with patch.object(rm, "assess_risk", AsyncMock(return_value=assessment)):
+        report = await rm.analyze({"symbol": "AAPL"})
+
+    validated = AgentReport(
+        agent_role=AgentRole.RISK_MANAGER, symbol="AAPL", summary=report.summary, confidence=0.9
+    )
+    assert report.agent_role == validated.agent_role
+    assert report.summary == "Risk assessment: APPROVED"
+    assert report.metadata["risk_assessment"] is assessment
+    assert report.timestamp is not None
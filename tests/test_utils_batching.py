@@ -0,0 +1,61 @@
+# tests/test_utils_batching.py
+"""
+Tests for the micro-batching executor.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils import BatchingExecutor
+
+
+@pytest.mark.asyncio
+async def test_batching_executor_coalesces_concurrent_submits():
+    """Test concurrent submissions are processed in a single batch."""
+    batches = []
+
+    def batch_fn(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+
+    executor = BatchingExecutor(batch_fn, max_batch=8, max_wait=0.05)
+
+    results = await asyncio.gather(*(executor.submit(i) for i in range(5)))
+    await executor.close()
+
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2, 3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_batching_executor_respects_max_batch():
+    """Test batches never exceed max_batch items."""
+    batches = []
+
+    def batch_fn(items):
+        batches.append(len(items))
+        return items
+
+    executor = BatchingExecutor(batch_fn, max_batch=2, max_wait=0.05)
+
+    results = await asyncio.gather(*(executor.submit(i) for i in range(5)))
+    await executor.close()
+
+    assert results == [0, 1, 2, 3, 4]
+    assert max(batches) <= 2
+
+
+@pytest.mark.asyncio
+async def test_batching_executor_propagates_errors():
+    """Test batch failures are raised to every waiting caller."""
+
+    def batch_fn(items):
+        raise RuntimeError("generate failed")
+
+    executor = BatchingExecutor(batch_fn)
+
+    with pytest.raises(RuntimeError, match="generate failed"):
+        await executor.submit("prompt")
+
+    await executor.close()
@@ -0,0 +1,42 @@
+# tests/test_utils_cache.py
+"""
+Tests for in-memory caching utilities.
+"""
+
+import time
+
+from src.utils import TTLCache, hash_key
+
+
+def test_ttl_cache_get_and_expiry():
+    """Test entries are returned until their TTL elapses."""
+    cache = TTLCache(maxsize=4, ttl=0.05)
+    cache["a"] = 1
+
+    assert cache.get("a") == 1
+    assert "a" in cache
+
+    time.sleep(0.06)
+
+    assert cache.get("a") is None
+    assert "a" not in cache
+
+
+def test_ttl_cache_lru_eviction():
+    """Test the least recently used entry is evicted at capacity."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_hash_key_is_stable_and_distinguishes_parts():
+    """Test hash keys are deterministic and part-boundary aware."""
+    assert hash_key("x", "y") == hash_key("x", "y")
+    assert hash_key("xy") != hash_key("x", "y")
+    assert len(hash_key("prompt")) == 16
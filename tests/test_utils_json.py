@@ -0,0 +1,100 @@
+# tests/test_utils_json.py
+"""
+Tests for LLM response JSON helpers.
+"""
+
+import pytest
+
+from src.utils import (
+    IncrementalJsonParser,
+    JSONDecodeError,
+    extract_json,
+    json_dumps,
+    json_loads,
+    parse_json_response,
+)
+
+
+def test_parse_json_response_fenced_block():
+    """Test JSON inside a ```json fence is extracted."""
+    response = 'Here is my analysis:\n```json\n{"a": {"b": [1, 2]}}\n```\nThanks'
+
+    assert parse_json_response(response) == {"a": {"b": [1, 2]}}
+
+
+def test_parse_json_response_plain_fence_and_bare_object():
+    """Test plain fences and bare objects surrounded by prose."""
+    assert parse_json_response('```\n{"x": 1}\n```') == {"x": 1}
+    assert parse_json_response('Result: {"x": 2} done') == {"x": 2}
+
+
+def test_extract_json_unclosed_fence():
+    """Test an unclosed fence still yields the object."""
+    assert extract_json('```json\n{"x": 3}') == '{"x": 3}'
+
+
+def test_parse_json_response_invalid():
+    """Test invalid JSON raises a JSONDecodeError catchable as ValueError."""
+    with pytest.raises(JSONDecodeError):
+        parse_json_response("no json here")
+
+    with pytest.raises(ValueError):
+        parse_json_response("{not: valid}")
+
+
+def test_json_loads_accepts_str_and_bytes():
+    """Test json_loads decodes both text and bytes."""
+    assert json_loads('{"score": 0.5}') == {"score": 0.5}
+    assert json_loads(b'["a", 1]') == ["a", 1]
+
+    with pytest.raises(JSONDecodeError):
+        json_loads("")
+
+
+def test_json_dumps_compact_and_indented():
+    """Test json_dumps round-trips and pretty-prints with two spaces."""
+    import numpy as np
+
+    data = {"rsi": np.float64(55.5), "levels": [1, 2]}
+
+    assert json_loads(json_dumps(data)) == {"rsi": 55.5, "levels": [1, 2]}
+    assert json_dumps({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps_numpy_and_int_keys(monkeypatch, use_orjson):
+    """Test both encoders accept NumPy values and non-str keys like json.dumps."""
+    import numpy as np
+
+    from src.utils import json_utils
+
+    if not use_orjson:
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+    data = {20: np.float64(101.5), "levels": np.array([1.0, 2.0]), "n": np.int64(3)}
+
+    assert json_loads(json_dumps(data)) == {"20": 101.5, "levels": [1.0, 2.0], "n": 3}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_incremental_json_parser_chunked(chunk_size):
+    """Test streamed members decode identically for any chunk boundaries."""
+    text = 'Sure:\n```json\n{"a": "x,}\\"y\\\\", "b": [1, {"c": 2}], "s": -0.5}\n```'
+    parser = IncrementalJsonParser()
+
+    for i in range(0, len(text), chunk_size):
+        parser.feed(text[i : i + chunk_size])
+
+    assert parser.result() == {"a": 'x,}"y\\', "b": [1, {"c": 2}], "s": -0.5}
+
+
+def test_incremental_json_parser_fields_before_close():
+    """Test members are available before the object closes."""
+    parser = IncrementalJsonParser()
+    parser.feed('{"sentiment": "bullish", "score": 0.')
+
+    assert parser.fields == {"sentiment": "bullish"}
+    assert parser.result() is None
+
+    parser.feed("4}")
+    assert parser.result() == {"sentiment": "bullish", "score": 0.4}
@@ -69,3 +69,20 @@ def test_multiple_loggers():
     # They should work independently
     log1.info("Message from logger1")
     log2.info("Message from logger2")
+
+
+def test_setup_logging_drops_calls_below_level(monkeypatch):
+    """Test calls below the configured level are dropped before processing."""
+    import structlog
+
+    from src.utils import logger as logger_module
+
+    monkeypatch.setattr(logger_module.settings, "log_level", "WARNING")
+    try:
+        logger_module.setup_logging()
+        log = structlog.get_logger("test_level_logger").bind()
+
+        assert log.info("Dropped message") is None
+        assert not log.is_enabled_for(20)  # logging.INFO
+    finally:
+        structlog.reset_defaults()